@@ -6,6 +6,10 @@
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
+#
+# NOTE: The generated code was split by hand, so the contents of every tab are
+# built by its own setup<Tab>Tab() method the first time the tab is activated.
+# Keep this layout when regenerating the file.
 
 
 from PyQt5 import QtCore, QtGui, QtWidgets
@@ -33,6 +37,201 @@ class Ui_MainWindow(object):
         self.tabWidget.setObjectName("tabWidget")
         self.tab = QtWidgets.QWidget()
         self.tab.setObjectName("tab")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/tab/img/training.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.tabWidget.addTab(self.tab, icon, "")
+        self.tab_3 = QtWidgets.QWidget()
+        self.tab_3.setObjectName("tab_3")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap(":/tab/img/manage.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.tabWidget.addTab(self.tab_3, icon3, "")
+        self.tab_4 = QtWidgets.QWidget()
+        self.tab_4.setObjectName("tab_4")
+        icon6 = QtGui.QIcon()
+        icon6.addPixmap(QtGui.QPixmap(":/tab/img/player.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.tabWidget.addTab(self.tab_4, icon6, "")
+        self.tab_5 = QtWidgets.QWidget()
+        self.tab_5.setObjectName("tab_5")
+        icon8 = QtGui.QIcon()
+        icon8.addPixmap(QtGui.QPixmap(":/tab/img/assistant.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.tabWidget.addTab(self.tab_5, icon8, "")
+        self.tab_2 = QtWidgets.QWidget()
+        self.tab_2.setObjectName("tab_2")
+        icon12 = QtGui.QIcon()
+        icon12.addPixmap(QtGui.QPixmap(":/tab/img/settings.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.tabWidget.addTab(self.tab_2, icon12, "")
+        self.verticalLayout.addWidget(self.tabWidget)
+        self.line_6 = QtWidgets.QFrame(self.centralwidget)
+        self.line_6.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_6.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_6.setObjectName("line_6")
+        self.verticalLayout.addWidget(self.line_6)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setSizeConstraint(QtWidgets.QLayout.SetMaximumSize)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.currentAudioLabel = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.currentAudioLabel.sizePolicy().hasHeightForWidth())
+        self.currentAudioLabel.setSizePolicy(sizePolicy)
+        self.currentAudioLabel.setObjectName("currentAudioLabel")
+        self.horizontalLayout_4.addWidget(self.currentAudioLabel)
+        self.line_2 = QtWidgets.QFrame(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.line_2.sizePolicy().hasHeightForWidth())
+        self.line_2.setSizePolicy(sizePolicy)
+        self.line_2.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.horizontalLayout_4.addWidget(self.line_2)
+        self.audioPositionLabel = QtWidgets.QLabel(self.centralwidget)
+        self.audioPositionLabel.setObjectName("audioPositionLabel")
+        self.horizontalLayout_4.addWidget(self.audioPositionLabel)
+        self.audioDurationProgressBar = QtWidgets.QProgressBar(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.audioDurationProgressBar.sizePolicy().hasHeightForWidth())
+        self.audioDurationProgressBar.setSizePolicy(sizePolicy)
+        self.audioDurationProgressBar.setProperty("value", 0)
+        self.audioDurationProgressBar.setTextVisible(False)
+        self.audioDurationProgressBar.setFormat("")
+        self.audioDurationProgressBar.setObjectName("audioDurationProgressBar")
+        self.horizontalLayout_4.addWidget(self.audioDurationProgressBar)
+        self.audioDurationLabel = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.audioDurationLabel.sizePolicy().hasHeightForWidth())
+        self.audioDurationLabel.setSizePolicy(sizePolicy)
+        self.audioDurationLabel.setObjectName("audioDurationLabel")
+        self.horizontalLayout_4.addWidget(self.audioDurationLabel)
+        self.line_5 = QtWidgets.QFrame(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.line_5.sizePolicy().hasHeightForWidth())
+        self.line_5.setSizePolicy(sizePolicy)
+        self.line_5.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_5.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_5.setObjectName("line_5")
+        self.horizontalLayout_4.addWidget(self.line_5)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.volumeImage = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.volumeImage.sizePolicy().hasHeightForWidth())
+        self.volumeImage.setSizePolicy(sizePolicy)
+        self.volumeImage.setText("")
+        self.volumeImage.setPixmap(QtGui.QPixmap(":/ui/img/speaker-medium.png"))
+        self.volumeImage.setObjectName("volumeImage")
+        self.horizontalLayout_2.addWidget(self.volumeImage)
+        self.volumeSlider = QtWidgets.QSlider(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.volumeSlider.sizePolicy().hasHeightForWidth())
+        self.volumeSlider.setSizePolicy(sizePolicy)
+        self.volumeSlider.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.volumeSlider.setMinimum(1)
+        self.volumeSlider.setMaximum(100)
+        self.volumeSlider.setProperty("value", 75)
+        self.volumeSlider.setTracking(True)
+        self.volumeSlider.setOrientation(QtCore.Qt.Horizontal)
+        self.volumeSlider.setInvertedAppearance(False)
+        self.volumeSlider.setInvertedControls(False)
+        self.volumeSlider.setTickPosition(QtWidgets.QSlider.TicksBothSides)
+        self.volumeSlider.setTickInterval(25)
+        self.volumeSlider.setObjectName("volumeSlider")
+        self.horizontalLayout_2.addWidget(self.volumeSlider)
+        self.previousAudioButton = QtWidgets.QPushButton(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.previousAudioButton.sizePolicy().hasHeightForWidth())
+        self.previousAudioButton.setSizePolicy(sizePolicy)
+        self.previousAudioButton.setText("")
+        icon13 = QtGui.QIcon()
+        icon13.addPixmap(QtGui.QPixmap(":/ui/img/prev.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.previousAudioButton.setIcon(icon13)
+        self.previousAudioButton.setIconSize(QtCore.QSize(19, 19))
+        self.previousAudioButton.setObjectName("previousAudioButton")
+        self.horizontalLayout_2.addWidget(self.previousAudioButton)
+        self.playPauseAudioButton = QtWidgets.QPushButton(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.playPauseAudioButton.sizePolicy().hasHeightForWidth())
+        self.playPauseAudioButton.setSizePolicy(sizePolicy)
+        self.playPauseAudioButton.setText("")
+        icon14 = QtGui.QIcon()
+        icon14.addPixmap(QtGui.QPixmap(":/ui/img/play.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.playPauseAudioButton.setIcon(icon14)
+        self.playPauseAudioButton.setIconSize(QtCore.QSize(19, 19))
+        self.playPauseAudioButton.setObjectName("playPauseAudioButton")
+        self.horizontalLayout_2.addWidget(self.playPauseAudioButton)
+        self.nextAudioButton = QtWidgets.QPushButton(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.nextAudioButton.sizePolicy().hasHeightForWidth())
+        self.nextAudioButton.setSizePolicy(sizePolicy)
+        self.nextAudioButton.setText("")
+        icon15 = QtGui.QIcon()
+        icon15.addPixmap(QtGui.QPixmap(":/ui/img/next.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.nextAudioButton.setIcon(icon15)
+        self.nextAudioButton.setIconSize(QtCore.QSize(19, 19))
+        self.nextAudioButton.setObjectName("nextAudioButton")
+        self.horizontalLayout_2.addWidget(self.nextAudioButton)
+        self.shuffleAudioButton = QtWidgets.QPushButton(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.shuffleAudioButton.sizePolicy().hasHeightForWidth())
+        self.shuffleAudioButton.setSizePolicy(sizePolicy)
+        self.shuffleAudioButton.setText("")
+        icon16 = QtGui.QIcon()
+        icon16.addPixmap(QtGui.QPixmap(":/ui/img/shuffle.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.shuffleAudioButton.setIcon(icon16)
+        self.shuffleAudioButton.setIconSize(QtCore.QSize(19, 19))
+        self.shuffleAudioButton.setCheckable(True)
+        self.shuffleAudioButton.setObjectName("shuffleAudioButton")
+        self.horizontalLayout_2.addWidget(self.shuffleAudioButton)
+        self.horizontalLayout_4.addLayout(self.horizontalLayout_2)
+        self.verticalLayout.addLayout(self.horizontalLayout_4)
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        # Tab contents are built the first time the tab is activated, see setupTab()
+        self.tab_builders = {
+            self.tab: self.setupTrainingTab,
+            self.tab_3: self.setupManageTab,
+            self.tab_4: self.setupPlayerTab,
+            self.tab_5: self.setupAssistantTab,
+            self.tab_2: self.setupSettingsTab,
+        }
+
+        self.retranslateUi(MainWindow)
+        self.tabWidget.setCurrentIndex(0)
+        self.setupTab(self.tabWidget.currentWidget())
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def setupTab(self, tab):
+        builder = self.tab_builders.pop(tab, None)
+        if builder is None:
+            return False
+
+        builder()
+        return True
+
+    def isTabBuilt(self, tab):
+        return tab not in self.tab_builders
+
+    def setupTrainingTab(self):
         self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.tab)
         self.verticalLayout_7.setObjectName("verticalLayout_7")
         self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
@@ -81,43 +280,31 @@ class Ui_MainWindow(object):
         self.dateLabel.setObjectName("dateLabel")
         self.horizontalLayout_8.addWidget(self.dateLabel)
         self.verticalLayout_7.addLayout(self.horizontalLayout_8)
-        self.exercisesTableWidget = QtWidgets.QTableWidget(self.tab)
-        self.exercisesTableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.exercisesTableWidget.setShowGrid(True)
-        self.exercisesTableWidget.setGridStyle(QtCore.Qt.SolidLine)
-        self.exercisesTableWidget.setRowCount(0)
-        self.exercisesTableWidget.setObjectName("exercisesTableWidget")
-        self.exercisesTableWidget.setColumnCount(5)
-        item = QtWidgets.QTableWidgetItem()
-        self.exercisesTableWidget.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.exercisesTableWidget.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.exercisesTableWidget.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.exercisesTableWidget.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.exercisesTableWidget.setHorizontalHeaderItem(4, item)
-        self.exercisesTableWidget.horizontalHeader().setCascadingSectionResizes(False)
-        self.exercisesTableWidget.horizontalHeader().setDefaultSectionSize(98)
-        self.exercisesTableWidget.horizontalHeader().setHighlightSections(False)
-        self.exercisesTableWidget.horizontalHeader().setSortIndicatorShown(True)
-        self.exercisesTableWidget.horizontalHeader().setStretchLastSection(True)
-        self.exercisesTableWidget.verticalHeader().setVisible(False)
-        self.exercisesTableWidget.verticalHeader().setHighlightSections(False)
-        self.verticalLayout_7.addWidget(self.exercisesTableWidget)
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap(":/tab/img/training.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.tabWidget.addTab(self.tab, icon, "")
-        self.tab_3 = QtWidgets.QWidget()
-        self.tab_3.setObjectName("tab_3")
+        self.exercisesTableView = QtWidgets.QTableView(self.tab)
+        self.exercisesTableView.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.exercisesTableView.setShowGrid(True)
+        self.exercisesTableView.setGridStyle(QtCore.Qt.SolidLine)
+        self.exercisesTableView.setObjectName("exercisesTableView")
+        self.exercisesTableView.horizontalHeader().setCascadingSectionResizes(False)
+        self.exercisesTableView.horizontalHeader().setDefaultSectionSize(98)
+        self.exercisesTableView.horizontalHeader().setHighlightSections(False)
+        self.exercisesTableView.horizontalHeader().setSortIndicatorShown(True)
+        self.exercisesTableView.horizontalHeader().setStretchLastSection(True)
+        self.exercisesTableView.verticalHeader().setVisible(False)
+        self.exercisesTableView.verticalHeader().setHighlightSections(False)
+        self.verticalLayout_7.addWidget(self.exercisesTableView)
+        self.retranslateTrainingTab()
+
+    def setupManageTab(self):
         self.horizontalLayout = QtWidgets.QHBoxLayout(self.tab_3)
         self.horizontalLayout.setObjectName("horizontalLayout")
         self.verticalLayout_3 = QtWidgets.QVBoxLayout()
         self.verticalLayout_3.setObjectName("verticalLayout_3")
-        self.exercisesListWidget = QtWidgets.QListWidget(self.tab_3)
-        self.exercisesListWidget.setObjectName("exercisesListWidget")
-        self.verticalLayout_3.addWidget(self.exercisesListWidget)
+        self.exercisesListView = QtWidgets.QListView(self.tab_3)
+        self.exercisesListView.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.exercisesListView.setUniformItemSizes(True)
+        self.exercisesListView.setObjectName("exercisesListView")
+        self.verticalLayout_3.addWidget(self.exercisesListView)
         self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_3.setObjectName("horizontalLayout_3")
         spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
@@ -157,7 +344,6 @@ class Ui_MainWindow(object):
         sizePolicy.setHeightForWidth(self.selectExistingExerciseComboBox.sizePolicy().hasHeightForWidth())
         self.selectExistingExerciseComboBox.setSizePolicy(sizePolicy)
         self.selectExistingExerciseComboBox.setObjectName("selectExistingExerciseComboBox")
-        self.selectExistingExerciseComboBox.addItem("")
         self.verticalLayout_5.addWidget(self.selectExistingExerciseComboBox)
         self.label_2 = QtWidgets.QLabel(self.tab_3)
         self.label_2.setObjectName("label_2")
@@ -234,11 +420,9 @@ class Ui_MainWindow(object):
         self.horizontalLayout.addLayout(self.verticalLayout_5)
         self.horizontalLayout.setStretch(0, 2)
         self.horizontalLayout.setStretch(1, 3)
-        icon3 = QtGui.QIcon()
-        icon3.addPixmap(QtGui.QPixmap(":/tab/img/manage.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.tabWidget.addTab(self.tab_3, icon3, "")
-        self.tab_4 = QtWidgets.QWidget()
-        self.tab_4.setObjectName("tab_4")
+        self.retranslateManageTab()
+
+    def setupPlayerTab(self):
         self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.tab_4)
         self.verticalLayout_2.setObjectName("verticalLayout_2")
         self.groupBox = QtWidgets.QGroupBox(self.tab_4)
@@ -269,6 +453,19 @@ class Ui_MainWindow(object):
         self.setMusicPlaylistFolderButton.setIconSize(QtCore.QSize(19, 19))
         self.setMusicPlaylistFolderButton.setObjectName("setMusicPlaylistFolderButton")
         self.horizontalLayout_7.addWidget(self.setMusicPlaylistFolderButton)
+        self.addMusicPlaylistFolderButton = QtWidgets.QPushButton(self.groupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.addMusicPlaylistFolderButton.sizePolicy().hasHeightForWidth())
+        self.addMusicPlaylistFolderButton.setSizePolicy(sizePolicy)
+        self.addMusicPlaylistFolderButton.setText("")
+        icon17 = QtGui.QIcon()
+        icon17.addPixmap(QtGui.QPixmap(":/ui/img/add.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.addMusicPlaylistFolderButton.setIcon(icon17)
+        self.addMusicPlaylistFolderButton.setIconSize(QtCore.QSize(19, 19))
+        self.addMusicPlaylistFolderButton.setObjectName("addMusicPlaylistFolderButton")
+        self.horizontalLayout_7.addWidget(self.addMusicPlaylistFolderButton)
         self.reloadPlaylistButton = QtWidgets.QPushButton(self.groupBox)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
         sizePolicy.setHorizontalStretch(0)
@@ -283,30 +480,56 @@ class Ui_MainWindow(object):
         self.horizontalLayout_7.addWidget(self.reloadPlaylistButton)
         self.verticalLayout_8.addLayout(self.horizontalLayout_7)
         self.verticalLayout_2.addWidget(self.groupBox)
-        self.musicPlaylistListWidget = QtWidgets.QListWidget(self.tab_4)
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.searchPlaylistEdit = QtWidgets.QLineEdit(self.tab_4)
+        self.searchPlaylistEdit.setClearButtonEnabled(True)
+        self.searchPlaylistEdit.setObjectName("searchPlaylistEdit")
+        self.horizontalLayout_11.addWidget(self.searchPlaylistEdit)
+        self.sortPlaylistComboBox = QtWidgets.QComboBox(self.tab_4)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.sortPlaylistComboBox.sizePolicy().hasHeightForWidth())
+        self.sortPlaylistComboBox.setSizePolicy(sizePolicy)
+        self.sortPlaylistComboBox.setObjectName("sortPlaylistComboBox")
+        self.sortPlaylistComboBox.addItem("")
+        self.sortPlaylistComboBox.addItem("")
+        self.sortPlaylistComboBox.addItem("")
+        self.sortPlaylistComboBox.addItem("")
+        self.sortPlaylistComboBox.addItem("")
+        self.sortPlaylistComboBox.addItem("")
+        self.sortPlaylistComboBox.addItem("")
+        self.horizontalLayout_11.addWidget(self.sortPlaylistComboBox)
+        self.matchTempoSpinBox = QtWidgets.QSpinBox(self.tab_4)
+        self.matchTempoSpinBox.setMinimum(55)
+        self.matchTempoSpinBox.setMaximum(200)
+        self.matchTempoSpinBox.setSingleStep(5)
+        self.matchTempoSpinBox.setObjectName("matchTempoSpinBox")
+        self.horizontalLayout_11.addWidget(self.matchTempoSpinBox)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_11)
+        self.musicPlaylistView = QtWidgets.QListView(self.tab_4)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.musicPlaylistListWidget.sizePolicy().hasHeightForWidth())
-        self.musicPlaylistListWidget.setSizePolicy(sizePolicy)
-        self.musicPlaylistListWidget.setEditTriggers(QtWidgets.QAbstractItemView.DoubleClicked)
-        self.musicPlaylistListWidget.setProperty("showDropIndicator", False)
-        self.musicPlaylistListWidget.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
-        self.musicPlaylistListWidget.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerItem)
-        self.musicPlaylistListWidget.setMovement(QtWidgets.QListView.Static)
-        self.musicPlaylistListWidget.setResizeMode(QtWidgets.QListView.Adjust)
-        self.musicPlaylistListWidget.setLayoutMode(QtWidgets.QListView.Batched)
-        self.musicPlaylistListWidget.setViewMode(QtWidgets.QListView.ListMode)
-        self.musicPlaylistListWidget.setModelColumn(0)
-        self.musicPlaylistListWidget.setUniformItemSizes(True)
-        self.musicPlaylistListWidget.setBatchSize(100)
-        self.musicPlaylistListWidget.setObjectName("musicPlaylistListWidget")
-        self.verticalLayout_2.addWidget(self.musicPlaylistListWidget)
-        icon6 = QtGui.QIcon()
-        icon6.addPixmap(QtGui.QPixmap(":/tab/img/player.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.tabWidget.addTab(self.tab_4, icon6, "")
-        self.tab_5 = QtWidgets.QWidget()
-        self.tab_5.setObjectName("tab_5")
+        sizePolicy.setHeightForWidth(self.musicPlaylistView.sizePolicy().hasHeightForWidth())
+        self.musicPlaylistView.setSizePolicy(sizePolicy)
+        self.musicPlaylistView.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.musicPlaylistView.setProperty("showDropIndicator", False)
+        self.musicPlaylistView.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.musicPlaylistView.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerItem)
+        self.musicPlaylistView.setMovement(QtWidgets.QListView.Static)
+        self.musicPlaylistView.setResizeMode(QtWidgets.QListView.Adjust)
+        self.musicPlaylistView.setLayoutMode(QtWidgets.QListView.Batched)
+        self.musicPlaylistView.setViewMode(QtWidgets.QListView.ListMode)
+        self.musicPlaylistView.setModelColumn(0)
+        self.musicPlaylistView.setUniformItemSizes(True)
+        self.musicPlaylistView.setBatchSize(100)
+        self.musicPlaylistView.setObjectName("musicPlaylistView")
+        self.verticalLayout_2.addWidget(self.musicPlaylistView)
+        self.retranslatePlayerTab()
+
+    def setupAssistantTab(self):
         self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.tab_5)
         self.verticalLayout_4.setObjectName("verticalLayout_4")
         self.assistantAnswerArea = QtWidgets.QTextBrowser(self.tab_5)
@@ -338,11 +561,9 @@ class Ui_MainWindow(object):
         self.askAssistantButton.setObjectName("askAssistantButton")
         self.horizontalLayout_5.addWidget(self.askAssistantButton)
         self.verticalLayout_4.addLayout(self.horizontalLayout_5)
-        icon8 = QtGui.QIcon()
-        icon8.addPixmap(QtGui.QPixmap(":/tab/img/assistant.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.tabWidget.addTab(self.tab_5, icon8, "")
-        self.tab_2 = QtWidgets.QWidget()
-        self.tab_2.setObjectName("tab_2")
+        self.retranslateAssistantTab()
+
+    def setupSettingsTab(self):
         self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.tab_2)
         self.verticalLayout_10.setObjectName("verticalLayout_10")
         self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
@@ -399,161 +620,30 @@ class Ui_MainWindow(object):
         self.verticalLayout_10.addWidget(self.label_4)
         spacerItem2 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self.verticalLayout_10.addItem(spacerItem2)
-        icon12 = QtGui.QIcon()
-        icon12.addPixmap(QtGui.QPixmap(":/tab/img/settings.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.tabWidget.addTab(self.tab_2, icon12, "")
-        self.verticalLayout.addWidget(self.tabWidget)
-        self.line_6 = QtWidgets.QFrame(self.centralwidget)
-        self.line_6.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line_6.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_6.setObjectName("line_6")
-        self.verticalLayout.addWidget(self.line_6)
-        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_4.setSizeConstraint(QtWidgets.QLayout.SetMaximumSize)
-        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
-        self.currentAudioLabel = QtWidgets.QLabel(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.currentAudioLabel.sizePolicy().hasHeightForWidth())
-        self.currentAudioLabel.setSizePolicy(sizePolicy)
-        self.currentAudioLabel.setObjectName("currentAudioLabel")
-        self.horizontalLayout_4.addWidget(self.currentAudioLabel)
-        self.line_2 = QtWidgets.QFrame(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.line_2.sizePolicy().hasHeightForWidth())
-        self.line_2.setSizePolicy(sizePolicy)
-        self.line_2.setFrameShape(QtWidgets.QFrame.VLine)
-        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_2.setObjectName("line_2")
-        self.horizontalLayout_4.addWidget(self.line_2)
-        self.audioPositionLabel = QtWidgets.QLabel(self.centralwidget)
-        self.audioPositionLabel.setObjectName("audioPositionLabel")
-        self.horizontalLayout_4.addWidget(self.audioPositionLabel)
-        self.audioDurationProgressBar = QtWidgets.QProgressBar(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.audioDurationProgressBar.sizePolicy().hasHeightForWidth())
-        self.audioDurationProgressBar.setSizePolicy(sizePolicy)
-        self.audioDurationProgressBar.setProperty("value", 0)
-        self.audioDurationProgressBar.setTextVisible(False)
-        self.audioDurationProgressBar.setFormat("")
-        self.audioDurationProgressBar.setObjectName("audioDurationProgressBar")
-        self.horizontalLayout_4.addWidget(self.audioDurationProgressBar)
-        self.audioDurationLabel = QtWidgets.QLabel(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.audioDurationLabel.sizePolicy().hasHeightForWidth())
-        self.audioDurationLabel.setSizePolicy(sizePolicy)
-        self.audioDurationLabel.setObjectName("audioDurationLabel")
-        self.horizontalLayout_4.addWidget(self.audioDurationLabel)
-        self.line_5 = QtWidgets.QFrame(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.line_5.sizePolicy().hasHeightForWidth())
-        self.line_5.setSizePolicy(sizePolicy)
-        self.line_5.setFrameShape(QtWidgets.QFrame.VLine)
-        self.line_5.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_5.setObjectName("line_5")
-        self.horizontalLayout_4.addWidget(self.line_5)
-        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
-        self.volumeImage = QtWidgets.QLabel(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.volumeImage.sizePolicy().hasHeightForWidth())
-        self.volumeImage.setSizePolicy(sizePolicy)
-        self.volumeImage.setText("")
-        self.volumeImage.setPixmap(QtGui.QPixmap(":/ui/img/speaker-medium.png"))
-        self.volumeImage.setObjectName("volumeImage")
-        self.horizontalLayout_2.addWidget(self.volumeImage)
-        self.volumeSlider = QtWidgets.QSlider(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.volumeSlider.sizePolicy().hasHeightForWidth())
-        self.volumeSlider.setSizePolicy(sizePolicy)
-        self.volumeSlider.setFocusPolicy(QtCore.Qt.NoFocus)
-        self.volumeSlider.setMinimum(1)
-        self.volumeSlider.setMaximum(100)
-        self.volumeSlider.setProperty("value", 75)
-        self.volumeSlider.setTracking(True)
-        self.volumeSlider.setOrientation(QtCore.Qt.Horizontal)
-        self.volumeSlider.setInvertedAppearance(False)
-        self.volumeSlider.setInvertedControls(False)
-        self.volumeSlider.setTickPosition(QtWidgets.QSlider.TicksBothSides)
-        self.volumeSlider.setTickInterval(25)
-        self.volumeSlider.setObjectName("volumeSlider")
-        self.horizontalLayout_2.addWidget(self.volumeSlider)
-        self.previousAudioButton = QtWidgets.QPushButton(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.previousAudioButton.sizePolicy().hasHeightForWidth())
-        self.previousAudioButton.setSizePolicy(sizePolicy)
-        self.previousAudioButton.setText("")
-        icon13 = QtGui.QIcon()
-        icon13.addPixmap(QtGui.QPixmap(":/ui/img/prev.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.previousAudioButton.setIcon(icon13)
-        self.previousAudioButton.setIconSize(QtCore.QSize(19, 19))
-        self.previousAudioButton.setObjectName("previousAudioButton")
-        self.horizontalLayout_2.addWidget(self.previousAudioButton)
-        self.playPauseAudioButton = QtWidgets.QPushButton(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.playPauseAudioButton.sizePolicy().hasHeightForWidth())
-        self.playPauseAudioButton.setSizePolicy(sizePolicy)
-        self.playPauseAudioButton.setText("")
-        icon14 = QtGui.QIcon()
-        icon14.addPixmap(QtGui.QPixmap(":/ui/img/play.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.playPauseAudioButton.setIcon(icon14)
-        self.playPauseAudioButton.setIconSize(QtCore.QSize(19, 19))
-        self.playPauseAudioButton.setObjectName("playPauseAudioButton")
-        self.horizontalLayout_2.addWidget(self.playPauseAudioButton)
-        self.nextAudioButton = QtWidgets.QPushButton(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.nextAudioButton.sizePolicy().hasHeightForWidth())
-        self.nextAudioButton.setSizePolicy(sizePolicy)
-        self.nextAudioButton.setText("")
-        icon15 = QtGui.QIcon()
-        icon15.addPixmap(QtGui.QPixmap(":/ui/img/next.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.nextAudioButton.setIcon(icon15)
-        self.nextAudioButton.setIconSize(QtCore.QSize(19, 19))
-        self.nextAudioButton.setObjectName("nextAudioButton")
-        self.horizontalLayout_2.addWidget(self.nextAudioButton)
-        self.shuffleAudioButton = QtWidgets.QPushButton(self.centralwidget)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.shuffleAudioButton.sizePolicy().hasHeightForWidth())
-        self.shuffleAudioButton.setSizePolicy(sizePolicy)
-        self.shuffleAudioButton.setText("")
-        icon16 = QtGui.QIcon()
-        icon16.addPixmap(QtGui.QPixmap(":/ui/img/shuffle.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.shuffleAudioButton.setIcon(icon16)
-        self.shuffleAudioButton.setIconSize(QtCore.QSize(19, 19))
-        self.shuffleAudioButton.setObjectName("shuffleAudioButton")
-        self.horizontalLayout_2.addWidget(self.shuffleAudioButton)
-        self.horizontalLayout_4.addLayout(self.horizontalLayout_2)
-        self.verticalLayout.addLayout(self.horizontalLayout_4)
-        MainWindow.setCentralWidget(self.centralwidget)
-
-        self.retranslateUi(MainWindow)
-        self.tabWidget.setCurrentIndex(0)
-        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+        self.retranslateSettingsTab()
 
     def retranslateUi(self, MainWindow):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "OpenFit"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), _translate("MainWindow", "Training"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), _translate("MainWindow", "Manage"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_4), _translate("MainWindow", "Player"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_5), _translate("MainWindow", "Assistant"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), _translate("MainWindow", "Settings"))
+        self.currentAudioLabel.setText(_translate("MainWindow", "No tracks"))
+        self.audioPositionLabel.setText(_translate("MainWindow", "00:00"))
+        self.audioDurationLabel.setText(_translate("MainWindow", "00:00"))
+        self.previousAudioButton.setToolTip(_translate("MainWindow", "Previous audio"))
+        self.previousAudioButton.setShortcut(_translate("MainWindow", "Ctrl+L"))
+        self.playPauseAudioButton.setToolTip(_translate("MainWindow", "Play/Pause"))
+        self.playPauseAudioButton.setShortcut(_translate("MainWindow", "Ctrl+P"))
+        self.nextAudioButton.setToolTip(_translate("MainWindow", "Next audio"))
+        self.nextAudioButton.setShortcut(_translate("MainWindow", "Ctrl+N"))
+        self.shuffleAudioButton.setToolTip(_translate("MainWindow", "Shuffle playlist"))
+        self.shuffleAudioButton.setShortcut(_translate("MainWindow", "Ctrl+Alt+S"))
+
+    def retranslateTrainingTab(self):
+        _translate = QtCore.QCoreApplication.translate
         self.showAllExercisesCheckBox.setToolTip(_translate("MainWindow", "Show all exercises"))
         self.showAllExercisesCheckBox.setText(_translate("MainWindow", "Show all"))
         self.searchExercisesEdit.setToolTip(_translate("MainWindow", "Search query edit"))
@@ -562,24 +652,15 @@ class Ui_MainWindow(object):
         self.searchCategoryComboBox.setItemText(0, _translate("MainWindow", "Search by"))
         self.dateLabel.setToolTip(_translate("MainWindow", "Current date"))
         self.dateLabel.setText(_translate("MainWindow", "Today"))
-        self.exercisesTableWidget.setSortingEnabled(True)
-        item = self.exercisesTableWidget.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "Name"))
-        item = self.exercisesTableWidget.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Type"))
-        item = self.exercisesTableWidget.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Reps"))
-        item = self.exercisesTableWidget.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Sets"))
-        item = self.exercisesTableWidget.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Days"))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), _translate("MainWindow", "Training"))
+        self.exercisesTableView.setSortingEnabled(True)
+
+    def retranslateManageTab(self):
+        _translate = QtCore.QCoreApplication.translate
         self.deleteExerciseButton.setToolTip(_translate("MainWindow", "Delete existing exercise"))
         self.deleteExerciseButton.setShortcut(_translate("MainWindow", "Del"))
         self.addEditExerciseButton.setToolTip(_translate("MainWindow", "Add/Edit exercise"))
         self.addEditExerciseButton.setShortcut(_translate("MainWindow", "Ctrl+A"))
         self.selectExistingExerciseComboBox.setToolTip(_translate("MainWindow", "Select existing exercise"))
-        self.selectExistingExerciseComboBox.setItemText(0, _translate("MainWindow", "Select existing exercise to edit"))
         self.label_2.setText(_translate("MainWindow", "Exercise name"))
         self.exerciseNameEdit.setToolTip(_translate("MainWindow", "Edit exercise name"))
         self.exerciseNameEdit.setPlaceholderText(_translate("MainWindow", "Pull ups..."))
@@ -593,14 +674,31 @@ class Ui_MainWindow(object):
         self.label_5.setText(_translate("MainWindow", "Days (separated by comma)"))
         self.exerciseDaysEdit.setToolTip(_translate("MainWindow", "Edit days"))
         self.exerciseDaysEdit.setPlaceholderText(_translate("MainWindow", "monday, tuesday, thursday..."))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), _translate("MainWindow", "Manage"))
-        self.groupBox.setTitle(_translate("MainWindow", "Playlist folder"))
-        self.musicPlaylistFolderEdit.setToolTip(_translate("MainWindow", "Playlist folder path"))
+
+    def retranslatePlayerTab(self):
+        _translate = QtCore.QCoreApplication.translate
+        self.groupBox.setTitle(_translate("MainWindow", "Playlist folders"))
+        self.musicPlaylistFolderEdit.setToolTip(_translate("MainWindow", "Playlist folder paths"))
         self.setMusicPlaylistFolderButton.setToolTip(_translate("MainWindow", "Open playlist folder"))
         self.setMusicPlaylistFolderButton.setShortcut(_translate("MainWindow", "Ctrl+O"))
+        self.addMusicPlaylistFolderButton.setToolTip(_translate("MainWindow", "Add playlist folder"))
         self.reloadPlaylistButton.setToolTip(_translate("MainWindow", "Reload playlist"))
-        self.musicPlaylistListWidget.setSortingEnabled(False)
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_4), _translate("MainWindow", "Player"))
+        self.searchPlaylistEdit.setToolTip(_translate("MainWindow", "Search tracks edit"))
+        self.searchPlaylistEdit.setPlaceholderText(_translate("MainWindow", "Search tracks by title, artist, album or file name..."))
+        self.sortPlaylistComboBox.setToolTip(_translate("MainWindow", "Sort playlist"))
+        self.sortPlaylistComboBox.setItemText(0, _translate("MainWindow", "Sort by folder"))
+        self.sortPlaylistComboBox.setItemText(1, _translate("MainWindow", "Sort by artist"))
+        self.sortPlaylistComboBox.setItemText(2, _translate("MainWindow", "Sort by album"))
+        self.sortPlaylistComboBox.setItemText(3, _translate("MainWindow", "Sort by title"))
+        self.sortPlaylistComboBox.setItemText(4, _translate("MainWindow", "Sort by duration"))
+        self.sortPlaylistComboBox.setItemText(5, _translate("MainWindow", "Sort by date added"))
+        self.sortPlaylistComboBox.setItemText(6, _translate("MainWindow", "Sort by workout plays"))
+        self.matchTempoSpinBox.setToolTip(_translate("MainWindow", "Show only tracks matching the workout tempo"))
+        self.matchTempoSpinBox.setSpecialValueText(_translate("MainWindow", "Any tempo"))
+        self.matchTempoSpinBox.setSuffix(_translate("MainWindow", " BPM"))
+
+    def retranslateAssistantTab(self):
+        _translate = QtCore.QCoreApplication.translate
         self.assistantAnswerArea.setHtml(_translate("MainWindow", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
 "<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
 "p, li { white-space: pre-wrap; }\n"
@@ -608,7 +706,9 @@ class Ui_MainWindow(object):
 "<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p></body></html>"))
         self.userQuestionEdit.setPlaceholderText(_translate("MainWindow", "Ask me a question..."))
         self.askAssistantButton.setText(_translate("MainWindow", "Ask  "))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_5), _translate("MainWindow", "Assistant"))
+
+    def retranslateSettingsTab(self):
+        _translate = QtCore.QCoreApplication.translate
         self.groupBox_2.setTitle(_translate("MainWindow", "Assistant settings"))
         self.saveConversationWithAssistantCheckBox.setText(_translate("MainWindow", "Save coversation with assistant"))
         self.label.setText(_translate("MainWindow", "Assistant model"))
@@ -617,16 +717,4 @@ class Ui_MainWindow(object):
         self.importFromBackupButton.setText(_translate("MainWindow", "Import"))
         self.exportToBackupButton.setText(_translate("MainWindow", "Export"))
         self.label_4.setText(_translate("MainWindow", "Settings are now under development!"))
-        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), _translate("MainWindow", "Settings"))
-        self.currentAudioLabel.setText(_translate("MainWindow", "No tracks"))
-        self.audioPositionLabel.setText(_translate("MainWindow", "00:00"))
-        self.audioDurationLabel.setText(_translate("MainWindow", "00:00"))
-        self.previousAudioButton.setToolTip(_translate("MainWindow", "Previous audio"))
-        self.previousAudioButton.setShortcut(_translate("MainWindow", "Ctrl+L"))
-        self.playPauseAudioButton.setToolTip(_translate("MainWindow", "Play/Pause"))
-        self.playPauseAudioButton.setShortcut(_translate("MainWindow", "Ctrl+P"))
-        self.nextAudioButton.setToolTip(_translate("MainWindow", "Next audio"))
-        self.nextAudioButton.setShortcut(_translate("MainWindow", "Ctrl+N"))
-        self.shuffleAudioButton.setToolTip(_translate("MainWindow", "Shuffle playlist"))
-        self.shuffleAudioButton.setShortcut(_translate("MainWindow", "Ctrl+Alt+S"))
 import src_rc
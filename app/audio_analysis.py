@@ -0,0 +1,111 @@
+import shutil
+import subprocess
+from typing import AnyStr, Dict, Generator, Iterable, Union
+
+import numpy as np
+
+from loudness import integrated_loudness, step_powers
+from tempo import TEMPO_SECONDS, track_tempo
+
+# Tracks are decoded once for all analyses, at a sample rate which keeps the frequencies loudness depends on
+ANALYSIS_SAMPLE_RATE = 22050
+ANALYSIS_CHANNELS = 2
+MAX_ANALYSIS_SECONDS = 600
+
+# Decoded audio is analyzed in chunks, so a worker never holds a whole track. A chunk is made of whole
+# loudness steps, see loudness.STEP_SECONDS, so the steps of the chunks are the steps of the track
+CHUNK_SECONDS = 10
+
+ANALYSES = ("tempo", "loudness")
+
+
+def is_available() -> bool:
+    """
+    Check whether tracks can be decoded for the analysis, which needs the ffmpeg executable.
+
+    :return: True if ffmpeg is found, False otherwise. (bool)
+    """
+
+    return shutil.which("ffmpeg") is not None
+
+
+def decode_audio_chunks(path: AnyStr, sample_rate: int = ANALYSIS_SAMPLE_RATE, channels: int = ANALYSIS_CHANNELS,
+                        seconds: int = MAX_ANALYSIS_SECONDS,
+                        chunk_seconds: float = CHUNK_SECONDS) -> Generator[np.ndarray, None, None]:
+    """
+    Decode the beginning of an audio file to samples with ffmpeg, chunk by chunk as ffmpeg decodes it.
+    Mono tracks are decoded to all channels.
+
+    :param path: The path of the audio file. (AnyStr)
+    :param sample_rate: The sample rate to decode at. (int)
+    :param channels: The number of channels to decode to. (int)
+    :param seconds: The length of the beginning to decode. (int)
+    :param chunk_seconds: The length of a chunk, only the last chunk is shorter. (float)
+    :return: A generator of samples in the range -1 to 1 with a column per channel. Nothing is generated if the file
+             cannot be decoded, only the samples decoded before an error if it is damaged.
+             (Generator[np.ndarray, None, None])
+    :raises OSError: If ffmpeg cannot be run.
+    """
+
+    process = subprocess.Popen(
+        ["ffmpeg", "-v", "error", "-nostdin", "-i", path, "-t", str(seconds),
+         "-ac", str(channels), "-ar", str(sample_rate), "-f", "f32le", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+
+    chunk_size = round(chunk_seconds * sample_rate) * channels * np.dtype(np.float32).itemsize
+
+    try:
+        while True:
+            data = process.stdout.read(chunk_size)
+            if not data:
+                break
+
+            samples = np.frombuffer(data, dtype=np.float32)
+            yield samples[:len(samples) - len(samples) % channels].reshape(-1, channels)
+    finally:
+        process.kill()
+        process.stdout.close()
+        process.wait()
+
+
+def analyze_audio(path: AnyStr, analyses: Iterable[str] = ANALYSES) -> Dict[str, Union[float, None]]:
+    """
+    Decode an audio file once and run the requested analyses on it. Meant to run in a worker process.
+
+    The file is analyzed chunk by chunk as it is decoded. The loudness is measured over all of it, the tempo
+    is estimated from its beginning, which is the only part kept in memory.
+
+    :param path: The path of the audio file. (AnyStr)
+    :param analyses: Names of the analyses to run, see ANALYSES. (Iterable[str])
+    :return: A dictionary with the result of every analysis, the tempo in beats per minute and the integrated
+             loudness in LUFS, None where the file cannot be analyzed. (Dict[str, Union[float, None]])
+    :raises OSError: If ffmpeg cannot be run.
+    """
+
+    analyses = set(analyses)
+    tempo_length = TEMPO_SECONDS * ANALYSIS_SAMPLE_RATE
+    tempo_chunks = []
+    tempo_chunks_length = 0
+    powers = []
+
+    for samples in decode_audio_chunks(path):
+        if "loudness" in analyses:
+            powers.append(step_powers(samples, ANALYSIS_SAMPLE_RATE))
+
+        if "tempo" in analyses and tempo_chunks_length < tempo_length:
+            # The tempo is estimated from a downmix, see tempo.track_tempo()
+            tempo_chunks.append(samples[:tempo_length - tempo_chunks_length].mean(axis=1, keepdims=True))
+            tempo_chunks_length += len(tempo_chunks[-1])
+        elif "loudness" not in analyses:
+            break
+
+    results = {}
+
+    if "tempo" in analyses:
+        samples = np.concatenate(tempo_chunks) if tempo_chunks else np.zeros((0, 1), dtype=np.float32)
+        results["tempo"] = track_tempo(samples, ANALYSIS_SAMPLE_RATE)
+    if "loudness" in analyses:
+        results["loudness"] = integrated_loudness(np.concatenate(powers) if powers else np.zeros(0))
+
+    return results
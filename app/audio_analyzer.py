@@ -0,0 +1,87 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import List
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from program_data import ProgramData
+from audio_analysis import analyze_audio
+
+
+class AudioAnalyzer(QThread):
+    """
+    Background tempo and loudness analysis of playlist tracks.
+
+    Tracks with an analysis which is not cached yet, i.e. new tracks and tracks changed since they were analyzed,
+    are decoded and analyzed in a pool of worker processes, so the analysis runs on all cores and does not hold
+    the GUI thread. Every track is decoded once for all its missing analyses. Results are stored in the caches
+    of the program data as they are completed and published in batches of paths through the audios_analyzed signal.
+    The analysis is cancelled with requestInterruption(), tracks which were not analyzed are analyzed next time.
+    """
+
+    audios_analyzed = pyqtSignal(list)
+
+    def __init__(self, program_data: ProgramData, paths: List[str], batch_size: int = 16, max_workers: int = None,
+                 parent=None):
+        super().__init__(parent)
+
+        self.__program_data = program_data
+        self.__paths = paths
+        self.__batch_size = batch_size
+        self.__max_workers = max_workers or max(1, (os.cpu_count() or 1) - 1)
+
+    def __missing_analyses(self, path: str) -> List[str]:
+        analyses = []
+
+        if not self.__program_data.has_audio_tempo(path):
+            analyses.append("tempo")
+        if not self.__program_data.has_audio_loudness(path):
+            analyses.append("loudness")
+
+        return analyses
+
+    def run(self):
+        pending = [(path, self.__missing_analyses(path)) for path in self.__paths]
+        pending = [(path, analyses) for path, analyses in pending if analyses]
+        if not pending or self.isInterruptionRequested():
+            return
+
+        batch = []
+
+        # Worker processes are started fresh instead of forking the GUI process with its threads
+        with ProcessPoolExecutor(max_workers=self.__max_workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {executor.submit(analyze_audio, path, analyses): path for path, analyses in pending}
+
+            try:
+                for future in as_completed(futures):
+                    if self.isInterruptionRequested():
+                        return
+
+                    try:
+                        results = future.result()
+                    except OSError:
+                        continue
+
+                    path = futures[future]
+                    if "tempo" in results:
+                        self.__program_data.set_audio_tempo(path, results["tempo"])
+                    if "loudness" in results:
+                        self.__program_data.set_audio_loudness(path, results["loudness"])
+                    batch.append(path)
+
+                    if len(batch) >= self.__batch_size:
+                        self.audios_analyzed.emit(batch)
+                        batch = []
+            except BrokenProcessPool:
+                # A worker process died, e.g. killed for its memory use, the rest is analyzed next time
+                pass
+            finally:
+                for future in futures:
+                    future.cancel()
+                self.__program_data.save_audio_metadata()
+
+        if batch:
+            self.audios_analyzed.emit(batch)
@@ -1,9 +1,75 @@
+import itertools
 import os.path
-from typing import Union
+from concurrent.futures import Executor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Union, Iterable, Generator, Tuple
 
 import mutagen
 from mutagen.mp3 import MP3
 from mutagen.easyid3 import EasyID3
+from mutagen.easymp4 import EasyMP4
+from mutagen.flac import FLAC
+from mutagen.oggvorbis import OggVorbis
+from mutagen.oggopus import OggOpus
+from mutagen.oggflac import OggFLAC
+from mutagen.wave import WAVE
+from mutagen.id3 import ID3
+
+from mp3header import read_mp3_metadata
+
+# mutagen file types of the detected formats, MP3 files are read by __to_metadata()
+FORMAT_TYPES = {
+    "flac": FLAC,
+    "ogg_vorbis": OggVorbis,
+    "ogg_opus": OggOpus,
+    "ogg_flac": OggFLAC,
+    "mp4": EasyMP4,
+    "wav": WAVE
+}
+
+# ID3 frames of the metadata keys, for formats which carry ID3 tags without an easy interface (WAV)
+ID3_FRAMES = {"title": "TIT2", "artist": "TPE1", "album": "TALB"}
+
+
+def detect_audio_format(audiopath: str) -> Union[str, None]:
+    """
+    Detect the container format of an audio file by its magic bytes.
+
+    :param audiopath: The path of the audio file. (str)
+    :return: One of "mp3", "flac", "ogg_vorbis", "ogg_opus", "ogg_flac", "mp4" and "wav",
+             or None if the format is not recognized or the file cannot be read. (Union[str, None])
+    """
+
+    try:
+        with open(audiopath, "rb") as audio_file:
+            head = audio_file.read(36)
+
+            # FLAC files may start with an ID3v2 tag as well
+            if head[:3] == b"ID3" and len(head) >= 10:
+                size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+                audio_file.seek(10 + size + (10 if head[5] & 0x10 else 0))
+                return "flac" if audio_file.read(4) == b"fLaC" else "mp3"
+    except OSError:
+        return
+
+    if head[:4] == b"fLaC":
+        return "flac"
+    if head[:4] == b"OggS":
+        # The codec is identified by the first packet of the first page
+        if head[28:35] == b"\x01vorbis":
+            return "ogg_vorbis"
+        if head[28:36] == b"OpusHead":
+            return "ogg_opus"
+        if head[28:33] == b"\x7fFLAC":
+            return "ogg_flac"
+        return
+    if head[4:8] == b"ftyp":
+        return "mp4"
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    if len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0:
+        return "mp3"
+
+    return
 
 
 def __to_metadata(filepath: str):
@@ -29,10 +95,120 @@ def __to_metadata(filepath: str):
         return metadata
 
 
-def get_audio_name(audiopath: str) -> Union[dict, str]:
+def __to_tagged_metadata(filepath: str, file_type: Union[type, None]) -> dict:
+    # Read Vorbis comments, MP4 atoms or ID3 tags of other formats, any format mutagen knows if the type is None
+    try:
+        audio = file_type(filepath) if file_type else mutagen.File(filepath, easy=True)
+    except (mutagen.MutagenError, OSError):
+        return {}
+
+    if audio is None:
+        return {}
+
+    metadata = {}
+
+    for key, frame_id in ID3_FRAMES.items():
+        if isinstance(audio.tags, ID3):
+            frame = audio.tags.get(frame_id)
+            values = frame.text if frame else []
+        else:
+            values = audio.tags.get(key, []) if audio.tags else []
+
+        metadata[key] = str(values[0]) if values else None
+
+    metadata["duration_seconds"] = audio.info.length
+
+    return metadata
+
+
+def get_audio_metadata(audiopath: str, header_only: bool = True) -> dict:
+    """
+    Read title, artist, album and duration of an audio file.
+
+    The file format is detected by its magic bytes, see detect_audio_format(), and reported in the "format" key.
+    Files which are not recognized are read as MP3 if they have the .mp3 extension, and with any reader
+    mutagen has otherwise.
+
+    :param audiopath: The path of the audio file. (str)
+    :param header_only: Whether to read only the tags and the first frames of MP3 files if possible,
+                        see mp3header.read_mp3_metadata(), instead of parsing them with mutagen. (bool)
+    :return: A dictionary with "title", "artist", "album", "duration_seconds" and "format" keys,
+             or an empty dictionary if the file cannot be read. (dict)
+    """
+
+    audio_format = detect_audio_format(audiopath)
+    if audio_format is None and audiopath.lower().endswith(".mp3"):
+        audio_format = "mp3"
+
+    if audio_format == "mp3":
+        metadata = read_mp3_metadata(audiopath) if header_only else None
+        if metadata is None:
+            metadata = __to_metadata(audiopath)
+    else:
+        metadata = __to_tagged_metadata(audiopath, FORMAT_TYPES.get(audio_format))
+
+    if metadata:
+        metadata["format"] = audio_format
+
+    return metadata
+
+
+def get_audio_metadata_many(audiopaths: Iterable[str], max_workers: int = None,
+                            executor: Executor = None) -> Generator[Tuple[str, dict], None, None]:
+    """
+    Read metadata of many audio files concurrently, yielding results as they complete.
+
+    At most twice max_workers files are queued at a time, so paths may come from a lazy iterable and closing
+    the generator early cancels the files which were not read yet. Use dict() on the result to get
+    a path to metadata mapping.
+
+    :param audiopaths: Paths of the audio files. (Iterable[str])
+    :param max_workers: The number of files read at once, by default a few more than the number of CPUs. (int)
+    :param executor: An executor to read the files on, e.g. a shared ThreadPoolExecutor or a ProcessPoolExecutor.
+                     A thread pool is created for the call if it is not provided. (Executor)
+    :return: A generator of (path, metadata) tuples in completion order, see get_audio_metadata().
+             (Generator[Tuple[str, dict], None, None])
+    """
+
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    audiopaths = iter(audiopaths)
+    pending = {}
+
+    def submit(count: int) -> None:
+        for audiopath in itertools.islice(audiopaths, count):
+            pending[executor.submit(get_audio_metadata, audiopath)] = audiopath
+
+    try:
+        submit(max_workers * 2)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            submit(len(done))
+
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+        if own_executor:
+            executor.shutdown(wait=False)
+
+
+def format_audio_name(audiopath: str, metadata: dict) -> str:
+    """
+    Make a display name of an audio file from its metadata, falling back to the file name.
+
+    :param audiopath: The path of the audio file. (str)
+    :param metadata: The metadata of the audio file, see get_audio_metadata(). (dict)
+    :return: The display name of the audio file. (str)
+    """
 
-    metadata = __to_metadata(audiopath)
-    if not (metadata['title'] and metadata['artist']):
+    if not (metadata.get('title') and metadata.get('artist')):
         name = os.path.basename(audiopath)
     else:
         name = f"{metadata['title']} - {metadata['artist']}"
@@ -0,0 +1,219 @@
+import hashlib
+import os
+import threading
+from typing import AnyStr, Dict, List, Iterable, Union, Tuple, Callable
+
+from file_cache import FileCache
+
+# Size of each of the head, middle and tail chunks hashed by partial_hash()
+PARTIAL_CHUNK_SIZE = 64 * 1024
+FULL_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def partial_hash(path: AnyStr, size: int) -> str:
+    """
+    Hash the head, middle and tail chunks of a file, a cheap check whether two files of the same size may be equal.
+
+    :param path: The path of the file. (AnyStr)
+    :param size: The size of the file in bytes. (int)
+    :return: A hex digest. (str)
+    :raises OSError: If the file cannot be read.
+    """
+
+    file_hash = hashlib.blake2b(digest_size=16)
+
+    with open(path, "rb") as file:
+        if size <= 3 * PARTIAL_CHUNK_SIZE:
+            file_hash.update(file.read())
+        else:
+            for offset in (0, (size - PARTIAL_CHUNK_SIZE) // 2, size - PARTIAL_CHUNK_SIZE):
+                file.seek(offset)
+                file_hash.update(file.read(PARTIAL_CHUNK_SIZE))
+
+    return file_hash.hexdigest()
+
+
+def full_hash(path: AnyStr) -> str:
+    """
+    Hash the whole contents of a file.
+
+    :param path: The path of the file. (AnyStr)
+    :return: A hex digest. (str)
+    :raises OSError: If the file cannot be read.
+    """
+
+    file_hash = hashlib.blake2b(digest_size=32)
+
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(FULL_HASH_BLOCK_SIZE), b""):
+            file_hash.update(block)
+
+    return file_hash.hexdigest()
+
+
+class DuplicateFilter:
+    """
+    Incremental filter of audio files with the same contents, e.g. the same album copied to several folders.
+
+    Files are compared in stages, each stage only for files which are equal so far: by size, then by a partial hash
+    of the head, middle and tail chunks, and by a full hash only if the partial hashes are equal. Hashes are kept
+    in a FileCache, so a file is hashed again only after it was changed. File sizes are taken from file_stat,
+    e.g. PlaylistIndex.file_stat(), and files it does not know are stat-ed.
+
+    Rejected files are remembered with the accepted file they are equal to, so one of them takes its place
+    once the accepted file is removed, see remove().
+
+    The filter may be used from several threads at once.
+    """
+
+    def __init__(self, hash_cache: FileCache, file_stat: Callable[[str], Union[Tuple[int, int], None]]):
+        self.__hash_cache = hash_cache
+        self.__file_stat = file_stat
+        self.__files_by_size: Dict[int, List[str]] = {}
+        self.__sizes: Dict[str, int] = {}
+        self.__copies: Dict[str, List[str]] = {}
+        self.__originals: Dict[str, str] = {}
+        self.__lock = threading.RLock()
+
+    def clear(self) -> None:
+        """
+        Forget all accepted and rejected files.
+        """
+
+        with self.__lock:
+            self.__files_by_size.clear()
+            self.__sizes.clear()
+            self.__copies.clear()
+            self.__originals.clear()
+
+    def filter(self, paths: Iterable[AnyStr]) -> List[str]:
+        """
+        Accept files which are not duplicates of the files accepted so far, the first file of equal ones is kept.
+
+        :param paths: Paths of the files. (Iterable[AnyStr])
+        :return: Paths of the accepted files, in the given order. (List[str])
+        """
+
+        accepted = []
+
+        with self.__lock:
+            for path in paths:
+                size = self.__size(path)
+
+                if size is not None:
+                    original = next((other for other in self.__files_by_size.get(size, [])
+                                     if self.__equal(path, other, size)), None)
+                    if original is not None:
+                        self.__copies.setdefault(original, []).append(path)
+                        self.__originals[path] = original
+                        continue
+
+                    self.__files_by_size.setdefault(size, []).append(path)
+                    self.__sizes[path] = size
+
+                accepted.append(path)
+
+        return accepted
+
+    def remove(self, path: AnyStr) -> Union[str, None]:
+        """
+        Forget a file, e.g. after it was removed. An accepted file is replaced by the first file rejected
+        as its duplicate, if there is one.
+
+        :param path: The path of the file. (AnyStr)
+        :return: The path of the rejected file which is accepted now, or None. (Union[str, None])
+        """
+
+        with self.__lock:
+            original = self.__originals.pop(path, None)
+            if original is not None:
+                copies = self.__copies[original]
+                copies.remove(path)
+                if not copies:
+                    del self.__copies[original]
+                return
+
+            size = self.__sizes.pop(path, None)
+            if size is None:
+                return
+
+            files = self.__files_by_size[size]
+            copies = self.__copies.pop(path, [])
+
+            if not copies:
+                files.remove(path)
+                if not files:
+                    del self.__files_by_size[size]
+                return
+
+            copy = copies.pop(0)
+            files[files.index(path)] = copy
+            self.__sizes[copy] = size
+            del self.__originals[copy]
+
+            if copies:
+                self.__copies[copy] = copies
+                for other in copies:
+                    self.__originals[other] = copy
+
+            return copy
+
+    def rename(self, old_path: AnyStr, new_path: AnyStr) -> None:
+        """
+        Move a file to its new path. Cached hashes are not moved, see FileCache.rename().
+
+        :param old_path: The previous path of the file. (AnyStr)
+        :param new_path: The new path of the file. (AnyStr)
+        """
+
+        with self.__lock:
+            original = self.__originals.pop(old_path, None)
+            if original is not None:
+                copies = self.__copies[original]
+                copies[copies.index(old_path)] = new_path
+                self.__originals[new_path] = original
+                return
+
+            size = self.__sizes.pop(old_path, None)
+            if size is None:
+                return
+
+            files = self.__files_by_size[size]
+            files[files.index(old_path)] = new_path
+            self.__sizes[new_path] = size
+
+            copies = self.__copies.pop(old_path, None)
+            if copies:
+                self.__copies[new_path] = copies
+                for copy in copies:
+                    self.__originals[copy] = new_path
+
+    def __size(self, path: str) -> Union[int, None]:
+        file_stat = self.__file_stat(path)
+        if file_stat is not None:
+            return file_stat[0]
+
+        try:
+            return os.stat(path).st_size
+        except OSError:
+            return
+
+    def __equal(self, path: str, other: str, size: int) -> bool:
+        # Files which cannot be read are never reported as duplicates
+        try:
+            if self.__hash(path, "partial", size) != self.__hash(other, "partial", size):
+                return False
+
+            return self.__hash(path, "full", size) == self.__hash(other, "full", size)
+        except OSError:
+            return False
+
+    def __hash(self, path: str, kind: str, size: int) -> str:
+        file_stat = self.__file_stat(path)
+        hashes = self.__hash_cache.get(path, file_stat) or {}
+
+        if kind not in hashes:
+            hashes[kind] = partial_hash(path, size) if kind == "partial" else full_hash(path)
+            self.__hash_cache.set(path, hashes, file_stat)
+
+        return hashes[kind]
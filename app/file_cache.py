@@ -0,0 +1,157 @@
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, AnyStr, Union, Tuple
+
+
+class FileCache:
+    """
+    Persistent cache of values computed from files, e.g. audio metadata.
+
+    Entries are keyed by the file path and are valid only while the file size and modification time
+    are unchanged. Entries are stored as compact JSON in an SQLite database, so a lookup reads a single row
+    instead of the whole cache, and the most recently used entries are kept in an in-memory LRU in front of it.
+    New entries are written to disk in batches, see flush().
+
+    The cache may be used from several threads at once.
+    """
+
+    def __init__(self, filename: AnyStr, capacity: int = 4096):
+        self.__filename = filename
+        self.__capacity = capacity
+        self.__connection: Union[sqlite3.Connection, None] = None
+        self.__entries: OrderedDict[str, Tuple[int, int, Any]] = OrderedDict()
+        self.__pending = False
+        self.__lock = threading.RLock()
+
+    def __database(self) -> sqlite3.Connection:
+        # The database is opened on first use
+        if self.__connection is None:
+            os.makedirs(os.path.dirname(self.__filename), exist_ok=True)
+
+            self.__connection = sqlite3.connect(self.__filename, check_same_thread=False)
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, value TEXT) WITHOUT ROWID"
+            )
+
+        return self.__connection
+
+    def __remember(self, path: str, entry: Tuple[int, int, Any]) -> None:
+        self.__entries[path] = entry
+        self.__entries.move_to_end(path)
+
+        if len(self.__entries) > self.__capacity:
+            self.__entries.popitem(last=False)
+
+    @staticmethod
+    def __stat(path: AnyStr) -> Union[Tuple[int, int], None]:
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return
+
+        return file_stat.st_size, file_stat.st_mtime_ns
+
+    def get(self, path: AnyStr, file_stat: Union[Tuple[int, int], None] = None) -> Any:
+        """
+        Get the cached value of a file.
+
+        :param path: The path of the file. (AnyStr)
+        :param file_stat: The size and modification time in nanoseconds of the file if known already,
+                          e.g. from PlaylistIndex.file_stat(), otherwise the file is stat-ed.
+                          (Union[Tuple[int, int], None])
+        :return: The cached value, or None if it is not cached or the file was changed since. (Any)
+        """
+
+        if file_stat is None:
+            file_stat = self.__stat(path)
+            if file_stat is None:
+                return
+
+        with self.__lock:
+            entry = self.__entries.get(path)
+
+            if entry is None:
+                try:
+                    row = self.__database().execute(
+                        "SELECT size, mtime, value FROM entries WHERE path = ?", (path,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+
+                if row:
+                    entry = (row[0], row[1], json.loads(row[2]))
+                    self.__remember(path, entry)
+            else:
+                self.__entries.move_to_end(path)
+
+            if entry is None or entry[:2] != tuple(file_stat):
+                return
+
+            return entry[2]
+
+    def set(self, path: AnyStr, value: Any, file_stat: Union[Tuple[int, int], None] = None) -> None:
+        """
+        Cache a value of a file for its current size and modification time.
+
+        :param path: The path of the file. (AnyStr)
+        :param value: A JSON serializable value. (Any)
+        :param file_stat: The size and modification time in nanoseconds of the file if known already,
+                          see get(). (Union[Tuple[int, int], None])
+        """
+
+        if file_stat is None:
+            file_stat = self.__stat(path)
+            if file_stat is None:
+                return
+
+        entry = (file_stat[0], file_stat[1], value)
+
+        with self.__lock:
+            self.__remember(path, entry)
+
+            try:
+                self.__database().execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                    (path, entry[0], entry[1], json.dumps(value, separators=(",", ":")))
+                )
+                self.__pending = True
+            except sqlite3.Error:
+                pass
+
+    def rename(self, old_path: AnyStr, new_path: AnyStr) -> None:
+        """
+        Move the cached value of a renamed file to its new path.
+
+        :param old_path: The previous path of the file. (AnyStr)
+        :param new_path: The new path of the file. (AnyStr)
+        """
+
+        with self.__lock:
+            entry = self.__entries.pop(old_path, None)
+            if entry is not None:
+                self.__remember(new_path, entry)
+
+            try:
+                self.__database().execute("UPDATE OR REPLACE entries SET path = ? WHERE path = ?", (new_path, old_path))
+                self.__pending = True
+            except sqlite3.Error:
+                pass
+
+    def flush(self) -> None:
+        """
+        Write the new entries to disk.
+        """
+
+        with self.__lock:
+            if not self.__pending:
+                return
+
+            try:
+                self.__database().commit()
+            except sqlite3.Error:
+                pass
+            self.__pending = False
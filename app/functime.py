@@ -1,19 +1,27 @@
+from functools import lru_cache
 from typing import AnyStr
 
 
+@lru_cache(maxsize=None)
 def prettify_time(seconds: int) -> AnyStr:
     """
-    Convert seconds into a prettified time format (MM:SS).
+    Convert seconds into a prettified time format (MM:SS, or H:MM:SS from one hour on).
+
+    Time strings are memoized, so every second shown during playback is formatted only once.
 
     :param seconds: The number of seconds to convert. (int)
-    :return: The prettified time string in the format MM:SS. (AnyStr)
+    :return: The prettified time string in the format MM:SS or H:MM:SS. (AnyStr)
     """
 
     if not seconds:
         return "00:00"
 
+    hours, seconds = divmod(seconds, 3600)
     minutes = seconds_to_minutes(seconds)
     seconds = seconds % 60
+
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
     return f"{minutes:02d}:{seconds:02d}"
 
 
@@ -0,0 +1,107 @@
+from typing import Union
+
+import numpy as np
+
+# Loudness is measured as in ITU-R BS.1770: over 400 ms blocks which overlap by 75%, so every block is made of
+# four 100 ms steps, and the blocks are gated before they are averaged
+STEP_SECONDS = 0.1
+STEPS_PER_BLOCK = 4
+ABSOLUTE_GATE = -70.0
+RELATIVE_GATE = -10.0
+
+# Number of steps filtered at once, which bounds the memory used for long tracks
+STEPS_PER_CHUNK = 600
+
+
+def _biquad(b: tuple, a: tuple, z: np.ndarray) -> np.ndarray:
+    # Frequency response of a biquad filter at z = e^(-jw)
+    return (b[0] + b[1] * z + b[2] * z * z) / (a[0] + a[1] * z + a[2] * z * z)
+
+
+def k_weighting(frequencies: np.ndarray, sample_rate: int) -> np.ndarray:
+    """
+    Compute the power response of the K-weighting filter of ITU-R BS.1770, a high shelf which models
+    the head followed by a high-pass filter.
+
+    :param frequencies: Frequencies in Hz. (np.ndarray)
+    :param sample_rate: The sample rate of the filtered audio. (int)
+    :return: The power gain of the filter at every frequency. (np.ndarray)
+    """
+
+    z = np.exp(-2j * np.pi * frequencies / sample_rate)
+
+    # Both stages are the bilinear transforms of their analog prototypes, which match the reference at 48 kHz
+    k = np.tan(np.pi * 1681.974450955533 / sample_rate)
+    q = 0.7071752369554196
+    high_gain = 10 ** (3.999843853973347 / 20)
+    band_gain = high_gain ** 0.4996667741545416
+    shelf = _biquad(
+        (high_gain + band_gain * k / q + k * k, 2 * (k * k - high_gain), high_gain - band_gain * k / q + k * k),
+        (1 + k / q + k * k, 2 * (k * k - 1), 1 - k / q + k * k),
+        z
+    )
+
+    k = np.tan(np.pi * 38.13547087602444 / sample_rate)
+    q = 0.5003270373238773
+    a0 = 1 + k / q + k * k
+    high_pass = _biquad((a0, -2 * a0, a0), (a0, 2 * (k * k - 1), 1 - k / q + k * k), z)
+
+    return np.abs(shelf * high_pass) ** 2
+
+
+def step_powers(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """
+    Compute the mean square of the K-weighted audio in every 100 ms step, summed over the channels.
+
+    Steps are filtered in the frequency domain, the power of a step is the weighted sum of its power spectrum.
+
+    Samples of a track can be passed in chunks of whole steps, the powers of the chunks make up those of the track.
+
+    :param samples: Samples with a column per channel, see audio_analysis.decode_audio_chunks(). (np.ndarray)
+    :param sample_rate: The sample rate of the samples. (int)
+    :return: The power of every complete step. (np.ndarray)
+    """
+
+    size = int(STEP_SECONDS * sample_rate)
+    count = len(samples) // size
+    steps = samples[:count * size].reshape(count, size, samples.shape[1])
+
+    # Weights of the one-sided spectrum bins, which stand for both their positive and negative frequency
+    bins = np.fft.rfftfreq(size, 1 / sample_rate)
+    weights = 2 * k_weighting(bins, sample_rate)
+    weights[0] /= 2
+    if size % 2 == 0:
+        weights[-1] /= 2
+
+    powers = np.empty(count)
+    for first in range(0, count, STEPS_PER_CHUNK):
+        spectra = np.abs(np.fft.rfft(steps[first:first + STEPS_PER_CHUNK], axis=1)) ** 2
+        powers[first:first + STEPS_PER_CHUNK] = np.einsum("sbc,b->s", spectra, weights) / (size * size)
+
+    return powers
+
+
+def integrated_loudness(powers: np.ndarray) -> Union[float, None]:
+    """
+    Measure the integrated loudness of a track.
+
+    :param powers: The power of every step of the track, see step_powers(). (np.ndarray)
+    :return: The loudness in LUFS, or None if the track is shorter than a block or silent. (Union[float, None])
+    """
+
+    if len(powers) < STEPS_PER_BLOCK:
+        return
+
+    blocks = np.lib.stride_tricks.sliding_window_view(powers, STEPS_PER_BLOCK).mean(axis=1)
+
+    with np.errstate(divide="ignore"):
+        loudness = -0.691 + 10 * np.log10(blocks)
+
+    gated = blocks[loudness > ABSOLUTE_GATE]
+    if not len(gated):
+        return
+
+    threshold = -0.691 + 10 * np.log10(gated.mean()) + RELATIVE_GATE
+    gated = blocks[(loudness > ABSOLUTE_GATE) & (loudness > threshold)]
+
+    return round(float(-0.691 + 10 * np.log10(gated.mean())), 2)
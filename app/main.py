@@ -1,25 +1,45 @@
 # PyQt5 imports
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QTableWidgetItem, QListWidgetItem, QMessageBox, QFileDialog)
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QMediaPlaylist
-from PyQt5.QtCore import Qt, QUrl, QThread, pyqtSignal
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QMessageBox, QFileDialog)
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaPlaylist
+from PyQt5.QtCore import Qt, QThread, QTimer, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QIcon, QPixmap, QTextCursor
 
 from app_ui import Ui_MainWindow
 
-from typing import List, AnyStr, Dict, Union
+from typing import List, AnyStr, Dict, Union, Tuple, Callable
 from datetime import datetime
+from bisect import bisect_right
 from openai import OpenAI
 import sys
 import os
+import random
+import time
+import multiprocessing
 
 # Application modules
 from program_data import ProgramData, CONFIG_FILENAME
-from audioinfo import get_audio_name
-from functime import prettify_time, milliseconds_to_seconds
+from playlist_loader import PlaylistLoader
+from playlist_watcher import PlaylistWatcher
+from playlist_sort import SORT_ORDERS
+from models import (ExerciseNamesModel, ExerciseNamesProxyModel, ExercisesTableModel, ExercisesTableProxyModel,
+                    PlaylistModel, PlaylistProxyModel)
+from audioinfo import format_audio_name
+from playback_progress import PlaybackProgress
+from media_window import MediaWindow
+from track_prefetcher import TrackPrefetcher
+from audio_analyzer import AudioAnalyzer
+from playback_recorder import PlaybackRecorder
+from playback_resume import PlaybackResume
+import audio_analysis
+
+
+# Parts of a streamed answer are shown together at most this often, about once per frame, in milliseconds
+ANSWER_FLUSH_INTERVAL = 16
 
 
 class AssistantWorker(QThread):
     answer_received = pyqtSignal(str)
+    answer_delta = pyqtSignal(str)
     answer_finished = pyqtSignal(str)
 
     def __init__(self, token: AnyStr, model: AnyStr):
@@ -63,12 +83,6 @@ you must explain that you are only communicating on topics related to sport and
                     "content": self.__question
                 }
             )
-            stream = self.client.chat.completions.create(
-                model=self.__model,
-                messages=self.chat_history,
-                stream=True,
-                response_format={"type": "text"}
-            )
 
             now = datetime.now()
             timestamp = now.strftime("%d.%m.%Y %I:%M %p")
@@ -80,19 +94,29 @@ you must explain that you are only communicating on topics related to sport and
             </p><br />"""
             self.answer_received.emit(answer_html)
 
+            stream = self.client.chat.completions.create(
+                model=self.__model,
+                messages=self.chat_history,
+                stream=True,
+                response_format={"type": "text"}
+            )
+
             answer_html = f"""
             <p style="margin-top: 0px; margin-bottom: 0px; margin-left: 0px; margin-right: 0px; -qt-block-indent: 0; text-indent: 0px;">
                 <span style=" font-size:8pt;">{timestamp}<br /></span>
                 <img src=":/tab/img/assistant.png" width="15" >
             """
+            self.answer_received.emit(answer_html)
 
-            answer = ""
+            # The answer is shown as it is generated, see WorkItOut.assistantAnswerDelta()
+            answer = []
             for chunk in stream:
-                if chunk.choices[0].delta.content is not None:
-                    answer += chunk.choices[0].delta.content
+                content = chunk.choices[0].delta.content if chunk.choices else None
+                if content:
+                    answer.append(content)
+                    self.answer_delta.emit(content)
 
-            answer_html += f"{answer}</p><br />".replace("\n", "<br \\>")
-            self.answer_received.emit(answer_html)
+            answer = "".join(answer)
 
             self.chat_history.append(
                 {
@@ -100,6 +124,7 @@ you must explain that you are only communicating on topics related to sport and
                     "content": answer
                 }
             )
+            self.answer_finished.emit(answer)
 
 
 class WorkItOut(QMainWindow):
@@ -111,15 +136,43 @@ class WorkItOut(QMainWindow):
 
         # Setting up necessary variables
         self.ui = Ui_MainWindow()
-        self.assistant = AssistantWorker(
-            token=self.program_data.get_openai_token(),
-            model=self.program_data.get_assistant_model()
-        )
+        self.assistant: Union[AssistantWorker, None] = None
+        self.assistant_asked_at = 0.0
+        self.assistant_first_token_latency: Union[float, None] = None
+        self.assistant_answer_parts: List[str] = []
+        self.assistant_answer_timer = QTimer(self)
+        self.assistant_answer_timer.setSingleShot(True)
+        self.assistant_answer_timer.setInterval(ANSWER_FLUSH_INTERVAL)
+        self.assistant_answer_timer.timeout.connect(self.showAssistantAnswerParts)
         self.media_player = QMediaPlayer()
         self.media_playlist = QMediaPlaylist()
-
-        self.filter_exercises_by_day = lambda exercise: self.today.strftime("%A") in exercise["days"]
-        self.shown_exercises: list = []
+        self.media_window = MediaWindow(self.media_playlist, self.program_data, parent=self)
+        self.track_prefetcher = TrackPrefetcher(self.program_data, parent=self)
+        self.playback_recorder = PlaybackRecorder(self.media_player, self.program_data, self.isWorkoutActive,
+                                                  parent=self)
+        self.playback_resume = PlaybackResume(self.media_player, self.program_data, parent=self)
+        self.playlist_loaded = False
+        self.playlist_loader: Union[PlaylistLoader, None] = None
+        self.audio_analyzer: Union[AudioAnalyzer, None] = None
+        self.analyze_audios_again = False
+        self.audio_gain = 0.0
+        self.play_when_loaded = False
+        self.playlist_sort_order = self.program_data.get_playlist_sort_order()
+        self.resume_path, self.resume_position = self.program_data.get_resume_point()
+        self.playlist_watcher = PlaylistWatcher(parent=self)
+        self.exercise_names_model = ExerciseNamesModel()
+        self.exercise_names_proxy_model = ExerciseNamesProxyModel()
+        self.exercise_names_proxy_model.setSourceModel(self.exercise_names_model)
+        self.exercises_table_model = ExercisesTableModel()
+        self.exercises_table_proxy_model = ExercisesTableProxyModel()
+        self.exercises_table_proxy_model.setSourceModel(self.exercises_table_model)
+        self.playlist_model = PlaylistModel(self.program_data)
+        self.playlist_proxy_model = PlaylistProxyModel()
+        self.playlist_proxy_model.setSourceModel(self.playlist_model)
+
+        self.filter_exercises_by_day = lambda exercise: self.today.strftime("%A") in exercise[1]["days"]
+        self.shown_exercises: List[Tuple[int, Dict]] = []
+        self.apply_exercises_filter: Callable[[], None] = self.showAllExercisesCheckBoxStateChanged
         self.today = datetime.now()
         self.search_query: str = ""
         self.search_categories = [
@@ -129,75 +182,215 @@ class WorkItOut(QMainWindow):
             "Sets",
             "Days"
         ]
-        self.table_headers = self.search_categories
         self.show_all_exercises_check_state = Qt.CheckState.Unchecked
-        formatted_date = self.today.strftime("%A, %B %d")
 
-        # Setting up UI
+        # Setting up UI, only the current tab is built here, the rest is built on first activation
         self.ui.setupUi(self)
-
-        # Write today's date
-        self.ui.dateLabel.setText(formatted_date)
-
-        # Loading exercises to UI elements
-        self.loadExercisesToUI()
-
-        # Load assistant model to UI
-        self.ui.assistanModelEdit.setText(self.program_data.get_assistant_model())
+        self.playback_progress = PlaybackProgress(
+            self.media_player, self.ui.audioPositionLabel, self.ui.audioDurationLabel,
+            self.ui.audioDurationProgressBar, parent=self
+        )
+        self.tab_initializers = {
+            self.ui.tab: self.initTrainingTab,
+            self.ui.tab_3: self.initManageTab,
+            self.ui.tab_4: self.initPlayerTab,
+            self.ui.tab_5: self.initAssistantTab,
+            self.ui.tab_2: self.initSettingsTab,
+        }
 
         # Setup media player and playlist to play music
         self.media_player.setPlaylist(self.media_playlist)
         self.media_player.setVolume(self.ui.volumeSlider.value())
 
-        # Loading audio list to UI
-        self.reloadPlaylist()
+        # Player controls: Connecting signals to slots
+        self.ui.playPauseAudioButton.clicked.connect(self.mediaPlayerStateChanged)
+        self.ui.volumeSlider.valueChanged.connect(self.setVolume)
+        self.ui.previousAudioButton.clicked.connect(self.playPrevious)
+        self.ui.nextAudioButton.clicked.connect(self.playNext)
+        self.ui.shuffleAudioButton.setChecked(self.program_data.get_shuffle_seed() is not None)
+        self.ui.shuffleAudioButton.toggled.connect(self.shuffleAudioButtonToggled)
+        self.media_playlist.currentMediaChanged.connect(self.currentAudioChanged)
+        self.playlist_watcher.directories_changed.connect(self.playlistDirectoriesChanged)
+
+        # Tabs: Building tab contents and loading their data on activation
+        self.ui.tabWidget.currentChanged.connect(self.tabActivated)
+        self.tabActivated(self.ui.tabWidget.currentIndex())
+
+    def tabActivated(self, index: int) -> None:
+        """
+        Build the contents of the activated tab and load its data if it is activated for the first time.
+
+        :param index: Index of the activated tab.
+        """
+
+        tab = self.ui.tabWidget.widget(index)
+        self.ui.setupTab(tab)
+
+        initializer = self.tab_initializers.pop(tab, None)
+        if initializer:
+            initializer()
 
-        # Setup first track as current if there is any audios
-        if self.program_data.get_audios():
-            self.ui.currentAudioLabel.setText(get_audio_name(self.program_data.get_audios()[0])[:15])
+    def initTrainingTab(self) -> None:
+        """
+        Connect the TRAINING tab widgets and fill the exercises table.
+        """
+
+        # Write today's date
+        self.ui.dateLabel.setText(self.today.strftime("%A, %B %d"))
 
         # Add search categories
         self.ui.searchCategoryComboBox.addItems(self.search_categories)
 
-        # Assistant: Connecting signals to slots
-        self.assistant.answer_received.connect(self.updateAssistantAnswer)
-        self.assistant.answer_finished.connect(self.assistantAnswerFinished)
+        # Exercises table is sorted by clicking on the column headers
+        self.ui.exercisesTableView.setModel(self.exercises_table_proxy_model)
+        self.ui.exercisesTableView.sortByColumn(0, Qt.SortOrder.AscendingOrder)
 
-        # Tabs TRAINING, MANAGE: Connecting signals to slots
+        # Tab TRAINING: Connecting signals to slots
         self.ui.showAllExercisesCheckBox.stateChanged.connect(self.showAllExercisesCheckBoxStateChanged)
         self.ui.searchExercisesEdit.textEdited.connect(self.filterExercises)
         self.ui.searchCategoryComboBox.currentTextChanged.connect(self.filterExercises)
+
+        self.loadExercisesToTable()
+        self.resizeExercisesTableColumns()
+
+    def initManageTab(self) -> None:
+        """
+        Connect the MANAGE tab widgets and fill the exercise names model.
+        """
+
+        # Both exercise selectors share one model, the list shows it sorted and without the sentinel row
+        self.ui.selectExistingExerciseComboBox.setModel(self.exercise_names_model)
+        self.ui.exercisesListView.setModel(self.exercise_names_proxy_model)
+        self.exercise_names_proxy_model.sort(0)
+
+        # Tab MANAGE: Connecting signals to slots
         self.ui.addEditExerciseButton.clicked.connect(self.addEditExerciseButtonClicked)
         self.ui.deleteExerciseButton.clicked.connect(self.deleteExerciseButtonClicked)
-        self.ui.exercisesListWidget.currentItemChanged.connect(self.exercisesListWidgetCurrentItemChanged)
+        self.ui.exercisesListView.selectionModel().currentChanged.connect(self.exercisesListViewCurrentChanged)
         self.ui.selectExistingExerciseComboBox.currentIndexChanged.connect(
             self.selectExistingExerciseComboBoxCurrentIndexChanged
         )
 
+        self.loadExerciseNamesToModel()
+
+    def initPlayerTab(self) -> None:
+        """
+        Connect the PLAYER tab widgets and load the playlist if it is not loaded yet.
+        """
+
         # Tab PLAYER: Connecting signals to slots
-        self.ui.playPauseAudioButton.clicked.connect(self.mediaPlayerStateChanged)
-        self.ui.volumeSlider.valueChanged.connect(self.setVolume)
-        self.ui.previousAudioButton.clicked.connect(self.playPrevious)
-        self.ui.nextAudioButton.clicked.connect(self.playNext)
         self.ui.reloadPlaylistButton.clicked.connect(
             lambda _: self.reloadPlaylist()
         )
-        self.media_playlist.currentMediaChanged.connect(self.currentAudioChanged)
-        self.media_player.positionChanged.connect(self.updateDuration)
-        self.ui.musicPlaylistListWidget.itemDoubleClicked.connect(self.setCurrentAudioFromPlaylistListWidget)
-        self.ui.shuffleAudioButton.clicked.connect(self.shuffleAudioButtonClicked)
+        self.ui.musicPlaylistView.setModel(self.playlist_proxy_model)
+        self.ui.musicPlaylistView.doubleClicked.connect(self.setCurrentAudioFromPlaylistView)
         self.ui.setMusicPlaylistFolderButton.clicked.connect(self.setMusicPlaylistButtonFolderClicked)
+        self.ui.addMusicPlaylistFolderButton.clicked.connect(self.addMusicPlaylistFolderButtonClicked)
+        self.ui.searchPlaylistEdit.textChanged.connect(self.filterPlaylist)
+        self.ui.sortPlaylistComboBox.setCurrentIndex(list(SORT_ORDERS).index(self.playlist_sort_order))
+        self.ui.sortPlaylistComboBox.currentIndexChanged.connect(self.sortPlaylistComboBoxCurrentIndexChanged)
+        self.ui.matchTempoSpinBox.setEnabled(audio_analysis.is_available())
+        self.ui.matchTempoSpinBox.valueChanged.connect(self.filterPlaylist)
+
+        if self.playlist_loaded:
+            self.ui.musicPlaylistFolderEdit.setText("; ".join(self.program_data.get_playlist_paths()))
+        else:
+            self.reloadPlaylist()
+
+    def initAssistantTab(self) -> None:
+        """
+        Create the AI assistant and connect the ASSISTANT tab widgets.
+        """
+
+        self.assistant = AssistantWorker(
+            token=self.program_data.get_openai_token(),
+            model=self.program_data.get_assistant_model()
+        )
+
+        # Assistant: Connecting signals to slots
+        self.assistant.answer_received.connect(self.updateAssistantAnswer)
+        self.assistant.answer_delta.connect(self.assistantAnswerDelta)
+        self.assistant.answer_finished.connect(self.assistantAnswerFinished)
 
         # Tab ASSISTANT: Connecting signals to slots
         self.ui.askAssistantButton.clicked.connect(self.askAssistantButtonClicked)
 
+    def initSettingsTab(self) -> None:
+        """
+        Load settings to the SETTINGS tab widgets.
+        """
+
+        # Load assistant model to UI
+        self.ui.assistanModelEdit.setText(self.program_data.get_assistant_model())
+
     def assistantAnswerFinished(self, answer):
-        # Handle AI assistant answer and insert it to the UI
-        self.ui.assistantAnswerArea.insertHtml(answer)
+        # Show the rest of the answer and separate it from the next question
+        self.assistant_answer_timer.stop()
+        self.showAssistantAnswerParts()
+        self.appendAssistantAnswer("<br />", html=True)
 
     def updateAssistantAnswer(self, answer_html):
         # Handle AI assistant answer and insert it to the UI
-        self.ui.assistantAnswerArea.insertHtml(answer_html)
+        self.appendAssistantAnswer(answer_html, html=True)
+
+    def assistantAnswerDelta(self, delta: str) -> None:
+        """
+        Queue the next part of the streamed assistant answer to be shown.
+
+        The first part is shown right away, the following ones together once per ANSWER_FLUSH_INTERVAL,
+        so the answer area is not laid out again for every part however fast they arrive.
+
+        :param delta: The text of the part.
+        """
+
+        self.assistant_answer_parts.append(delta)
+
+        if self.assistant_first_token_latency is None:
+            self.showAssistantAnswerParts()
+        elif not self.assistant_answer_timer.isActive():
+            self.assistant_answer_timer.start()
+
+    def showAssistantAnswerParts(self) -> None:
+        """
+        Append the queued parts of the assistant answer to the answer area.
+
+        The time from asking to the first part being shown, the latency of the assistant as the user sees it,
+        is kept in assistant_first_token_latency in seconds and shown in the status bar.
+        """
+
+        if not self.assistant_answer_parts:
+            return
+
+        self.appendAssistantAnswer("".join(self.assistant_answer_parts))
+        self.assistant_answer_parts.clear()
+
+        if self.assistant_first_token_latency is None:
+            self.assistant_first_token_latency = time.perf_counter() - self.assistant_asked_at
+            latency = self.assistant_first_token_latency
+            self.statusBar().showMessage(f"Assistant started answering after {latency:.2f} s")
+
+    def appendAssistantAnswer(self, text: str, html: bool = False) -> None:
+        """
+        Append text to the end of the assistant answer area, which keeps following the end if it was scrolled there.
+
+        :param text: The text to append.
+        :param html: Whether the text is HTML or plain text.
+        """
+
+        answer_area = self.ui.assistantAnswerArea
+        scroll_bar = answer_area.verticalScrollBar()
+        follow = scroll_bar.value() == scroll_bar.maximum()
+
+        # Text is appended through a cursor of its own, so the selection of the user is kept
+        cursor = QTextCursor(answer_area.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if html:
+            cursor.insertHtml(text)
+        else:
+            cursor.insertText(text)
+
+        if follow:
+            scroll_bar.setValue(scroll_bar.maximum())
 
     def askAssistantButtonClicked(self):
         # Send user question to AI assistant
@@ -205,8 +398,33 @@ class WorkItOut(QMainWindow):
         if question:
             self.assistant.set_question(question)
             self.ui.userQuestionEdit.clear()
+            self.assistant_asked_at = time.perf_counter()
+            self.assistant_first_token_latency = None
             self.assistant.start()
 
+    def closeEvent(self, a0):
+        """
+        Event handler for closing the window.
+
+        :param a0: Close event.
+        """
+
+        if self.playlist_loader:
+            self.playlist_loader.requestInterruption()
+            self.playlist_loader.wait()
+        if self.audio_analyzer:
+            self.analyze_audios_again = False
+            self.audio_analyzer.requestInterruption()
+            self.audio_analyzer.wait()
+        self.track_prefetcher.shutdown()
+        self.playback_recorder.finish()
+        self.playback_resume.save()
+
+        self.program_data.save_audio_metadata()
+        self.program_data.save_playback_stats()
+
+        a0.accept()
+
     def resizeEvent(self, a0):
         """
         Event handler for resizing the window.
@@ -216,26 +434,364 @@ class WorkItOut(QMainWindow):
 
         a0.accept()
 
-        width = self.ui.exercisesTableWidget.width()
-        self.ui.exercisesTableWidget.horizontalHeader().setDefaultSectionSize(int(width / 6))
+        if self.ui.isTabBuilt(self.ui.tab):
+            self.resizeExercisesTableColumns()
+
+    def resizeExercisesTableColumns(self) -> None:
+        """
+        Fit the exercises table columns to the table width.
+        """
+
+        width = self.ui.exercisesTableView.width()
+        self.ui.exercisesTableView.horizontalHeader().setDefaultSectionSize(int(width / 6))
 
-    def reloadPlaylist(self, source: AnyStr = None, shuffle: bool = False) -> None:
+    def reloadPlaylist(self, sources: List[AnyStr] = None) -> None:
         """
-        Reloads the playlist with optional shuffling.
+        Reloads the playlist from its source folders.
 
-        :param source: Optional source to set the playlist path.
-        :param shuffle: Boolean indicating whether to shuffle the playlist.
+        :param sources: Optional sources to set the playlist paths.
         """
 
-        if shuffle:
-            self.program_data.shuffle_playlist()
-        else:
-            if source:
-                self.program_data.set_playlist_path(source)
-            self.ui.musicPlaylistFolderEdit.setText(self.program_data.get_playlist_path())
-        self.loadMediaContent()
+        self.playlist_loaded = True
         self.ui.playPauseAudioButton.setIcon(QIcon(":/ui/img/play.png"))
-        self.loadPlaylistToUI()
+
+        if sources:
+            self.program_data.set_playlist_paths(sources)
+
+        # Cancel the pending reload, tracks it has already published are dropped below. The cancelled scan
+        # is waited for, as the next scan of the playlist index must not run alongside it
+        if self.playlist_loader:
+            self.playlist_loader.requestInterruption()
+            self.playlist_loader.wait()
+        if self.audio_analyzer:
+            self.audio_analyzer.requestInterruption()
+        self.playlist_watcher.clear()
+
+        self.playlist_model.clear_audios()
+        self.media_window.clear()
+
+        # The playlist folder edit is filled when the PLAYER tab is built
+        if self.ui.isTabBuilt(self.ui.tab_4):
+            self.ui.musicPlaylistFolderEdit.setText("; ".join(self.program_data.get_playlist_paths()))
+
+        # Tracks are scanned and tagged in background and appear in batches, see playlistTracksLoaded()
+        self.playlist_loader = PlaylistLoader(self.program_data, parent=self)
+        self.playlist_loader.tracks_loaded.connect(self.playlistTracksLoaded)
+        self.playlist_loader.finished.connect(self.playlistLoaderFinished)
+        self.playlist_loader.start()
+
+    def playlistLoaderFinished(self) -> None:
+        """
+        Release the playlist loader once it has finished or has been cancelled.
+        """
+
+        loader = self.sender()
+        if loader is self.playlist_loader:
+            self.playlist_loader = None
+
+            # Changes made from now on are applied incrementally, see playlistDirectoriesChanged()
+            if not loader.isInterruptionRequested():
+                self.playlist_watcher.watch(self.program_data.get_playlist_directories())
+
+                # The track to resume is no longer in the playlist, playback starts at the current track
+                self.resume_path = None
+                self.startDeferredPlayback()
+
+                # Batches were filtered as they were added, tracks reindexed meanwhile are filtered once now
+                self.filterPlaylist()
+
+                # Tracks are loaded in folder order
+                if self.playlist_sort_order != "folder" or self.program_data.get_shuffle_seed() is not None:
+                    self.orderPlaylist()
+
+                self.analyzeAudios()
+        loader.deleteLater()
+
+    def analyzeAudios(self) -> None:
+        """
+        Analyze tempo and loudness of the playlist tracks in background, tracks analyzed before are skipped.
+
+        Nothing is done if tracks cannot be decoded, see audio_analysis.is_available(). If the analysis is running
+        already, or a cancelled one is still stopping, the playlist is analyzed again once it has finished,
+        see audioAnalyzerFinished().
+        """
+
+        if not audio_analysis.is_available():
+            return
+        if self.audio_analyzer:
+            self.analyze_audios_again = True
+            return
+
+        self.audio_analyzer = AudioAnalyzer(self.program_data, self.program_data.get_audios(), parent=self)
+        self.audio_analyzer.audios_analyzed.connect(self.audiosAnalyzed)
+        self.audio_analyzer.finished.connect(self.audioAnalyzerFinished)
+        self.audio_analyzer.start(QThread.Priority.LowPriority)
+
+    def audiosAnalyzed(self, paths: List[str]) -> None:
+        """
+        Show the newly analyzed tracks which match the workout tempo, and apply the gain of the current track
+        if it was analyzed while it plays.
+
+        :param paths: Paths of the analyzed tracks.
+        """
+
+        self.filterPlaylist()
+
+        path = self.media_playlist.currentMedia().canonicalUrl().path()
+        if path in paths:
+            self.audio_gain = self.program_data.get_audio_gain(path)
+            self.setVolume()
+
+    def audioAnalyzerFinished(self) -> None:
+        """
+        Release the audio analyzer once it has finished or has been cancelled, and analyze tracks
+        which were added to the playlist meanwhile.
+        """
+
+        analyzer = self.sender()
+        if analyzer is self.audio_analyzer:
+            self.audio_analyzer = None
+
+            if self.analyze_audios_again:
+                self.analyze_audios_again = False
+                self.analyzeAudios()
+        analyzer.deleteLater()
+
+    def playlistDirectoriesChanged(self, directories: List[str]) -> None:
+        """
+        Apply changes of the watched playlist directories to the playlist.
+
+        Tracks are added, removed and renamed in place, adjacent ones at once, so the current track and its position
+        are kept.
+
+        :param directories: Paths of the changed directories.
+        """
+
+        added, removed, renamed = self.program_data.update_playlist_directories(directories)
+
+        indexes = self.program_data.index_of_audios(old_path for old_path, _ in renamed)
+        for old_path, path in renamed:
+            if old_path in indexes:
+                self.replaceTrack(indexes[old_path], path)
+
+        # Removed tracks are removed in runs of adjacent ones from the end, so the indexes of the rest stay valid
+        indexes = sorted(self.program_data.index_of_audios(removed).values())
+        while indexes:
+            last = first = indexes.pop()
+            while indexes and indexes[-1] == first - 1:
+                first = indexes.pop()
+            self.removeTracks(first, last - first + 1)
+
+        # Added tracks are inserted in runs of tracks at the same index from the end, so the indexes of the rest
+        # stay valid as well
+        runs = {}
+        for index, path in self.trackInsertionIndexes(added):
+            runs.setdefault(index, []).append(path)
+        for index in sorted(runs, reverse=True):
+            self.insertTracks(index, runs[index])
+
+        if renamed or added:
+            self.filterPlaylist()
+        if added:
+            self.analyzeAudios()
+
+        # Watch new subdirectories and keep metadata read for the new tracks
+        self.playlist_watcher.watch(self.program_data.get_playlist_directories())
+        self.program_data.save_audio_metadata()
+
+    def trackInsertionIndexes(self, paths: List[str]) -> List[Tuple[int, str]]:
+        """
+        Find the playlist positions of new tracks in the current sort order.
+
+        In folder order the tracks are placed next to the tracks of the same directory in name order, the end
+        of the playlist if their directory has no tracks. New tracks of a shuffled playlist are placed at its end.
+
+        :param paths: Paths of the new tracks.
+        :return: (index, path) tuples in the order the tracks are inserted, the indexes are positions
+                 in the playlist before any of the tracks is inserted.
+        """
+
+        count = self.program_data.audio_count()
+
+        if self.program_data.get_shuffle_seed() is not None:
+            return [(count, path) for path in sorted(paths)]
+        if self.playlist_sort_order != "folder":
+            return self.program_data.sort_insertion_indexes(paths, self.playlist_sort_order)
+
+        # The tracks of the directories of the new tracks are collected in a single pass over the playlist
+        directories = {os.path.dirname(path): [] for path in paths}
+        for index, track in enumerate(self.program_data.get_audios()):
+            tracks = directories.get(os.path.dirname(track))
+            if tracks is not None:
+                tracks.append((track, index))
+
+        # Tracks of new directories go after the tracks added to the end of the last directory
+        indexes = []
+        for path in paths:
+            tracks = directories[os.path.dirname(path)]
+            position = bisect_right(tracks, path, key=lambda track: track[0])
+
+            if position < len(tracks):
+                indexes.append((tracks[position][1], False, path))
+            elif tracks:
+                indexes.append((tracks[-1][1] + 1, False, path))
+            else:
+                indexes.append((count, True, path))
+
+        return [(index, path) for index, _, path in sorted(indexes)]
+
+    def insertTracks(self, index: int, paths: List[str]) -> None:
+        """
+        Insert adjacent tracks into the playlist and the media playlist at once.
+
+        :param index: The index of the first track.
+        :param paths: Paths of the tracks.
+        """
+
+        self.playlist_model.insert_audios(index, paths)
+        self.media_window.tracks_inserted(index, len(paths))
+
+    def removeTracks(self, index: int, count: int = 1) -> None:
+        """
+        Remove adjacent tracks from the playlist and the media playlist at once.
+
+        :param index: The index of the first track.
+        :param count: The number of tracks.
+        """
+
+        self.playlist_model.remove_audio(index, count)
+        self.media_window.tracks_removed(index, count)
+
+    def replaceTrack(self, index: int, path: str) -> None:
+        """
+        Replace a renamed track in the playlist and the media playlist.
+
+        :param index: The index of the track.
+        :param path: The new path of the track.
+        """
+
+        old_path = self.program_data.audio_at(index)
+
+        self.playlist_model.replace_audio(index, path)
+        self.media_window.track_replaced(index)
+        self.playback_recorder.rename_track(old_path, path)
+        self.playback_resume.rename_track(old_path, path)
+
+    def playlistTracksLoaded(self, paths: List[str]) -> None:
+        """
+        Append a batch of tracks published by the playlist loader to the playlist.
+
+        :param paths: Paths of the tracks.
+        """
+
+        # Drop batches of a cancelled reload
+        if self.sender() is not self.playlist_loader:
+            return
+
+        position = self.program_data.audio_count()
+
+        # The proxy model filters only the new rows as they are inserted
+        if self.ui.isTabBuilt(self.ui.tab_4):
+            visible = self.visiblePlaylistAudios()
+            if visible is not None:
+                self.playlist_proxy_model.add_visible_audios(path for path in paths if path in visible)
+
+        # Media content is created only for the tracks which get into the window around the current track
+        self.playlist_model.add_audios(paths)
+        self.media_window.tracks_inserted(position, len(paths))
+
+        resumed = self.resumePlayback(position, paths)
+        if not position and not resumed:
+            self.media_window.set_current(0)
+
+        # With a track to resume, playback waits until it is found, so the first track does not start instead
+        if resumed or not position and self.resume_path is None:
+            self.startDeferredPlayback()
+
+    def startDeferredPlayback(self) -> None:
+        """
+        Start playing if play was pressed while the playlist was loading, see mediaPlayerStateChanged().
+        """
+
+        if self.play_when_loaded and self.program_data.audio_count():
+            self.play_when_loaded = False
+            self.media_player.play()
+            self.ui.playPauseAudioButton.setIcon(QIcon(":/ui/img/pause.png"))
+
+    def resumePlayback(self, position: int, paths: List[str]) -> bool:
+        """
+        Make the track which was playing when the program was last closed current again, at the same position,
+        if it is among the loaded tracks and no other track was chosen since the start.
+
+        :param position: The playlist index of the first loaded track.
+        :param paths: Paths of the loaded tracks.
+        :return: True if playback was resumed, False otherwise.
+        """
+
+        if self.resume_path is None:
+            return False
+
+        # Playback which has started on another track is not interrupted
+        if self.media_player.state() == QMediaPlayer.State.PlayingState:
+            self.resume_path = None
+            return False
+
+        if self.resume_path not in paths:
+            return False
+
+        self.media_window.set_current(position + paths.index(self.resume_path))
+        self.playback_resume.resume(self.resume_position)
+        self.resume_path = None
+
+        return True
+
+    def sortPlaylistComboBoxCurrentIndexChanged(self, index: int) -> None:
+        """
+        Sort the playlist in the sort order selected in the sort combo box.
+
+        :param index: The index of the selected sort order.
+        """
+
+        self.playlist_sort_order = list(SORT_ORDERS)[index]
+        self.program_data.set_playlist_sort_order(self.playlist_sort_order)
+
+        # Sorting turns shuffle off, the playlist is sorted by shuffleAudioButtonToggled()
+        if self.ui.shuffleAudioButton.isChecked():
+            self.ui.shuffleAudioButton.setChecked(False)
+            return
+
+        # A playlist being loaded is sorted once it is complete, see playlistLoaderFinished()
+        if not self.playlist_loader:
+            self.orderPlaylist()
+
+    def orderPlaylist(self) -> None:
+        """
+        Reorder the playlist and the media playlist in the shuffled order if shuffle is on,
+        in the current sort order otherwise.
+
+        Tracks are reordered in memory, from a seeded permutation or from their cached sort keys,
+        so no file is read, media content is created only for the tracks around the current one,
+        and the current track keeps playing.
+        """
+
+        seed = self.program_data.get_shuffle_seed()
+
+        if seed is not None:
+            permutation = self.playlist_model.shuffle_audios(seed)
+        else:
+            permutation = self.playlist_model.sort_audios(self.playlist_sort_order)
+        self.media_window.tracks_reordered(permutation)
+        self.prefetchNextTrack()
+
+    def ensurePlaylistLoaded(self) -> None:
+        """
+        Load the playlist to the media player if it was not loaded yet.
+
+        The playlist is loaded together with the PLAYER tab, player controls use this to load it on demand.
+        """
+
+        if not self.playlist_loaded:
+            self.reloadPlaylist()
 
     def showMessageBox(self, msgbox: QMessageBox, answer: bool = False,
                        expecting_answer: QMessageBox.StandardButton = QMessageBox.StandardButton.Yes) -> Union[bool, None]:
@@ -265,16 +821,43 @@ class WorkItOut(QMainWindow):
         dialog.setFileMode(dialog.DirectoryOnly)
         if dialog.exec_():
             source = dialog.selectedFiles()[0]
-            self.reloadPlaylist(source)
+            self.reloadPlaylist([source])
 
-    def shuffleAudioButtonClicked(self) -> None:
+    def addMusicPlaylistFolderButtonClicked(self) -> None:
+        """
+        Event handler for clicking the add music playlist folder button.
+        Opens a file dialog to select another music playlist folder and reloads the playlist with all folders.
+        Tracks found in several folders are shown only once.
         """
-        Event handler for clicking the shuffle audio button.
-        Shuffles the audio playlist and starts playing.
+
+        dialog = QFileDialog()
+        dialog.setFileMode(dialog.DirectoryOnly)
+        if dialog.exec_():
+            source = dialog.selectedFiles()[0]
+            sources = self.program_data.get_playlist_paths()
+            if source not in sources:
+                self.reloadPlaylist(sources + [source])
+
+    def shuffleAudioButtonToggled(self, checked: bool) -> None:
         """
+        Event handler for toggling the shuffle audio button.
+        Shuffles the audio playlist with a new seed and starts playing, or restores the sort order.
 
-        if self.program_data.get_audios():
-            self.reloadPlaylist(shuffle=True)
+        :param checked: Whether shuffle is on.
+        """
+
+        # The seed is saved, so the same shuffled order is restored on the next start
+        self.program_data.set_shuffle_seed(random.randrange(2 ** 32) if checked else None)
+
+        # A playlist being loaded is ordered once it is complete, see playlistLoaderFinished()
+        if self.playlist_loader:
+            return
+
+        self.orderPlaylist()
+
+        if checked and self.program_data.audio_count() and self.media_player.state() != QMediaPlayer.State.PlayingState:
+            self.resume_path = None
+            self.media_window.set_current(0)
             self.media_player.play()
             self.ui.playPauseAudioButton.setIcon(QIcon(":/ui/img/pause.png"))
 
@@ -285,45 +868,29 @@ class WorkItOut(QMainWindow):
         :param index: Index of the audio to play.
         """
 
-        if os.path.exists(self.program_data.get_audios()[index]):
-            self.media_playlist.setCurrentIndex(index)
+        # Tracks which no longer exist are removed together, and the first existing track after them is played
+        missing = self.program_data.count_missing_audios(index)
+        if missing:
+            self.removeTracks(index, missing)
+            self.ui.musicPlaylistView.setCurrentIndex(
+                self.playlist_proxy_model.mapFromSource(self.playlist_model.index(index))
+            )
+
+        if index < self.program_data.audio_count():
+            # A track chosen while the playlist is loaded is not replaced by the resumed one
+            self.resume_path = None
+            self.media_window.set_current(index)
             self.media_player.play()
             self.ui.playPauseAudioButton.setIcon(QIcon(":/ui/img/pause.png"))
-        else:
-            self.ui.musicPlaylistListWidget.takeItem(index)
-            self.program_data.remove_audio(index)
-            self.ui.musicPlaylistListWidget.setCurrentRow(index)
-            self.setCurrentAudioFromPlaylistListWidget()
 
-    def setCurrentAudioFromPlaylistListWidget(self) -> None:
+    def setCurrentAudioFromPlaylistView(self) -> None:
         """
-        Set the currently selected audio from the playlist widget and play it.
+        Set the currently selected audio from the playlist view and play it.
         """
 
-        index = self.ui.musicPlaylistListWidget.currentRow()
+        index = self.playlist_proxy_model.mapToSource(self.ui.musicPlaylistView.currentIndex()).row()
         self.playAudio(index)
 
-    def updateDuration(self) -> None:
-        """
-        Update the duration labels and progress bar for the currently playing audio.
-        """
-
-        position = milliseconds_to_seconds(self.media_player.position())
-        duration = milliseconds_to_seconds(self.media_player.duration())
-
-        position_str = prettify_time(position)
-        duration_str = prettify_time(duration)
-
-        if (duration > 0 and
-                self.ui.audioDurationProgressBar.maximum() != milliseconds_to_seconds(
-                    self.media_player.duration())):
-            self.ui.audioDurationProgressBar.setMaximum(
-                milliseconds_to_seconds(self.media_player.duration()))
-
-        self.ui.audioPositionLabel.setText(f"{position_str}")
-        self.ui.audioDurationLabel.setText(f"{duration_str}")
-        self.ui.audioDurationProgressBar.setValue(position)
-
     def currentAudioChanged(self) -> None:
         """
         Update UI when the currently playing audio changes.
@@ -331,21 +898,44 @@ class WorkItOut(QMainWindow):
 
         path = self.media_playlist.currentMedia().canonicalUrl().path()
 
-        if os.path.exists(path):
-            audio_name = get_audio_name(path)
+        # A prefetched track is neither stat-ed nor read here, see prefetchNextTrack()
+        metadata = self.track_prefetcher.metadata(path)
+        if metadata is None and os.path.exists(path):
+            metadata = self.program_data.get_audio_metadata(path)
 
-            self.ui.audioDurationProgressBar.setValue(0)
+        if metadata is not None:
+            audio_name = format_audio_name(path, metadata)
+
+            self.playback_progress.reset(metadata.get("duration_seconds") or 0)
+
+            # Tracks are played at the same loudness, the volume slider sets the level of all of them
+            self.audio_gain = self.program_data.get_audio_gain(path)
+            self.setVolume()
 
             if not audio_name:
                 audio_name = "No tracks"
             self.ui.currentAudioLabel.setText(audio_name)
 
+            self.prefetchNextTrack()
+
+    def prefetchNextTrack(self) -> None:
+        """
+        Prepare the track after the current one in background, so the switch to it is immediate.
+        """
+
+        position = self.media_window.current_position() + 1
+
+        if 0 < position < self.program_data.audio_count():
+            self.track_prefetcher.prefetch(self.program_data.audio_at(position))
+
     def playNext(self) -> None:
         """
         Play the next audio in the playlist.
         """
 
-        if self.program_data.get_audios():
+        self.ensurePlaylistLoaded()
+        if self.program_data.audio_count():
+            self.resume_path = None
             self.media_playlist.setCurrentIndex(self.media_playlist.nextIndex())
 
     def playPrevious(self) -> None:
@@ -353,7 +943,9 @@ class WorkItOut(QMainWindow):
         Play the previous audio in the playlist.
         """
 
-        if self.program_data.get_audios():
+        self.ensurePlaylistLoaded()
+        if self.program_data.audio_count():
+            self.resume_path = None
             self.media_playlist.setCurrentIndex(self.media_playlist.previousIndex())
 
     def setVolume(self) -> None:
@@ -362,7 +954,9 @@ class WorkItOut(QMainWindow):
         """
 
         volume = self.ui.volumeSlider.value()
-        self.media_player.setVolume(volume)
+
+        # The volume of the player is linear, the gain of the current track scales it
+        self.media_player.setVolume(min(100, round(volume * 10 ** (self.audio_gain / 20))))
 
         volume_level = volume // 33
 
@@ -374,30 +968,43 @@ class WorkItOut(QMainWindow):
             case 2:
                 self.ui.volumeImage.setPixmap(QPixmap(":/ui/img/speaker-high.png"))
 
-    def loadPlaylistToUI(self) -> None:
+    def filterPlaylist(self) -> None:
+        """
+        Show only the tracks matching the search query and the workout tempo in the playlist view.
+
+        Tracks are looked up in the search index and the analyzed tempos of the program data,
+        so no audio file is read while typing.
+        """
+
+        if not self.ui.isTabBuilt(self.ui.tab_4):
+            return
+
+        self.playlist_proxy_model.set_visible_audios(self.visiblePlaylistAudios())
+
+    def visiblePlaylistAudios(self) -> Union[set, None]:
         """
-        Load the playlist to the user interface.
+        Find the tracks matching the search query and the workout tempo, see filterPlaylist().
 
-        Clears the music playlist list widget and populates it with tracks from the program data.
+        :return: Paths of the matching tracks, or None if every track matches.
         """
-        self.ui.musicPlaylistListWidget.clear()
-        for track in self.program_data.get_audios():
-            track_item = QListWidgetItem(get_audio_name(track))
-            track_item.setIcon(QIcon(":/file/img/music-file.png"))
-            self.ui.musicPlaylistListWidget.addItem(track_item)
 
-    def loadMediaContent(self) -> None:
+        visible = self.program_data.search_audios(self.ui.searchPlaylistEdit.text())
+
+        # The lowest tempo of the spin box stands for any tempo
+        if self.isWorkoutActive():
+            matching = self.program_data.match_tempo_audios(self.ui.matchTempoSpinBox.value())
+            visible = matching if visible is None else visible & matching
+
+        return visible
+
+    def isWorkoutActive(self) -> bool:
         """
-        Load media content into the media playlist.
+        Check whether a workout is going on, i.e. whether the playlist is filtered by a workout tempo.
 
-        Clears the media playlist and adds media content from the program data.
+        :return: True if a tempo is selected in the match tempo spin box, False otherwise.
         """
-        self.media_playlist.clear()
-        for track in self.program_data.get_audios():
-            media = QMediaContent(QUrl.fromLocalFile(track))
-            self.media_playlist.addMedia(media)
 
-        self.media_playlist.setCurrentIndex(0)
+        return self.ui.matchTempoSpinBox.value() != self.ui.matchTempoSpinBox.minimum()
 
     def mediaPlayerStateChanged(self) -> None:
         """
@@ -407,29 +1014,40 @@ class WorkItOut(QMainWindow):
         toggles between playing and pausing the media player and updates the UI accordingly.
         """
 
-        if self.program_data.get_audios():
+        if not self.playlist_loaded:
+            # Start playing as soon as the first tracks are loaded
+            self.play_when_loaded = True
+            self.ensurePlaylistLoaded()
+        if self.program_data.audio_count():
             if self.media_player.state() == QMediaPlayer.State.PlayingState:
                 self.media_player.pause()
                 self.ui.playPauseAudioButton.setIcon(QIcon(":/ui/img/play.png"))
+            elif self.resume_path is not None and self.playlist_loader:
+                # The track to resume is not loaded yet, playback starts once it is, see playlistTracksLoaded()
+                self.play_when_loaded = True
+                self.ui.playPauseAudioButton.setIcon(QIcon(":/ui/img/pause.png"))
             else:
                 self.media_player.play()
                 self.ui.playPauseAudioButton.setIcon(QIcon(":/ui/img/pause.png"))
 
     def selectExistingExerciseComboBoxCurrentIndexChanged(self) -> None:
         """
-        Handle the current text changed event of the "Select Existing Exercise" combo box.
+        Handle the current index changed event of the "Select Existing Exercise" combo box.
 
         This method is triggered when the user selects a different exercise from the combo box.
-        It retrieves the selected exercise by name from the configuration data and fills the exercise form in the UI.
+        It retrieves the selected exercise by id from the configuration data, fills the exercise form in the UI
+        and selects the same exercise in the exercises list.
 
         :return: None
         """
 
-        name = self.ui.selectExistingExerciseComboBox.currentText()
-        exercise_index = self.program_data.index_of_exercise(name)
+        exercise_id = self.ui.selectExistingExerciseComboBox.currentData(ExerciseNamesModel.ExerciseIdRole)
+        exercise_index = self.program_data.index_of_exercise_id(exercise_id)
         if not (exercise_index is None):
             self.fillExerciseForm(self.program_data.exercise_at(exercise_index))
 
+        self.selectExerciseInListView(exercise_id)
+
     def fillExerciseForm(self, exercise: Dict = None) -> None:
         """
         Fill the exercise form with specified exercise data,
@@ -452,13 +1070,28 @@ class WorkItOut(QMainWindow):
             self.ui.exerciseSetsSpinBox.setValue(2)
             self.ui.exerciseDaysEdit.clear()
 
-    def exercisesListWidgetCurrentItemChanged(self) -> None:
+    def exercisesListViewCurrentChanged(self, current: QModelIndex) -> None:
         """
-        Set the current exercise depending on the selected element in the exercisesListWidget.
+        Set the current exercise depending on the selected element in the exercisesListView.
+
+        :param current: The index of the selected element in the exercises list. (QModelIndex)
         """
 
-        index = self.ui.exercisesListWidget.currentRow()
-        self.ui.selectExistingExerciseComboBox.setCurrentIndex(index + 1)
+        exercise_id = current.data(ExerciseNamesModel.ExerciseIdRole)
+        self.ui.selectExistingExerciseComboBox.setCurrentIndex(self.exercise_names_model.row_of_exercise(exercise_id))
+
+    def selectExerciseInListView(self, exercise_id: Union[int, None]) -> None:
+        """
+        Select the exercise with the given id in the exercisesListView, or clear the selection if there is no such exercise.
+
+        :param exercise_id: The id of the exercise to select. (Union[int, None])
+        """
+
+        row = self.exercise_names_model.row_of_exercise(exercise_id)
+        index = self.exercise_names_proxy_model.mapFromSource(self.exercise_names_model.index(row))
+
+        if index != self.ui.exercisesListView.currentIndex():
+            self.ui.exercisesListView.setCurrentIndex(index)
 
     def deleteExerciseButtonClicked(self) -> None:
         """
@@ -467,9 +1100,10 @@ class WorkItOut(QMainWindow):
         :return: None
         """
 
-        if self.ui.exercisesListWidget.currentItem():
-            name = self.ui.exercisesListWidget.currentItem().text()
-            index = self.program_data.index_of_exercise(name)
+        current = self.ui.exercisesListView.currentIndex()
+        if current.isValid():
+            name = current.data()
+            index = self.program_data.index_of_exercise_id(current.data(ExerciseNamesModel.ExerciseIdRole))
 
             is_proceed = self.showMessageBox(
                 msgbox=QMessageBox(
@@ -482,10 +1116,10 @@ class WorkItOut(QMainWindow):
                 answer=True
             )
 
-            if index and is_proceed:
+            if index is not None and is_proceed:
+                exercise_id = self.program_data.exercise_id_at(index)
                 self.program_data.remove_exercise(index)
-
-            self.loadExercisesToUI()
+                self.exerciseRemoved(exercise_id)
 
     def addEditExerciseButtonClicked(self) -> None:
         """
@@ -505,13 +1139,16 @@ class WorkItOut(QMainWindow):
         }
 
         if self.ui.selectExistingExerciseComboBox.currentIndex() != 0:
-            name = self.ui.selectExistingExerciseComboBox.currentText()
-            index = self.program_data.index_of_exercise(name)
+            exercise_id = self.ui.selectExistingExerciseComboBox.currentData(ExerciseNamesModel.ExerciseIdRole)
+            index = self.program_data.index_of_exercise_id(exercise_id)
             self.program_data.update_exercise(index, exercise)
         else:
             try:
                 self.program_data.add_exercise(exercise)
+                index = self.program_data.index_of_exercise(exercise["name"])
+                exercise_id = None if index is None else self.program_data.exercise_id_at(index)
             except ValueError:
+                exercise_id = None
                 self.showMessageBox(
                     msgbox=QMessageBox(
                         QMessageBox.Icon.Critical,
@@ -523,7 +1160,35 @@ class WorkItOut(QMainWindow):
                     )
                 )
 
-        self.loadExercisesToUI()
+        if exercise_id is not None:
+            self.exerciseChanged(exercise_id)
+
+    def exerciseChanged(self, exercise_id: int) -> None:
+        """
+        Update the exercise with the given id in the models of the already built tabs after it was added or edited.
+
+        :param exercise_id: The id of the added or edited exercise.
+        """
+
+        if self.ui.isTabBuilt(self.ui.tab):
+            index = self.program_data.index_of_exercise_id(exercise_id)
+            self.exercises_table_model.set_exercise(exercise_id, self.program_data.exercise_at(index))
+            self.apply_exercises_filter()
+        if self.ui.isTabBuilt(self.ui.tab_3):
+            self.loadExerciseNamesToModel()
+
+    def exerciseRemoved(self, exercise_id: int) -> None:
+        """
+        Remove the exercise with the given id from the models of the already built tabs after it was deleted.
+
+        :param exercise_id: The id of the deleted exercise.
+        """
+
+        if self.ui.isTabBuilt(self.ui.tab):
+            self.exercises_table_model.remove_exercise(exercise_id)
+            self.apply_exercises_filter()
+        if self.ui.isTabBuilt(self.ui.tab_3):
+            self.loadExerciseNamesToModel()
 
     def filterExercises(self) -> None:
         """
@@ -536,51 +1201,53 @@ class WorkItOut(QMainWindow):
         """
         category = self.ui.searchCategoryComboBox.currentText().lower()
 
-        def filter_by_category(query: AnyStr, exercises: List[Dict]) -> List[Dict]:
+        def filter_by_category(query: AnyStr, exercises: List[Tuple[int, Dict]]) -> List[Tuple[int, Dict]]:
             """
             Filter exercises by category.
 
             :param query: Category to filter by.
-            :param exercises: List of exercises to filter.
+            :param exercises: List of (exercise id, exercise) tuples to filter.
             :return: Filtered list of exercises.
             """
 
             return list(filter(lambda exercise:
-                               query in str(exercise[category]).lower() or query == str(exercise[category]).lower(),
+                               query in str(exercise[1][category]).lower() or query == str(exercise[1][category]).lower(),
                                exercises))
 
-        def uniquify(exercises: List[Dict]) -> List[Dict]:
+        def uniquify(exercises: List[Tuple[int, Dict]]) -> List[Tuple[int, Dict]]:
             """
             Remove duplicates from a list of exercises.
 
-            :param exercises: List of exercises.
+            :param exercises: List of (exercise id, exercise) tuples.
             :return: List of exercises with duplicates removed.
             """
 
             exercises_hash_map = {}
 
-            for exercise in exercises:
-                exercises_hash_map[exercise["name"]] = exercise
+            for exercise_id, exercise in exercises:
+                exercises_hash_map[exercise_id] = (exercise_id, exercise)
 
             return list(exercises_hash_map.values())
 
+        self.apply_exercises_filter = self.filterExercises
         self.shown_exercises = []
         self.search_query = self.ui.searchExercisesEdit.text().lstrip()
+        exercises = self.exercises_table_model.exercises()
 
         if self.search_query and self.ui.searchCategoryComboBox.currentIndex() != 0:
             if category in ["days", "type"]:
                 self.shown_exercises = []
                 for item in self.search_query.split(","):
                     item = item.lstrip()
-                    self.shown_exercises.extend(filter_by_category(item, self.program_data.get_exercises()))
+                    self.shown_exercises.extend(filter_by_category(item, exercises))
 
                 self.shown_exercises = uniquify(self.shown_exercises)
             else:
-                self.shown_exercises = filter_by_category(self.search_query, self.program_data.get_exercises())
+                self.shown_exercises = filter_by_category(self.search_query, exercises)
         else:
-            self.shown_exercises = self.program_data.get_exercises()
+            self.shown_exercises = exercises
 
-        self.fillExercisesTable(self.shown_exercises)
+        self.showExercisesInTable(self.shown_exercises)
 
     def showAllExercisesCheckBoxStateChanged(self) -> None:
         """
@@ -588,92 +1255,69 @@ class WorkItOut(QMainWindow):
 
         This method is triggered when the state of the "Show All Exercises" check box is changed.
         It updates the list of shown exercises based on whether the checkbox is checked or unchecked,
-        and fills the exercises table accordingly.
+        and shows them in the exercises table accordingly.
 
         :return: None
         """
 
+        self.apply_exercises_filter = self.showAllExercisesCheckBoxStateChanged
         self.show_all_exercises_check_state = self.ui.showAllExercisesCheckBox.isChecked()
 
         if not self.show_all_exercises_check_state:
-            self.shown_exercises = list(filter(self.filter_exercises_by_day, self.program_data.get_exercises()))
+            self.shown_exercises = list(filter(self.filter_exercises_by_day, self.exercises_table_model.exercises()))
         else:
-            self.shown_exercises = self.program_data.get_exercises()
-        self.fillExercisesTable(self.shown_exercises)
-
-    def fillExercisesTable(self, exercises: list) -> None:
-
-        """
-        Fill the exercises table with the provided list of exercises.
-
-        This method populates the exercises table in the UI with the provided list of exercises.
-        Each exercise is represented as a row in the table, with columns for exercise name, type, reps, sets, and days.
-
-        :param exercises: A list of dictionaries representing exercises, each containing exercise information.
-                          The exercise dictionaries should have keys 'name', 'type', 'reps', 'sets', and 'days'.
-                          Example:
-                          [
-                              {
-                                  'name': 'Push-Ups',
-                                  'type': 'Strength',
-                                  'reps': 10,
-                                  'sets': 3,
-                                  'days': ['Monday', 'Wednesday', 'Friday']
-                              },
-                              {
-                                  'name': 'Squats',
-                                  'type': 'Strength',
-                                  'reps': 8,
-                                  'sets': 4,
-                                  'days': ['Monday', 'Thursday']
-                              },
-                              ...
-                          ]
+            self.shown_exercises = self.exercises_table_model.exercises()
+        self.showExercisesInTable(self.shown_exercises)
+
+    def showExercisesInTable(self, exercises: List[Tuple[int, Dict]]) -> None:
+        """
+        Show only the provided exercises in the exercises table.
+
+        Exercises are filtered by id in the table proxy model, so the table model and its cached sort keys
+        are kept as they are.
+
+        :param exercises: A list of (exercise id, exercise) tuples to show.
 
         :return: None
         """
 
-        # Reset table rows
-        self.ui.exercisesTableWidget.setHorizontalHeaderLabels(self.table_headers)
-        self.ui.exercisesTableWidget.setRowCount(len(exercises))
+        self.exercises_table_proxy_model.set_visible_exercises(exercise_id for exercise_id, _ in exercises)
 
-        for row, exercise in enumerate(exercises):
-            # Add rows to the table
-            self.ui.exercisesTableWidget.setItem(row, 0, QTableWidgetItem(exercise['name']))
-            self.ui.exercisesTableWidget.setItem(row, 1, QTableWidgetItem(exercise['type']))
-            self.ui.exercisesTableWidget.setItem(row, 2, QTableWidgetItem(str(exercise['reps'])))
-            self.ui.exercisesTableWidget.setItem(row, 3, QTableWidgetItem(str(exercise['sets'])))
-            self.ui.exercisesTableWidget.setItem(row, 4, QTableWidgetItem(', '.join(exercise['days'])))
-            item = QTableWidgetItem()
-            item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            self.ui.exercisesTableWidget.setItem(row, 5, item)
+    def loadExercisesToTable(self) -> None:
+        """
+        Load all exercises to the exercises table model and apply the current exercises filter.
 
-    def loadExercisesToUI(self) -> None:
+        :return: None
         """
-        Load exercises data to the user interface.
 
-        This method loads exercise data to the user interface.
-        It filters exercises based on the current day, fills the exercises table,
-        and populates other UI elements such as list widgets and combo boxes with exercise names.
+        self.exercises_table_model.set_exercises(
+            (self.program_data.exercise_id_at(index), exercise)
+            for index, exercise in enumerate(self.program_data.get_exercises())
+        )
+        self.apply_exercises_filter()
+
+    def loadExerciseNamesToModel(self) -> None:
+        """
+        Reset the exercise names model shared by the exercises list and the combo box.
+
+        The selected exercise is kept selected if it still exists.
 
         :return: None
         """
 
-        self.ui.exercisesListWidget.clear()
-        self.ui.exercisesTableWidget.clear()
-        self.ui.selectExistingExerciseComboBox.clear()
-        self.ui.selectExistingExerciseComboBox.addItem("Select existing exercise to edit")
+        exercises = self.program_data.get_exercises()
+        selected_id = self.ui.selectExistingExerciseComboBox.currentData(ExerciseNamesModel.ExerciseIdRole)
 
-        self.shown_exercises = list(filter(self.filter_exercises_by_day, self.program_data.get_exercises()))
-        self.fillExercisesTable(self.shown_exercises)
-        for row, exercise in enumerate(self.program_data.get_exercises()):
-            # Fill other UI elements
-            self.ui.exercisesListWidget.addItem(exercise["name"])
-            self.ui.selectExistingExerciseComboBox.addItem(exercise["name"])
+        self.exercise_names_model.set_exercises(
+            [(self.program_data.exercise_id_at(index), exercise["name"]) for index, exercise in enumerate(exercises)]
+        )
+        self.ui.selectExistingExerciseComboBox.setCurrentIndex(self.exercise_names_model.row_of_exercise(selected_id))
 
 
 if __name__ == "__main__":
+    # Audio analysis workers are started from the executable when the application is frozen
+    multiprocessing.freeze_support()
+
     app = QApplication([])
 
     program_data = ProgramData()
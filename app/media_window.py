@@ -0,0 +1,219 @@
+from contextlib import contextmanager
+from typing import List, Generator
+
+from PyQt5.QtCore import QObject, QUrl
+from PyQt5.QtMultimedia import QMediaContent, QMediaPlaylist
+
+from program_data import ProgramData
+
+
+class MediaWindow(QObject):
+    """
+    Sliding window of the play queue loaded into a media playlist.
+
+    The media playlist holds media content only for the current track, a few tracks before it and a few tracks
+    after it, so its size does not depend on the size of the playlist. The window follows the current track
+    as playback advances, media content is created only for tracks which enter the window. Changes of the play
+    queue are reported to the window with the positions of the changed tracks, so media of the tracks
+    which stay in the window, above all of the current track, is kept and the player does not reload it.
+
+    The play queue of ProgramData is the only list of tracks, the window holds no paths of its own.
+    """
+
+    def __init__(self, playlist: QMediaPlaylist, program_data: ProgramData, before: int = 2, after: int = 5,
+                 parent=None):
+        super().__init__(parent)
+
+        self.__playlist = playlist
+        self.__program_data = program_data
+        self.__before = before
+        self.__after = after
+        self.__start = 0
+        self.__updating = False
+
+        self.__playlist.currentIndexChanged.connect(self.__currentIndexChanged)
+
+    def current_position(self) -> int:
+        """
+        Get the play queue position of the current track.
+
+        :return: The position, or -1 if there is no current track. (int)
+        """
+
+        index = self.__playlist.currentIndex()
+        return -1 if index < 0 else self.__start + index
+
+    def set_current(self, position: int) -> None:
+        """
+        Make a track current, moving the window to it if it is not in the window.
+
+        :param position: The play queue position of the track. (int)
+        """
+
+        if not self.__contains(position):
+            self.__playlist.clear()
+            self.__start = position
+            self.__playlist.addMedia(self.__media(position))
+
+        self.__playlist.setCurrentIndex(position - self.__start)
+
+    def clear(self) -> None:
+        """
+        Empty the window, e.g. after the play queue was cleared.
+        """
+
+        self.__playlist.clear()
+        self.__start = 0
+
+    def tracks_inserted(self, position: int, count: int) -> None:
+        """
+        Update the window after tracks were inserted into the play queue.
+
+        :param position: The position of the first inserted track. (int)
+        :param count: The number of inserted tracks. (int)
+        """
+
+        if position < self.__start:
+            self.__start += count
+        elif self.__contains(position):
+            # Media on the side of the inserted tracks which is away from the current track is dropped,
+            # the inserted tracks are added by the refill as far as they are in the window
+            index = position - self.__start
+            current = self.__playlist.currentIndex()
+
+            with self.__update():
+                if current >= index:
+                    if current > 0:
+                        self.__playlist.removeMedia(0, current - 1)
+                    self.__start += current + count
+                else:
+                    self.__trim_end(index)
+
+        self.__refill()
+
+    def tracks_removed(self, position: int, count: int = 1) -> None:
+        """
+        Update the window after adjacent tracks were removed from the play queue.
+
+        :param position: The position the first removed track had. (int)
+        :param count: The number of removed tracks. (int)
+        """
+
+        first = max(position, self.__start) - self.__start
+        last = min(position + count, self.__start + self.__playlist.mediaCount()) - self.__start
+
+        with self.__update():
+            if first < last:
+                self.__playlist.removeMedia(first, last - 1)
+            if position < self.__start:
+                self.__start = max(position, self.__start - count)
+
+        self.__refill()
+
+    def track_replaced(self, position: int) -> None:
+        """
+        Update the window after the path of a track was changed, e.g. after it was renamed.
+
+        Media of the current track is left as is, the player keeps reading the already opened file. It is replaced
+        once another track is current, see __replace_renamed().
+
+        :param position: The position of the track. (int)
+        """
+
+        if self.__contains(position) and position != self.current_position():
+            with self.__update():
+                self.__replace(position - self.__start)
+
+    def tracks_reordered(self, permutation: List[int]) -> None:
+        """
+        Update the window after the play queue was reordered.
+
+        Only media of the current track is kept, the window is refilled around its new position.
+
+        :param permutation: The previous positions of the tracks in their new order. (List[int])
+        """
+
+        current = self.current_position()
+
+        if current < 0:
+            self.clear()
+        else:
+            index = current - self.__start
+
+            with self.__update():
+                if index + 1 < self.__playlist.mediaCount():
+                    self.__playlist.removeMedia(index + 1, self.__playlist.mediaCount() - 1)
+                if index > 0:
+                    self.__playlist.removeMedia(0, index - 1)
+                self.__start = permutation.index(current)
+
+        self.__refill()
+
+    @contextmanager
+    def __update(self) -> Generator[None, None, None]:
+        # The media playlist reports index shifts of the current track while it is changed, the window is refilled
+        # only once the change is complete
+        self.__updating = True
+        try:
+            yield
+        finally:
+            self.__updating = False
+
+    def __contains(self, position: int) -> bool:
+        return self.__start <= position < self.__start + self.__playlist.mediaCount()
+
+    def __media(self, position: int) -> QMediaContent:
+        return QMediaContent(QUrl.fromLocalFile(self.__program_data.audio_at(position)))
+
+    def __replace(self, index: int) -> None:
+        self.__playlist.removeMedia(index)
+        self.__playlist.insertMedia(index, self.__media(self.__start + index))
+
+    def __replace_renamed(self) -> None:
+        # Media of a track renamed while it was current still has the previous path
+        current = self.__playlist.currentIndex()
+
+        for index in range(self.__playlist.mediaCount()):
+            path = self.__playlist.media(index).canonicalUrl().path()
+            if index != current and path != self.__program_data.audio_at(self.__start + index):
+                self.__replace(index)
+
+    def __trim_end(self, count: int) -> None:
+        if count < self.__playlist.mediaCount():
+            self.__playlist.removeMedia(count, self.__playlist.mediaCount() - 1)
+
+    def __refill(self) -> None:
+        # Move the window edges to the tracks around the current one, or to the first tracks if none is current
+        if self.__updating:
+            return
+
+        with self.__update():
+            current = self.current_position()
+            anchor = current if current >= 0 else self.__start
+            track_count = self.__program_data.audio_count()
+
+            first = max(0, anchor - self.__before) if current >= 0 else anchor
+            last = min(track_count, anchor + self.__after + 1)
+
+            # Drop tracks which left the window
+            self.__trim_end(max(0, last - self.__start))
+            if first > self.__start:
+                count = min(first - self.__start, self.__playlist.mediaCount())
+                if count:
+                    self.__playlist.removeMedia(0, count - 1)
+                self.__start = first
+
+            # Add tracks which entered the window
+            if first < self.__start:
+                self.__playlist.insertMedia(0, [self.__media(position) for position in range(first, self.__start)])
+                self.__start = first
+
+            end = self.__start + self.__playlist.mediaCount()
+            if end < last:
+                self.__playlist.addMedia([self.__media(position) for position in range(end, last)])
+
+            self.__replace_renamed()
+
+    def __currentIndexChanged(self, index: int) -> None:
+        if index >= 0:
+            self.__refill()
@@ -0,0 +1,494 @@
+import time
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QAbstractTableModel, QSortFilterProxyModel, QModelIndex
+from PyQt5.QtGui import QIcon
+
+from typing import List, Tuple, Dict, Union, Any, Iterable
+
+from program_data import ProgramData
+from audioinfo import format_audio_name
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+class ExerciseNamesModel(QAbstractListModel):
+    """
+    List model with exercise names shared by the exercises list and the "Select existing exercise" combo box.
+
+    The first row is a sentinel item which stands for "no exercise selected". Every other row carries
+    the exercise id in ExerciseIdRole, so views can be synchronized by id instead of by row position.
+    """
+
+    ExerciseIdRole = Qt.UserRole + 1
+
+    def __init__(self, sentinel: str = "Select existing exercise to edit", parent=None):
+        super().__init__(parent)
+
+        self.__sentinel = sentinel
+        self.__exercises: List[Tuple[int, str]] = []
+        self.__rows_by_id: Dict[int, int] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self.__exercises) + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = index.row()
+
+        if role == Qt.DisplayRole:
+            return self.__sentinel if row == 0 else self.__exercises[row - 1][1]
+        if role == self.ExerciseIdRole:
+            return None if row == 0 else self.__exercises[row - 1][0]
+
+        return None
+
+    def set_exercises(self, exercises: List[Tuple[int, str]]) -> None:
+        """
+        Replace the model contents with a single model reset.
+
+        :param exercises: A list of (exercise id, exercise name) tuples. (List[Tuple[int, str]])
+        """
+
+        self.beginResetModel()
+        self.__exercises = list(exercises)
+        self.__rows_by_id = {exercise_id: row for row, (exercise_id, _) in enumerate(self.__exercises, start=1)}
+        self.endResetModel()
+
+    def row_of_exercise(self, exercise_id: Union[int, None]) -> int:
+        """
+        Get the model row of the exercise with the given id.
+
+        :param exercise_id: The id of the exercise. (Union[int, None])
+        :return: The row of the exercise, or the sentinel row (0) if the exercise is not in the model. (int)
+        """
+
+        return self.__rows_by_id.get(exercise_id, 0)
+
+
+class ExerciseNamesProxyModel(QSortFilterProxyModel):
+    """
+    Sorted view over ExerciseNamesModel without the sentinel row.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.setSortCaseSensitivity(Qt.CaseInsensitive)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setDynamicSortFilter(True)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if source_row == 0:
+            return False
+
+        return super().filterAcceptsRow(source_row, source_parent)
+
+
+class ExercisesTableModel(QAbstractTableModel):
+    """
+    Table model with exercises shown on the TRAINING tab.
+
+    Sort keys are computed once per row, on the first sort, and are cached until the row is changed,
+    so re-sorting does not touch the exercises again. Every row carries the exercise id in ExerciseIdRole.
+    """
+
+    ExerciseIdRole = Qt.UserRole + 1
+
+    COLUMNS = ["name", "type", "reps", "sets", "days"]
+    HEADERS = ["Name", "Type", "Reps", "Sets", "Days"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.__exercises: List[Tuple[int, Dict]] = []
+        self.__sort_keys: List[Union[Tuple, None]] = []
+        self.__rows_by_id: Dict[int, int] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self.__exercises)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self.COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        exercise_id, exercise = self.__exercises[index.row()]
+
+        if role == Qt.DisplayRole:
+            value = exercise[self.COLUMNS[index.column()]]
+            return ", ".join(value) if isinstance(value, list) else str(value)
+        if role == self.ExerciseIdRole:
+            return exercise_id
+
+        return None
+
+    def exercise_id_at(self, row: int) -> int:
+        """
+        Get the id of the exercise at the given row.
+
+        :param row: The row of the exercise. (int)
+        :return: The id of the exercise. (int)
+        """
+
+        return self.__exercises[row][0]
+
+    def sort_key(self, row: int, column: int) -> Any:
+        """
+        Get the cached sort key of a cell, computing the keys of the whole row if they are not cached.
+
+        :param row: The row of the cell. (int)
+        :param column: The column of the cell. (int)
+        :return: Case-folded text for names and types, numbers for reps and sets,
+                 and weekday ordinals for days. (Any)
+        """
+
+        keys = self.__sort_keys[row]
+        if keys is None:
+            keys = self.__sort_keys[row] = self.__compute_sort_keys(self.__exercises[row][1])
+
+        return keys[column]
+
+    @staticmethod
+    def __compute_sort_keys(exercise: Dict) -> Tuple:
+        # Unknown day names are ordered after sunday
+        days = sorted(
+            WEEKDAYS.index(day.casefold()) if day.casefold() in WEEKDAYS else len(WEEKDAYS)
+            for day in exercise["days"]
+        )
+
+        return (
+            exercise["name"].casefold(),
+            exercise["type"].casefold(),
+            int(exercise["reps"]),
+            int(exercise["sets"]),
+            tuple(days)
+        )
+
+    def exercises(self) -> List[Tuple[int, Dict]]:
+        """
+        Get exercises held by the model.
+
+        :return: A list of (exercise id, exercise) tuples. (List[Tuple[int, Dict]])
+        """
+
+        return list(self.__exercises)
+
+    def set_exercises(self, exercises: Iterable[Tuple[int, Dict]]) -> None:
+        """
+        Replace the model contents with a single model reset.
+
+        :param exercises: (exercise id, exercise) tuples, the exercise dictionaries should have keys
+                          'name', 'type', 'reps', 'sets', and 'days'. (Iterable[Tuple[int, Dict]])
+        """
+
+        self.beginResetModel()
+        self.__exercises = list(exercises)
+        self.__sort_keys = [None] * len(self.__exercises)
+        self.__rows_by_id = {exercise_id: row for row, (exercise_id, _) in enumerate(self.__exercises)}
+        self.endResetModel()
+
+    def set_exercise(self, exercise_id: int, exercise: Dict) -> None:
+        """
+        Update the exercise with the given id, or append it if it is not in the model yet.
+
+        Only sort keys of the changed row are invalidated.
+
+        :param exercise_id: The id of the exercise. (int)
+        :param exercise: The exercise dictionary. (Dict)
+        """
+
+        row = self.__rows_by_id.get(exercise_id)
+
+        if row is None:
+            row = len(self.__exercises)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.__exercises.append((exercise_id, exercise))
+            self.__sort_keys.append(None)
+            self.__rows_by_id[exercise_id] = row
+            self.endInsertRows()
+        else:
+            self.__exercises[row] = (exercise_id, exercise)
+            self.__sort_keys[row] = None
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+
+    def remove_exercise(self, exercise_id: int) -> None:
+        """
+        Remove the exercise with the given id from the model.
+
+        :param exercise_id: The id of the exercise. (int)
+        """
+
+        row = self.__rows_by_id.get(exercise_id)
+        if row is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.__exercises.pop(row)
+        self.__sort_keys.pop(row)
+        self.__rows_by_id = {exercise_id: row for row, (exercise_id, _) in enumerate(self.__exercises)}
+        self.endRemoveRows()
+
+
+class ExercisesTableProxyModel(QSortFilterProxyModel):
+    """
+    Sorted and filtered view over ExercisesTableModel.
+
+    Rows are compared by the cached sort keys of the source model, and filtered by a set of visible exercise ids.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.__visible_ids: Union[set, None] = None
+        self.setDynamicSortFilter(True)
+
+    def set_visible_exercises(self, exercise_ids: Union[Iterable[int], None]) -> None:
+        """
+        Show only exercises with the given ids.
+
+        :param exercise_ids: Ids of exercises to show, or None to show all exercises. (Union[Iterable[int], None])
+        """
+
+        self.__visible_ids = None if exercise_ids is None else set(exercise_ids)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self.__visible_ids is None:
+            return True
+
+        return self.sourceModel().exercise_id_at(source_row) in self.__visible_ids
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        model = self.sourceModel()
+
+        return model.sort_key(left.row(), left.column()) < model.sort_key(right.row(), right.column())
+
+
+class PlaylistModel(QAbstractListModel):
+    """
+    List model over the play queue of the program data, shown on the PLAYER tab.
+
+    Changes of the play queue are made through the model, so views are updated row by row. Display names are resolved
+    from the cached metadata only when a view asks for them, i.e. when rows become visible, and are memoized,
+    and all rows share a single icon, so the cost of the model does not grow with the size of the playlist.
+    Every row carries the path of its track in PathRole.
+    """
+
+    PathRole = Qt.UserRole + 1
+
+    def __init__(self, program_data: ProgramData, parent=None):
+        super().__init__(parent)
+
+        self.__program_data = program_data
+        self.__names: Dict[str, str] = {}
+        self.__icon = QIcon(":/file/img/music-file.png")
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return self.__program_data.audio_count()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        path = self.__program_data.audio_at(index.row())
+
+        if role == Qt.DisplayRole:
+            name = self.__names.get(path)
+            if name is None:
+                name = self.__names[path] = format_audio_name(path, self.__program_data.get_audio_metadata(path))
+            return name
+        if role == Qt.DecorationRole:
+            return self.__icon
+        if role == Qt.ToolTipRole:
+            return self.__playback_tooltip(path)
+        if role == self.PathRole:
+            return path
+
+        return None
+
+    def __playback_tooltip(self, path: str) -> str:
+        # Playback statistics change while tracks play, so they are read whenever a tooltip is shown
+        stats = self.__program_data.get_playback_stats(path)
+        last_played = "never"
+        if stats["last_played"] is not None:
+            last_played = time.strftime("%Y-%m-%d %H:%M", time.localtime(stats["last_played"]))
+
+        return (f"Plays: {stats['plays']} ({stats['workout_plays']} during workouts)\n"
+                f"Skips: {stats['skips']}\nLast played: {last_played}")
+
+    def path_at(self, row: int) -> str:
+        """
+        Get the path of the track at the given row.
+
+        :param row: The row of the track. (int)
+        :return: The path of the track. (str)
+        """
+
+        return self.__program_data.audio_at(row)
+
+    def clear_audios(self) -> None:
+        """
+        Remove all tracks from the play queue.
+        """
+
+        self.beginResetModel()
+        self.__program_data.clear_audios()
+        self.__names.clear()
+        self.endResetModel()
+
+    def add_audios(self, paths: List[str]) -> None:
+        """
+        Append tracks to the play queue.
+
+        :param paths: Paths of the tracks. (List[str])
+        """
+
+        if not paths:
+            return
+
+        row = self.rowCount()
+        self.beginInsertRows(QModelIndex(), row, row + len(paths) - 1)
+        self.__program_data.add_audios(paths)
+        self.endInsertRows()
+
+    def insert_audios(self, row: int, paths: List[str]) -> None:
+        """
+        Insert adjacent tracks into the play queue at once.
+
+        :param row: The row to insert the first track at. (int)
+        :param paths: Paths of the tracks. (List[str])
+        """
+
+        if not paths:
+            return
+
+        self.beginInsertRows(QModelIndex(), row, row + len(paths) - 1)
+        self.__program_data.insert_audios(row, paths)
+        self.endInsertRows()
+
+    def remove_audio(self, row: int, count: int = 1) -> None:
+        """
+        Remove a track from the play queue, or several adjacent ones at once.
+
+        :param row: The row of the track. (int)
+        :param count: The number of tracks. (int)
+        """
+
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        for removed in range(row, row + count):
+            self.__names.pop(self.path_at(removed), None)
+        self.__program_data.remove_audio(row, count)
+        self.endRemoveRows()
+
+    def replace_audio(self, row: int, path: str) -> None:
+        """
+        Replace a track of the play queue, e.g. after it was renamed.
+
+        :param row: The row of the track. (int)
+        :param path: The new path of the track. (str)
+        """
+
+        self.__names.pop(self.path_at(row), None)
+        self.__program_data.replace_audio(row, path)
+        self.dataChanged.emit(self.index(row), self.index(row))
+
+    def shuffle_audios(self, seed: int) -> List[int]:
+        """
+        Shuffle the play queue, see ProgramData.shuffle_playlist(). Selected rows of the views follow their tracks.
+
+        :param seed: The seed of the random order. (int)
+        :return: The previous rows of the tracks in their new order. (List[int])
+        """
+
+        self.layoutAboutToBeChanged.emit()
+        permutation = self.__program_data.shuffle_playlist(seed)
+        self.__remap_rows(permutation)
+
+        return permutation
+
+    def sort_audios(self, order: str) -> List[int]:
+        """
+        Sort the play queue, see ProgramData.sort_playlist(). Selected rows of the views follow their tracks.
+
+        :param order: One of the playlist_sort.SORT_ORDERS. (str)
+        :return: The previous rows of the tracks in their new order. (List[int])
+        """
+
+        self.layoutAboutToBeChanged.emit()
+        permutation = self.__program_data.sort_playlist(order)
+        self.__remap_rows(permutation)
+
+        return permutation
+
+    def __remap_rows(self, permutation: List[int]) -> None:
+        # Move persistent indexes to the new rows of their tracks and finish the layout change
+        rows = [0] * len(permutation)
+        for row, previous_row in enumerate(permutation):
+            rows[previous_row] = row
+
+        previous_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(previous_indexes, [self.index(rows[index.row()]) for index in previous_indexes])
+        self.layoutChanged.emit()
+
+
+class PlaylistProxyModel(QSortFilterProxyModel):
+    """
+    Filtered view over PlaylistModel, filtered by a set of visible track paths.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.__visible_paths: Union[set, None] = None
+
+    def set_visible_audios(self, paths: Union[Iterable[str], None]) -> None:
+        """
+        Show only tracks with the given paths.
+
+        :param paths: Paths of tracks to show, or None to show all tracks. (Union[Iterable[str], None])
+        """
+
+        if paths is None and self.__visible_paths is None:
+            return
+
+        self.__visible_paths = None if paths is None else set(paths)
+        self.invalidateFilter()
+
+    def add_visible_audios(self, paths: Iterable[str]) -> None:
+        """
+        Show tracks with the given paths as well, before they are added to the source model. Only the added rows
+        are filtered then, the rows shown already are not filtered again.
+
+        :param paths: Paths of tracks to show. (Iterable[str])
+        """
+
+        if self.__visible_paths is not None:
+            self.__visible_paths.update(paths)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self.__visible_paths is None:
+            return True
+
+        return self.sourceModel().path_at(source_row) in self.__visible_paths
@@ -0,0 +1,360 @@
+import os
+import re
+import struct
+from typing import Dict, List, Tuple, Union
+
+# Bytes read after the ID3v2 tag to find the first MPEG frames, enough for several frames at any bitrate
+SCAN_SIZE = 16 * 1024
+
+# ID3v2 text frames read for each tag version
+TEXT_FRAMES = {
+    2: {b"TT2": "title", b"TP1": "artist", b"TAL": "album"},
+    3: {b"TIT2": "title", b"TPE1": "artist", b"TALB": "album"},
+    4: {b"TIT2": "title", b"TPE1": "artist", b"TALB": "album"}
+}
+TEXT_ENCODINGS = ["latin-1", "utf-16", "utf-16-be", "utf-8"]
+FRAME_ID_PATTERNS = {3: re.compile(rb"[A-Z0-9]{3}"), 4: re.compile(rb"[A-Z0-9]{4}")}
+
+BITRATES = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (2, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+}
+SAMPLE_RATES = {1: [44100, 48000, 32000], 2: [22050, 24000, 16000], 2.5: [11025, 12000, 8000]}
+MONO = 3
+
+
+class UnsupportedFile(Exception):
+    """
+    Raised when the file needs a full parser, e.g. unsynchronised or compressed tags.
+    """
+
+
+def __synchsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def __read_text(data: bytes) -> str:
+    # First value of a text frame, values are separated by null characters
+    if not data or data[0] >= len(TEXT_ENCODINGS):
+        raise UnsupportedFile("empty text frame or unknown text encoding")
+
+    try:
+        text = data[1:].decode(TEXT_ENCODINGS[data[0]])
+    except UnicodeDecodeError:
+        raise UnsupportedFile("invalid text")
+
+    return text.split("\x00", 1)[0]
+
+
+def __read_id3v2_frames(tag: bytes, version: int) -> Dict[str, str]:
+    frames = TEXT_FRAMES[version]
+    id_size, header_size = (3, 6) if version == 2 else (4, 10)
+    frame_id_pattern = FRAME_ID_PATTERNS[id_size]
+    metadata = {}
+    position = 0
+
+    while position + header_size <= len(tag):
+        header = tag[position:position + header_size]
+
+        # Padding
+        if header[0] == 0:
+            break
+        if not frame_id_pattern.fullmatch(header[:id_size]):
+            raise UnsupportedFile("invalid frame id")
+
+        frame_id = header[:id_size]
+        if version == 2:
+            size = int.from_bytes(header[3:6], "big")
+            flags = 0
+        elif version == 3:
+            size = int.from_bytes(header[4:8], "big")
+            flags = int.from_bytes(header[8:10], "big")
+        else:
+            if any(byte & 0x80 for byte in header[4:8]):
+                # Sizes written without synchsafe integers (e.g. by old iTunes versions)
+                raise UnsupportedFile("not synchsafe frame size")
+            size = __synchsafe(header[4:8])
+            flags = int.from_bytes(header[8:10], "big")
+
+        body = tag[position + header_size:position + header_size + size]
+        if len(body) != size:
+            raise UnsupportedFile("truncated frame")
+        position += header_size + size
+
+        key = frames.get(frame_id)
+        if key is None:
+            continue
+        if key in metadata:
+            raise UnsupportedFile("duplicate frame")
+
+        if version == 3:
+            if flags & 0x00C0:
+                raise UnsupportedFile("compressed or encrypted frame")
+            if flags & 0x0020:
+                body = body[1:]
+        elif version == 4:
+            if flags & 0x000E:
+                raise UnsupportedFile("compressed, encrypted or unsynchronised frame")
+            if flags & 0x0040:
+                body = body[1:]
+            if flags & 0x0001:
+                body = body[4:]
+
+        metadata[key] = __read_text(body)
+
+    return metadata
+
+
+def __read_id3v1(data: bytes) -> Dict[str, str]:
+    # The tag is in the last 128 bytes, a few more bytes are searched for tags written too short
+    index = data.find(b"TAG")
+    ape_index = data.find(b"APETAGEX")
+
+    if index == -1 or (ape_index != -1 and index == ape_index + 5) or not 124 <= len(data) - index <= 128:
+        return {}
+
+    metadata = {}
+
+    for key, start in (("title", 3), ("artist", 33), ("album", 63)):
+        value = data[index + start:index + start + 30].split(b"\x00")[0].strip().decode("latin-1")
+        if value:
+            metadata[key] = value
+
+    return metadata
+
+
+def __parse_frame(data: bytes, position: int, complete: bool) -> Union[Tuple[int, int, int, bool, float], None]:
+    # Parse the MPEG frame header at the position, returning frame offset, frame length, bitrate,
+    # whether a VBR header was found and the length from the VBR header (-1 if unknown)
+    if position + 4 > len(data):
+        if complete:
+            return
+        raise UnsupportedFile("need more data")
+
+    b1, b2, b3 = data[position + 1], data[position + 2], data[position + 3]
+    if data[position] != 0xFF or b1 & 0xE0 != 0xE0:
+        return
+
+    version_bits, layer_bits = (b1 >> 3) & 3, (b1 >> 1) & 3
+    bitrate_index, rate_index, padding = b2 >> 4, (b2 >> 2) & 3, (b2 >> 1) & 1
+    mode = b3 >> 6
+
+    if version_bits == 1 or layer_bits == 0 or rate_index == 3 or bitrate_index in (0, 15):
+        return
+
+    version = [2.5, None, 2, 1][version_bits]
+    layer = 4 - layer_bits
+    bitrate = BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = SAMPLE_RATES[version][rate_index]
+
+    if layer == 1:
+        frame_size, slot = 384, 4
+    elif version >= 2 and layer == 3:
+        frame_size, slot = 576, 1
+    else:
+        frame_size, slot = 1152, 1
+
+    frame_length = ((frame_size // 8 * bitrate) // sample_rate + padding) * slot
+
+    if layer == 3:
+        vbr_header = __parse_vbr_header(data, position, version, mode, frame_size, sample_rate, complete)
+        if vbr_header is not None:
+            return position, frame_length, bitrate, True, vbr_header
+
+    return position, frame_length, bitrate, False, -1
+
+
+def __require(data: bytes, end: int, complete: bool) -> bool:
+    # Check whether the data reaches the end offset, the scanned data may end before the file does
+    if end <= len(data):
+        return True
+    if complete:
+        return False
+    raise UnsupportedFile("need more data")
+
+
+def __parse_vbr_header(data: bytes, position: int, version: float, mode: int, frame_size: int, sample_rate: int,
+                       complete: bool) -> Union[float, None]:
+    # Xing / Info header
+    offset = position + ((36 if mode != MONO else 21) if version == 1 else (21 if mode != MONO else 13))
+
+    if __require(data, offset + 8, complete) and data[offset:offset + 4] in (b"Xing", b"Info"):
+        flags = int.from_bytes(data[offset + 4:offset + 8], "big")
+        offset += 8
+        frames = -1
+
+        for flag, size in ((1, 4), (2, 4), (4, 100), (8, 4)):
+            if flags & flag:
+                if not __require(data, offset + size, complete):
+                    return __parse_vbri_header(data, position, frame_size, sample_rate, complete)
+                if flag == 1:
+                    frames = int.from_bytes(data[offset:offset + 4], "big")
+                offset += size
+
+        if frames == -1:
+            return -1
+
+        samples = frame_size * frames
+        delay, padding = __parse_lame_header(data, offset, complete)
+
+        return max(0, samples - delay - padding) / sample_rate
+
+    return __parse_vbri_header(data, position, frame_size, sample_rate, complete)
+
+
+def __parse_lame_header(data: bytes, offset: int, complete: bool) -> Tuple[int, int]:
+    # Encoder delay and padding from the LAME extension of the Xing header
+    if not __require(data, offset + 20, complete):
+        return 0, 0
+
+    version = data[offset:offset + 20]
+    if not version.startswith((b"LAME", b"L3.99")):
+        return 0, 0
+
+    # Version strings look like "LAME3.99r", see http://wiki.hydrogenaud.io/index.php?title=LAME_version_string
+    version = version.lstrip(b"EMAL")
+    major, version = version[:1], version[1:].lstrip(b".")
+    minor = re.match(rb"\d*", version).group()
+    version = version[len(minor):]
+
+    if not (major.isdigit() and minor):
+        return 0, 0
+
+    # The extended header was added in the 3.90 cycle
+    major, minor = int(major), int(minor)
+    if (major, minor) < (3, 90) or ((major, minor) == (3, 90) and version[-11:-10] == b"(") or len(version) < 11:
+        return 0, 0
+
+    offset += 9
+    if not __require(data, offset + 27, complete) or data[offset] >> 4 != 0:
+        return 0, 0
+
+    delay_padding = int.from_bytes(data[offset + 12:offset + 15], "big")
+    return delay_padding >> 12, delay_padding & 0xFFF
+
+
+def __parse_vbri_header(data: bytes, position: int, frame_size: int, sample_rate: int,
+                        complete: bool) -> Union[float, None]:
+    offset = position + 36
+
+    if not __require(data, offset + 26, complete) or not data.startswith(b"VBRI", offset):
+        return
+    if int.from_bytes(data[offset + 4:offset + 6], "big") != 1:
+        return
+
+    frames = int.from_bytes(data[offset + 14:offset + 18], "big")
+    entries, entry_size = struct.unpack(">H2xH", data[offset + 18:offset + 24])
+
+    if not __require(data, offset + 26 + entries * entry_size, complete) or entry_size not in (2, 4):
+        return
+
+    return frame_size * frames / sample_rate
+
+
+def __read_duration(data: bytes, audio_offset: int, file_size: int) -> float:
+    # Find the first MPEG frame the same way mutagen does: a sync is accepted if its frame has a VBR header,
+    # or if it is followed by enough valid frames
+    complete = audio_offset + len(data) >= file_size
+    first_frame = None
+    position = data.find(b"\xff")
+
+    while position != -1 and position + 1 < len(data):
+        if data[position + 1] & 0xE0 == 0xE0:
+            frames: List[Tuple[int, int, int, bool, float]] = []
+            frame_position = position
+
+            for _ in range(4):
+                frame = __parse_frame(data, frame_position, complete)
+                if frame is None:
+                    break
+
+                frames.append(frame)
+                if frame[3]:
+                    break
+                frame_position += frame[1]
+
+            if len(frames) >= 2 and first_frame is None:
+                first_frame = frames[0]
+
+            if frames and frames[-1][3]:
+                first_frame = frames[-1]
+                break
+
+            if len(frames) >= 4:
+                first_frame = frames[0]
+                break
+
+        position = data.find(b"\xff", position + 1)
+
+    if first_frame is None:
+        raise UnsupportedFile("no MPEG frames found")
+
+    frame_offset, _, bitrate, _, length = first_frame
+    if length != -1:
+        return length
+
+    # No VBR header, estimate the length from the file size
+    return 8 * (file_size - audio_offset - frame_offset) / bitrate
+
+
+def read_mp3_metadata(path: str) -> Union[Dict, None]:
+    """
+    Read title, artist, album and duration of an MP3 file from its ID3 tags and its first MPEG frames only.
+
+    Only the ID3v2 tag, a few kilobytes after it and the ID3v1 tag at the end of the file are read.
+    The duration is taken from the Xing, Info or VBRI header, or estimated from the bitrate of the first frame.
+    Results match mutagen's MP3 and EasyID3. Files which need a full parser, e.g. with unsynchronised,
+    compressed or malformed tags, are not read.
+
+    :param path: The path of the MP3 file. (str)
+    :return: A dictionary with "title", "artist", "album" and "duration_seconds" keys,
+             or None if the file should be read with mutagen instead. (Union[Dict, None])
+    """
+
+    try:
+        with open(path, "rb") as audio_file:
+            file_size = os.fstat(audio_file.fileno()).st_size
+            header = audio_file.read(10)
+            metadata = {}
+            audio_offset = 0
+
+            if header[:3] == b"ID3":
+                # Unsupported versions, unsynchronisation, v2.2 compression, v2.3 and v2.4 extended headers
+                if len(header) != 10 or header[3] not in TEXT_FRAMES or header[5] & 0xC0:
+                    return
+
+                size = __synchsafe(header[6:10])
+                metadata = __read_id3v2_frames(audio_file.read(size), header[3])
+                audio_offset = 10 + size
+
+                # Some encoders write several tags in a row, only the first one is read
+                header = audio_file.read(10)
+                while header[:3] == b"ID3" and len(header) == 10 and __synchsafe(header[6:10]):
+                    audio_offset += 10 + __synchsafe(header[6:10])
+                    audio_file.seek(audio_offset)
+                    header = audio_file.read(10)
+
+            audio_file.seek(audio_offset)
+            data = audio_file.read(SCAN_SIZE)
+
+            audio_file.seek(max(0, file_size - 131))
+            id3v1 = audio_file.read(131)
+
+        duration = __read_duration(data, audio_offset, file_size)
+    except (OSError, UnsupportedFile):
+        return
+
+    # ID3v1 values are used for the frames missing in the ID3v2 tag
+    for key, value in __read_id3v1(id3v1).items():
+        metadata.setdefault(key, value)
+
+    return {
+        "title": metadata.get("title"),
+        "artist": metadata.get("artist"),
+        "album": metadata.get("album"),
+        "duration_seconds": duration
+    }
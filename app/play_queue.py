@@ -0,0 +1,141 @@
+import itertools
+import random
+from typing import List, AnyStr, Iterable, Dict
+
+
+class PlayQueue:
+    """
+    Play order of the playlist tracks.
+
+    Tracks are kept in a table by ids which are given in the order the tracks were added. The play order
+    is a list of track ids, so shuffling and sorting only rebuild the list, and the queue can be mapped
+    to positions of the previous order for the views. Removing tracks drops them from the table without renumbering
+    the others, so a shuffle of the same tracks with the same seed gives the same order, whatever was removed before.
+
+    Positions are the rows of the playlist view, which are contiguous, so removing tracks from the play order
+    shifts the positions after them. Adjacent tracks are removed at once, see remove().
+
+    The queue is a sequence of track paths in play order.
+    """
+
+    def __init__(self):
+        self.__tracks: Dict[int, str] = {}
+        self.__order: List[int] = []
+        self.__track_ids = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.__order)
+
+    def __getitem__(self, position: int) -> str:
+        return self.__tracks[self.__order[position]]
+
+    def paths(self) -> List[str]:
+        """
+        Get the paths of the tracks in play order.
+
+        :return: A list of track paths. (List[str])
+        """
+
+        return [self.__tracks[track_id] for track_id in self.__order]
+
+    def positions(self, paths: Iterable[AnyStr]) -> Dict[str, int]:
+        """
+        Find the play positions of many tracks in a single pass over the queue.
+
+        :param paths: Paths of the tracks. (Iterable[AnyStr])
+        :return: A dictionary of the positions by path, tracks which are not in the queue are left out.
+                 (Dict[str, int])
+        """
+
+        paths = set(paths)
+
+        return {self.__tracks[track_id]: position for position, track_id in enumerate(self.__order)
+                if self.__tracks[track_id] in paths}
+
+    def clear(self) -> None:
+        """
+        Remove all tracks.
+        """
+
+        self.__tracks = {}
+        self.__order = []
+        self.__track_ids = itertools.count()
+
+    def extend(self, paths: Iterable[AnyStr]) -> None:
+        """
+        Append tracks to the end of the play order.
+
+        :param paths: Paths of the tracks. (Iterable[AnyStr])
+        """
+
+        for path in paths:
+            track_id = next(self.__track_ids)
+            self.__tracks[track_id] = path
+            self.__order.append(track_id)
+
+    def insert(self, position: int, paths: Iterable[AnyStr]) -> None:
+        """
+        Insert adjacent tracks into the play order at once, with a single shift of the tracks after them.
+
+        :param position: The position to insert the first track at. (int)
+        :param paths: Paths of the tracks. (Iterable[AnyStr])
+        """
+
+        track_ids = []
+        for path in paths:
+            track_id = next(self.__track_ids)
+            self.__tracks[track_id] = path
+            track_ids.append(track_id)
+
+        self.__order[position:position] = track_ids
+
+    def remove(self, position: int, count: int = 1) -> None:
+        """
+        Remove adjacent tracks at once, with a single shift of the tracks after them.
+
+        :param position: The position of the first track. (int)
+        :param count: The number of tracks. (int)
+        """
+
+        for track_id in self.__order[position:position + count]:
+            del self.__tracks[track_id]
+        del self.__order[position:position + count]
+
+    def replace(self, position: int, path: AnyStr) -> None:
+        """
+        Replace the path of a track, e.g. after it was renamed.
+
+        :param position: The position of the track. (int)
+        :param path: The new path of the track. (AnyStr)
+        """
+
+        self.__tracks[self.__order[position]] = path
+
+    def permute(self, permutation: List[int]) -> None:
+        """
+        Reorder the tracks.
+
+        :param permutation: The previous positions of the tracks in their new order. (List[int])
+        """
+
+        self.__order = [self.__order[position] for position in permutation]
+
+    def shuffle(self, seed: int) -> List[int]:
+        """
+        Reorder the tracks randomly.
+
+        The same seed gives the same order of the same tracks added in the same order, whatever the current order is.
+
+        :param seed: The seed of the random order. (int)
+        :return: The previous positions of the tracks in their new order. (List[int])
+        """
+
+        positions = {track_id: position for position, track_id in enumerate(self.__order)}
+        # Tracks are shuffled in the order they were added, which the table keeps
+        order = list(self.__tracks)
+        random.Random(seed).shuffle(order)
+
+        permutation = [positions[track_id] for track_id in order]
+        self.__order = order
+
+        return permutation
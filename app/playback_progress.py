@@ -0,0 +1,66 @@
+from PyQt5.QtCore import QObject
+from PyQt5.QtMultimedia import QMediaPlayer
+from PyQt5.QtWidgets import QLabel, QProgressBar
+
+from functime import prettify_time, milliseconds_to_seconds
+
+
+class PlaybackProgress(QObject):
+    """
+    Playback position and duration of the current track, shown by two labels and a progress bar.
+
+    The player reports its position many times per second, but the widgets are updated only when the displayed
+    second changes. The duration of a track is known from its cached metadata as soon as the track is current,
+    see reset(), and is replaced by the duration reported by the player, so it is not queried on every update.
+    """
+
+    def __init__(self, player: QMediaPlayer, position_label: QLabel, duration_label: QLabel,
+                 progress_bar: QProgressBar, parent=None):
+        super().__init__(parent)
+
+        self.__position_label = position_label
+        self.__duration_label = duration_label
+        self.__progress_bar = progress_bar
+        self.__position = -1
+        self.__duration = -1
+
+        player.positionChanged.connect(self.__positionChanged)
+        player.durationChanged.connect(self.__durationChanged)
+
+    def reset(self, duration_seconds: float = 0) -> None:
+        """
+        Show the start of a new current track.
+
+        :param duration_seconds: The duration of the track, e.g. from its metadata, or 0 if it is not known. (float)
+        """
+
+        self.__set_duration(int(duration_seconds))
+        self.__position = -1
+        self.__set_position(0)
+
+    def __positionChanged(self, position: int) -> None:
+        self.__set_position(milliseconds_to_seconds(position))
+
+    def __durationChanged(self, duration: int) -> None:
+        if duration > 0:
+            self.__set_duration(milliseconds_to_seconds(duration))
+
+    def __set_position(self, seconds: int) -> None:
+        if seconds == self.__position:
+            return
+
+        self.__position = seconds
+        self.__position_label.setText(prettify_time(seconds))
+        self.__progress_bar.setValue(seconds)
+
+    def __set_duration(self, seconds: int) -> None:
+        if seconds == self.__duration:
+            return
+
+        self.__duration = seconds
+        self.__duration_label.setText(prettify_time(seconds))
+
+        # A zero maximum would turn the progress bar into a busy indicator
+        if seconds > 0:
+            self.__progress_bar.setMaximum(seconds)
+            self.__progress_bar.setValue(max(self.__position, 0))
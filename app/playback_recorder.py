@@ -0,0 +1,96 @@
+from typing import Callable
+
+from PyQt5.QtCore import QObject
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+
+from program_data import ProgramData
+from playback_stats import PLAY_EVENT, SKIP_EVENT
+
+# A track counts as played once half of it or this much of it was listened to, as skipped if it is left before
+PLAYED_SHARE = 0.5
+PLAYED_MILLISECONDS = 4 * 60 * 1000
+
+
+class PlaybackRecorder(QObject):
+    """
+    Recorder of playback events from the player signals to the playback statistics of the program data.
+
+    A track is recorded when the player leaves it, as played if it reached its end or was listened to long enough,
+    as skipped otherwise. Tracks which never started playing are not recorded. Events are written in batches
+    by the playback statistics of the program data, see ProgramData.save_playback_stats().
+    """
+
+    def __init__(self, player: QMediaPlayer, program_data: ProgramData, is_workout: Callable[[], bool], parent=None):
+        super().__init__(parent)
+
+        self.__program_data = program_data
+        self.__is_workout = is_workout
+        self.__path = ""
+        self.__started = False
+        self.__workout = False
+        self.__ended = False
+        self.__position = 0
+        self.__duration = 0
+
+        player.currentMediaChanged.connect(self.__currentMediaChanged)
+        player.stateChanged.connect(self.__stateChanged)
+        player.mediaStatusChanged.connect(self.__mediaStatusChanged)
+        player.positionChanged.connect(self.__positionChanged)
+        player.durationChanged.connect(self.__durationChanged)
+
+    def finish(self) -> None:
+        """
+        Record the current track if it was listened to long enough, e.g. when the application is closed.
+        Leaving a track this way is not a skip.
+        """
+
+        if self.__listened():
+            self.__record()
+        self.__started = False
+
+    def rename_track(self, old_path: str, new_path: str) -> None:
+        """
+        Follow the rename of a track, the media of the current track keeps its previous path while it plays.
+
+        :param old_path: The previous path of the track. (str)
+        :param new_path: The new path of the track. (str)
+        """
+
+        if self.__path == old_path:
+            self.__path = new_path
+
+    def __listened(self) -> bool:
+        return self.__started and (
+            self.__ended or self.__position >= PLAYED_MILLISECONDS
+            or 0 < self.__duration and self.__position >= PLAYED_SHARE * self.__duration
+        )
+
+    def __record(self) -> None:
+        if self.__started:
+            event = PLAY_EVENT if self.__listened() else SKIP_EVENT
+            self.__program_data.record_playback(self.__path, event, self.__workout)
+
+    def __currentMediaChanged(self, media: QMediaContent) -> None:
+        self.__record()
+
+        self.__path = media.canonicalUrl().path()
+        self.__started = False
+        self.__ended = False
+        self.__position = 0
+        self.__duration = 0
+
+    def __stateChanged(self, state: QMediaPlayer.State) -> None:
+        if state == QMediaPlayer.State.PlayingState and self.__path and not self.__started:
+            self.__started = True
+            self.__workout = self.__is_workout()
+
+    def __mediaStatusChanged(self, status: QMediaPlayer.MediaStatus) -> None:
+        if status == QMediaPlayer.MediaStatus.EndOfMedia:
+            self.__ended = True
+
+    def __positionChanged(self, position: int) -> None:
+        if self.__started:
+            self.__position = max(self.__position, position)
+
+    def __durationChanged(self, duration: int) -> None:
+        self.__duration = duration
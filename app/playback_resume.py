@@ -0,0 +1,92 @@
+from typing import Union
+
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+
+from program_data import ProgramData
+
+# The resume point is written at most this often while a track plays, in milliseconds
+RESUME_SAVE_INTERVAL = 5000
+
+
+class PlaybackResume(QObject):
+    """
+    Resume point of the playback, i.e. the current track and the position in it, kept by the program data.
+
+    The player reports its position many times per second. The resume point is updated in memory on every report,
+    but written to file at most once per RESUME_SAVE_INTERVAL and on save(), so the write never competes with
+    playback or the user interface. Nothing is written while the playback is paused.
+    """
+
+    def __init__(self, player: QMediaPlayer, program_data: ProgramData, parent=None):
+        super().__init__(parent)
+
+        self.__player = player
+        self.__program_data = program_data
+        self.__path = ""
+        self.__pending_position: Union[int, None] = None
+
+        self.__save_timer = QTimer(self)
+        self.__save_timer.setSingleShot(True)
+        self.__save_timer.setInterval(RESUME_SAVE_INTERVAL)
+        self.__save_timer.timeout.connect(self.__program_data.save_resume_point)
+
+        player.currentMediaChanged.connect(self.__currentMediaChanged)
+        player.mediaStatusChanged.connect(self.__mediaStatusChanged)
+        player.positionChanged.connect(self.__positionChanged)
+
+    def resume(self, position: int) -> None:
+        """
+        Continue the current track at the given position, once the player has loaded it.
+
+        :param position: The position in milliseconds. (int)
+        """
+
+        self.__pending_position = position
+        self.__update(position)
+
+    def save(self) -> None:
+        """
+        Write the resume point to file now, e.g. when the application is closed.
+        """
+
+        self.__save_timer.stop()
+        self.__program_data.save_resume_point()
+
+    def rename_track(self, old_path: str, new_path: str) -> None:
+        """
+        Follow the rename of a track, the media of the current track keeps its previous path while it plays.
+
+        :param old_path: The previous path of the track. (str)
+        :param new_path: The new path of the track. (str)
+        """
+
+        if self.__path == old_path:
+            self.__path = new_path
+            position = self.__pending_position
+            self.__update(self.__player.position() if position is None else position)
+
+    def __update(self, position: int) -> None:
+        if not self.__path:
+            return
+
+        self.__program_data.set_resume_point(self.__path, position)
+        if not self.__save_timer.isActive():
+            self.__save_timer.start()
+
+    def __currentMediaChanged(self, media: QMediaContent) -> None:
+        self.__path = media.canonicalUrl().path()
+        self.__pending_position = None
+        self.__update(0)
+
+    def __mediaStatusChanged(self, status: QMediaPlayer.MediaStatus) -> None:
+        # A track cannot be seeked before it is loaded
+        if self.__pending_position is not None and status in (QMediaPlayer.MediaStatus.LoadedMedia,
+                                                              QMediaPlayer.MediaStatus.BufferedMedia):
+            position, self.__pending_position = self.__pending_position, None
+            self.__player.setPosition(position)
+
+    def __positionChanged(self, position: int) -> None:
+        # Positions reported before the pending seek would overwrite the resume point
+        if self.__pending_position is None:
+            self.__update(position)
@@ -0,0 +1,146 @@
+import os
+import sqlite3
+import time
+from typing import AnyStr, Dict, List, Tuple, Union
+
+PLAY_EVENT = "play"
+SKIP_EVENT = "skip"
+
+
+class PlaybackStats:
+    """
+    Persistent playback statistics of tracks.
+
+    Playback events are appended to an event log in an SQLite database, which is never rewritten. Per-track
+    aggregates, i.e. play, skip and workout play counts and the last played time, are kept in a table of their own
+    and updated together with the log, so reading statistics never scans the log, however long it gets.
+    The aggregates are read into memory once, events are buffered and written in batches, see flush().
+    """
+
+    def __init__(self, filename: AnyStr, batch_size: int = 32):
+        self.__filename = filename
+        self.__batch_size = batch_size
+        self.__connection: Union[sqlite3.Connection, None] = None
+        self.__tracks: Union[Dict[str, List], None] = None
+        self.__events: List[Tuple[float, str, str, int]] = []
+        self.__changed = set()
+
+    def __database(self) -> sqlite3.Connection:
+        # The database is opened on first use
+        if self.__connection is None:
+            os.makedirs(os.path.dirname(self.__filename), exist_ok=True)
+
+            self.__connection = sqlite3.connect(self.__filename)
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS events (time REAL, path TEXT, event TEXT, workout INTEGER)"
+            )
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS tracks "
+                "(path TEXT PRIMARY KEY, plays INTEGER, skips INTEGER, workout_plays INTEGER, last_played REAL) "
+                "WITHOUT ROWID"
+            )
+
+        return self.__connection
+
+    def __aggregates(self) -> Dict[str, List]:
+        # Aggregates of all tracks are read at once on first use, one row per track
+        if self.__tracks is None:
+            try:
+                rows = self.__database().execute("SELECT path, plays, skips, workout_plays, last_played FROM tracks")
+                self.__tracks = {row[0]: list(row[1:]) for row in rows}
+            except sqlite3.Error:
+                self.__tracks = {}
+
+        return self.__tracks
+
+    def record(self, path: AnyStr, event: str, workout: bool = False, timestamp: float = None) -> None:
+        """
+        Record a playback event of a track.
+
+        :param path: The path of the track. (AnyStr)
+        :param event: PLAY_EVENT if the track was listened to, SKIP_EVENT if it was skipped. (str)
+        :param workout: Whether the track was played during a workout. (bool)
+        :param timestamp: The time of the event in seconds since the epoch, the current time by default. (float)
+        """
+
+        timestamp = time.time() if timestamp is None else timestamp
+        aggregates = self.__aggregates().setdefault(path, [0, 0, 0, None])
+
+        if event == PLAY_EVENT:
+            aggregates[0] += 1
+            aggregates[2] += bool(workout)
+            aggregates[3] = timestamp
+        else:
+            aggregates[1] += 1
+
+        self.__events.append((timestamp, path, event, int(bool(workout))))
+        self.__changed.add(path)
+
+        if len(self.__events) >= self.__batch_size:
+            self.flush()
+
+    def track_stats(self, path: AnyStr) -> Dict[str, Union[int, float, None]]:
+        """
+        Get the playback statistics of a track, including events which are not written yet.
+
+        :param path: The path of the track. (AnyStr)
+        :return: A dictionary with "plays", "skips", "workout_plays" and "last_played" keys, the last played time
+                 in seconds since the epoch or None. (Dict[str, Union[int, float, None]])
+        """
+
+        plays, skips, workout_plays, last_played = self.__aggregates().get(path, (0, 0, 0, None))
+
+        return {"plays": plays, "skips": skips, "workout_plays": workout_plays, "last_played": last_played}
+
+    def play_counts(self, workout: bool = False) -> Dict[str, int]:
+        """
+        Get the play counts of all played tracks from the aggregates, e.g. to order tracks by them.
+
+        :param workout: Whether to count only plays during workouts. (bool)
+        :return: A dictionary of play counts by path, tracks which were not played are left out. (Dict[str, int])
+        """
+
+        column = 2 if workout else 0
+
+        return {path: aggregates[column] for path, aggregates in self.__aggregates().items() if aggregates[column]}
+
+    def rename(self, old_path: AnyStr, new_path: AnyStr) -> None:
+        """
+        Move the statistics of a renamed track to its new path. Logged events keep the path they were recorded with.
+
+        :param old_path: The previous path of the track. (AnyStr)
+        :param new_path: The new path of the track. (AnyStr)
+        """
+
+        aggregates = self.__aggregates().pop(old_path, None)
+        if aggregates is None:
+            return
+
+        self.__tracks[new_path] = aggregates
+        self.__changed.update((old_path, new_path))
+
+    def flush(self) -> None:
+        """
+        Append the buffered events to the log and write the changed aggregates in a single transaction.
+        """
+
+        if not self.__changed:
+            return
+
+        tracks = self.__aggregates()
+
+        try:
+            with self.__database() as database:
+                database.executemany("INSERT INTO events VALUES (?, ?, ?, ?)", self.__events)
+                database.executemany(
+                    "DELETE FROM tracks WHERE path = ?", [(path,) for path in self.__changed if path not in tracks]
+                )
+                database.executemany(
+                    "INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?, ?)",
+                    [(path, *tracks[path]) for path in self.__changed if path in tracks]
+                )
+        except sqlite3.Error:
+            return
+
+        self.__events.clear()
+        self.__changed.clear()
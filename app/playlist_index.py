@@ -0,0 +1,309 @@
+import json
+import os
+import threading
+from typing import List, AnyStr, Dict, Iterable, Union, Set, Tuple, Generator
+
+from scanner import scan_directory, normalize_extensions
+
+INDEX_HEADER = "OpenFit playlist index"
+INDEX_VERSION = 4
+
+
+class PlaylistIndex:
+    """
+    On-disk index of the playlist folders.
+
+    For every scanned directory the index keeps its modification time, device and inode, its subdirectories
+    and its audio files with their size and modification time. A directory is listed again only if its modification
+    time has changed, so unchanged parts of the playlist folder cost a single stat per directory.
+
+    The index may be scanned in a background thread while it is saved from another thread.
+    """
+
+    def __init__(self):
+        self.__roots: Tuple[str, ...] = ()
+        self.__extensions: Tuple[str, ...] = ()
+        self.__directories: Dict[str, Dict] = {}
+        self.__changed = False
+        self.__lock = threading.RLock()
+
+    def load(self, filename: AnyStr) -> bool:
+        """
+        Load the index from a file with a single sequential read.
+
+        Files with a different format version are ignored, so the index is rebuilt by the next scan.
+
+        :param filename: The name of the index file. (AnyStr)
+        :return: True if the index was loaded, False otherwise. (bool)
+        """
+
+        try:
+            with open(filename, encoding="utf-8") as index_file:
+                header, _, body = index_file.read().partition("\n")
+            if header != f"{INDEX_HEADER} {INDEX_VERSION}":
+                return False
+
+            index = json.loads(body)
+        except (OSError, ValueError):
+            return False
+
+        with self.__lock:
+            self.__roots = tuple(index["roots"])
+            self.__extensions = tuple(index["extensions"])
+            self.__directories = index["directories"]
+            self.__changed = False
+
+        return True
+
+    def save(self, filename: AnyStr) -> None:
+        """
+        Write the index to a file if it was changed since it was loaded or saved.
+
+        :param filename: The name of the index file. (AnyStr)
+        """
+
+        with self.__lock:
+            if not self.__changed:
+                return
+
+            index = json.dumps({
+                "roots": self.__roots,
+                "extensions": self.__extensions,
+                "directories": self.__directories
+            }, separators=(",", ":"))
+            self.__changed = False
+
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        # Write to a temporary file first, so an interrupted write does not corrupt the index
+        with open(f"{filename}.tmp", "w", encoding="utf-8") as index_file:
+            index_file.write(f"{INDEX_HEADER} {INDEX_VERSION}\n")
+            index_file.write(index)
+        os.replace(f"{filename}.tmp", filename)
+
+    def scan(self, roots: Iterable[AnyStr], extensions: Iterable[str]) -> List[str]:
+        """
+        Find audio files in the root directories and their subdirectories, rescanning only the changed directories.
+
+        :param roots: The directories to scan. (Iterable[AnyStr])
+        :param extensions: Audio file extensions to look for, case-insensitive. (Iterable[str])
+        :return: A list of paths of the found audio files in playlist order, see iter_scan(). (List[str])
+        """
+
+        return [path for paths in self.iter_scan(roots, extensions) for path in paths]
+
+    def iter_scan(self, roots: Iterable[AnyStr], extensions: Iterable[str]) -> Generator[List[str], None, None]:
+        """
+        Find audio files in the root directories and their subdirectories, yielding them directory by directory.
+
+        Roots are scanned in the given order. Directories are visited in name order, files of a directory come
+        before its subdirectories. Only directories changed since the last scan are listed again, the index
+        is updated as directories are scanned, and directories which no longer exist are dropped once the scan
+        is complete. Symbolic links are followed, every directory is entered only once, even if it is found
+        under several roots. Records of roots which are no longer scanned are dropped, and all records are dropped
+        if the extensions have changed.
+
+        :param roots: The directories to scan. (Iterable[AnyStr])
+        :param extensions: Audio file extensions to look for, case-insensitive. (Iterable[str])
+        :return: A generator of lists with paths of the audio files found in each directory.
+                 (Generator[List[str], None, None])
+        """
+
+        roots = tuple(roots)
+        extensions = normalize_extensions(extensions)
+
+        with self.__lock:
+            if extensions != self.__extensions:
+                self.__directories = {}
+                self.__changed = True
+            elif roots != self.__roots:
+                # Records of the roots which are still scanned stay valid, the rest is dropped
+                kept = [os.path.join(root, "") for root in roots if root in self.__roots]
+                self.__directories = {
+                    directory: record for directory, record in self.__directories.items()
+                    if any(os.path.join(directory, "").startswith(root) for root in kept)
+                }
+                self.__changed = True
+
+            self.__roots = roots
+            self.__extensions = extensions
+
+        scanned = set()
+        visited = set()
+
+        for root in roots:
+            for directory, record, _ in self.__walk(root, visited):
+                scanned.add(directory)
+
+                if record["files"]:
+                    yield [os.path.join(directory, name) for name in record["files"]]
+
+        with self.__lock:
+            if scanned != self.__directories.keys():
+                self.__directories = {directory: self.__directories[directory] for directory in scanned}
+                self.__changed = True
+
+    def update_directories(self, directories: Iterable[AnyStr]) -> Tuple[List[str], List[str], List[Tuple[str, str]]]:
+        """
+        Rescan changed directories of the last scanned roots, e.g. reported by a file system watcher.
+
+        New subdirectories are scanned with all their contents, removed ones are dropped from the index.
+        A removed file and an added file with the same size and modification time are reported as a rename.
+        Directories which are not indexed are ignored.
+
+        :param directories: Paths of the changed directories. (Iterable[AnyStr])
+        :return: Paths of the added files, paths of the removed files, and (old path, new path) tuples
+                 of the renamed files. (Tuple[List[str], List[str], List[Tuple[str, str]]])
+        """
+
+        added: Dict[str, List] = {}
+        removed: Dict[str, List] = {}
+
+        with self.__lock:
+            visited = {tuple(record["id"]) for record in self.__directories.values()}
+
+            for directory in directories:
+                previous = self.__directories.get(directory)
+                if previous is None:
+                    continue
+
+                try:
+                    directory_stat = os.stat(directory)
+                except OSError:
+                    # The directory itself was removed, its parent reports the change as well
+                    self.__drop_directory(directory, removed, visited)
+                    continue
+
+                if previous["mtime"] == directory_stat.st_mtime_ns:
+                    continue
+
+                visited.discard(tuple(previous["id"]))
+
+                for scanned, record, scanned_previous in self.__walk(directory, visited):
+                    if record is scanned_previous:
+                        continue
+
+                    previous_files = scanned_previous["files"] if scanned_previous else {}
+                    previous_subdirectories = scanned_previous["subdirectories"] if scanned_previous else []
+
+                    for name, entry in record["files"].items():
+                        if name not in previous_files:
+                            added[os.path.join(scanned, name)] = entry
+                    for name, entry in previous_files.items():
+                        if name not in record["files"]:
+                            removed[os.path.join(scanned, name)] = entry
+                    for name in set(previous_subdirectories).difference(record["subdirectories"]):
+                        self.__drop_directory(os.path.join(scanned, name), removed, visited)
+
+            # Files moved between the changed directories are matched by their size and modification time
+            removed_by_signature: Dict[Tuple[int, int], List[str]] = {}
+            for path, (size, mtime) in removed.items():
+                removed_by_signature.setdefault((size, mtime), []).append(path)
+
+            renamed = []
+            for path, entry in list(added.items()):
+                candidates = removed_by_signature.get((entry[0], entry[1]))
+                if candidates:
+                    old_path = candidates.pop()
+                    del removed[old_path]
+                    del added[path]
+                    renamed.append((old_path, path))
+
+            if added or removed or renamed:
+                self.__changed = True
+
+        return list(added), list(removed), renamed
+
+    def directories(self) -> List[str]:
+        """
+        Get the directories found by the last scan.
+
+        :return: Paths of the indexed directories. (List[str])
+        """
+
+        with self.__lock:
+            return list(self.__directories)
+
+    def file_stat(self, path: AnyStr) -> Union[Tuple[int, int], None]:
+        """
+        Get the size and modification time of an indexed audio file as of the last scan, without accessing the file.
+
+        :param path: The path of the audio file. (AnyStr)
+        :return: The size in bytes and the modification time in nanoseconds,
+                 or None if the file is not indexed. (Union[Tuple[int, int], None])
+        """
+
+        directory, name = os.path.split(path)
+
+        with self.__lock:
+            record = self.__directories.get(directory)
+            entry = record["files"].get(name) if record else None
+
+            return (entry[0], entry[1]) if entry else None
+
+    def __walk(self, top: str, visited: Set[Tuple[int, int]]) -> Generator[Tuple[str, Dict, Union[Dict, None]], None, None]:
+        # Depth-first walk in name order which updates the records of the changed directories,
+        # yields (directory, record, previous record) tuples
+        pending = [top]
+
+        while pending:
+            directory = pending.pop()
+
+            try:
+                directory_stat = os.stat(directory)
+            except OSError:
+                continue
+
+            # Skip symlink cycles and links to already scanned directories
+            key = (directory_stat.st_dev, directory_stat.st_ino)
+            if key in visited:
+                continue
+            visited.add(key)
+
+            previous = record = self.__directories.get(directory)
+
+            if not record or record["mtime"] != directory_stat.st_mtime_ns:
+                record = self.__scan_directory(directory, directory_stat)
+                if record is None:
+                    continue
+
+                with self.__lock:
+                    self.__directories[directory] = record
+                    self.__changed = True
+
+            pending.extend(os.path.join(directory, name) for name in reversed(record["subdirectories"]))
+
+            yield directory, record, previous
+
+    def __drop_directory(self, directory: str, removed: Dict[str, List], visited: Set[Tuple[int, int]]) -> None:
+        # Drop the directory and its subdirectories, collecting their files. The directories are no longer
+        # marked as visited, so a renamed directory is scanned again under its new path
+        prefix = os.path.join(directory, "")
+
+        for path in [path for path in self.__directories if path == directory or path.startswith(prefix)]:
+            record = self.__directories.pop(path)
+            visited.discard(tuple(record["id"]))
+            removed.update((os.path.join(path, name), entry) for name, entry in record["files"].items())
+
+    def __scan_directory(self, directory: str, directory_stat: os.stat_result) -> Union[Dict, None]:
+        try:
+            files, subdirectories = scan_directory(directory, self.__extensions)
+        except OSError:
+            return
+
+        record = {
+            "mtime": directory_stat.st_mtime_ns,
+            "id": [directory_stat.st_dev, directory_stat.st_ino],
+            "subdirectories": sorted(entry.name for entry in subdirectories),
+            "files": {}
+        }
+
+        for entry in sorted(files, key=lambda file_entry: file_entry.name):
+            try:
+                file_stat = entry.stat()
+            except OSError:
+                continue
+
+            record["files"][entry.name] = [file_stat.st_size, file_stat.st_mtime_ns]
+
+        return record
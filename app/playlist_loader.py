@@ -0,0 +1,71 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from program_data import ProgramData
+
+
+class PlaylistLoader(QThread):
+    """
+    Background playlist loading pipeline.
+
+    The playlist folder is scanned directory by directory, metadata of the found tracks which is not cached yet
+    is read on a thread pool, and tracks are published in batches of paths through the tracks_loaded signal,
+    in playlist order, once their metadata is cached. Loading is cancelled with requestInterruption().
+    """
+
+    tracks_loaded = pyqtSignal(list)
+
+    def __init__(self, program_data: ProgramData, batch_size: int = 100, max_workers: int = None, parent=None):
+        super().__init__(parent)
+
+        self.__program_data = program_data
+        self.__batch_size = batch_size
+        self.__max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+
+    def __publish(self, executor: ThreadPoolExecutor, paths: List[str]) -> bool:
+        if self.isInterruptionRequested():
+            return False
+
+        results = self.__program_data.get_audio_metadata_many(paths, executor=executor)
+
+        try:
+            for _ in results:
+                if self.isInterruptionRequested():
+                    return False
+        finally:
+            results.close()
+
+        self.tracks_loaded.emit(list(paths))
+        return True
+
+    def run(self):
+        batch = []
+        first_batch = True
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            playlist = self.__program_data.iter_playlist()
+
+            try:
+                for paths in playlist:
+                    # The scan itself stops on cancellation as well, not only the publishing of tracks
+                    if self.isInterruptionRequested():
+                        return
+
+                    batch.extend(paths)
+
+                    # The first tracks are published as soon as they are found, so playback can start right away
+                    if first_batch or len(batch) >= self.__batch_size:
+                        if not self.__publish(executor, batch):
+                            return
+
+                        batch = []
+                        first_batch = False
+
+                if batch:
+                    self.__publish(executor, batch)
+            finally:
+                playlist.close()
+                self.__program_data.save_audio_metadata()
@@ -0,0 +1,73 @@
+import os
+import re
+from typing import Dict, Tuple, Union
+
+# Sort orders of the playlist and the sort key fields they compare, in order
+SORT_ORDERS = {
+    "folder": ("folder",),
+    "artist": ("artist", "album", "name"),
+    "album": ("album", "name"),
+    "title": ("title", "artist"),
+    "duration": ("duration", "folder"),
+    "added": ("added", "folder"),
+    # Play counts are not computed by compute_sort_keys(), they are added by the program data
+    "workout": ("workout_plays", "artist", "album", "name")
+}
+
+
+def natural_key(text: str) -> Tuple:
+    """
+    Convert text to a key which orders numbers by their value, e.g. "2 - Intro" before "10 - Outro".
+
+    :param text: The text to convert. (str)
+    :return: A tuple of case-folded text parts and integers, text parts at even positions. (Tuple)
+    """
+
+    parts = re.split(r"(\d+)", text.casefold())
+    return tuple(int(part) if i % 2 else part for i, part in enumerate(parts))
+
+
+def compute_sort_keys(path: str, metadata: Dict, added: Union[int, None], root: int) -> Dict[str, Tuple]:
+    """
+    Compute the sort key fields of a track, see SORT_ORDERS.
+
+    Tracks without a tag are ordered after the tagged ones, tracks without a title by their file name.
+
+    :param path: The path of the track. (str)
+    :param metadata: The metadata of the track, see audioinfo.get_audio_metadata(). (Dict)
+    :param added: The time the track was added to the playlist folder in nanoseconds, if known. (Union[int, None])
+    :param root: The index of the playlist folder the track was found in, folders are scanned in order. (int)
+    :return: A dictionary of sort key fields. (Dict[str, Tuple])
+    """
+
+    directory, filename = os.path.split(path)
+    name = natural_key(os.path.splitext(filename)[0])
+
+    def tag_key(key: str) -> Tuple:
+        value = metadata.get(key)
+        return (0, natural_key(value)) if value else (1, ())
+
+    return {
+        # The order of a playlist scan, playlist folder by playlist folder, files of a directory come before
+        # its subdirectories
+        "folder": (root, tuple(directory.split(os.sep)), filename),
+        "artist": tag_key("artist"),
+        "album": tag_key("album"),
+        "title": (0, natural_key(metadata["title"])) if metadata.get("title") else (0, name),
+        "name": name,
+        "duration": (metadata.get("duration_seconds") or 0,),
+        # The most recently added tracks come first
+        "added": (-added if added is not None else 0,)
+    }
+
+
+def sort_key(sort_keys: Dict[str, Tuple], order: str) -> Tuple:
+    """
+    Get the key of a track in a sort order.
+
+    :param sort_keys: The sort key fields of the track, see compute_sort_keys(). (Dict[str, Tuple])
+    :param order: One of the SORT_ORDERS. (str)
+    :return: The sort key. (Tuple)
+    """
+
+    return tuple(sort_keys[field] for field in SORT_ORDERS[order])
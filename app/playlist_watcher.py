@@ -0,0 +1,60 @@
+from typing import List, AnyStr
+
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+
+class PlaylistWatcher(QObject):
+    """
+    Watcher of the playlist folder and its subdirectories.
+
+    Change notifications are coalesced, so copying or deleting many files at once is reported
+    through the directories_changed signal as a single list of changed directories.
+    """
+
+    directories_changed = pyqtSignal(list)
+
+    def __init__(self, delay: int = 500, parent=None):
+        super().__init__(parent)
+
+        self.__watcher = QFileSystemWatcher(self)
+        self.__changed_directories = set()
+        self.__timer = QTimer(self)
+        self.__timer.setSingleShot(True)
+        self.__timer.setInterval(delay)
+
+        self.__watcher.directoryChanged.connect(self.__directoryChanged)
+        self.__timer.timeout.connect(self.__publish)
+
+    def watch(self, directories: List[AnyStr]) -> None:
+        """
+        Watch exactly the given directories, starting and stopping watching directories as needed.
+
+        :param directories: Paths of the directories to watch. (List[AnyStr])
+        """
+
+        watched = set(self.__watcher.directories())
+        directories = set(directories)
+
+        if watched - directories:
+            self.__watcher.removePaths(list(watched - directories))
+        if directories - watched:
+            self.__watcher.addPaths(list(directories - watched))
+
+    def clear(self) -> None:
+        """
+        Stop watching all directories and drop pending notifications.
+        """
+
+        self.watch([])
+        self.__changed_directories.clear()
+        self.__timer.stop()
+
+    def __directoryChanged(self, path: str) -> None:
+        self.__changed_directories.add(path)
+        self.__timer.start()
+
+    def __publish(self) -> None:
+        directories = sorted(self.__changed_directories)
+        self.__changed_directories.clear()
+
+        self.directories_changed.emit(directories)
@@ -1,14 +1,26 @@
 import json
 import os
-import random
-import time
 import csv
+import itertools
+from bisect import bisect_right
 from copy import deepcopy
-from typing import List, AnyStr, Dict, Union, Generator, Tuple
+from concurrent.futures import Executor
+from typing import List, AnyStr, Dict, Union, Generator, Tuple, Iterable, Callable
+
+from scanner import AUDIO_EXTENSIONS
+from playlist_index import PlaylistIndex
+from file_cache import FileCache
+from search_index import SearchIndex
+from playlist_sort import SORT_ORDERS, compute_sort_keys, sort_key
+from duplicates import DuplicateFilter
+from play_queue import PlayQueue
+from playback_stats import PlaybackStats
+from audioinfo import get_audio_metadata, get_audio_metadata_many
 
 BASE_CONFIG = {
     "exercises": [],
     "playlist_source": "/home/nemo/Music",
+    "audio_extensions": AUDIO_EXTENSIONS,
     "assistant": {
         "model": "gpt-3.5-turbo",
         "token": ""
@@ -17,12 +29,41 @@ BASE_CONFIG = {
 
 
 CONFIG_FILENAME = os.path.expanduser("~/.config/OpenFit/config.json")
+PLAYLIST_INDEX_FILENAME = os.path.expanduser("~/.cache/OpenFit/playlist.index")
+METADATA_CACHE_FILENAME = os.path.expanduser("~/.cache/OpenFit/metadata.sqlite3")
+SEARCH_INDEX_FILENAME = os.path.expanduser("~/.cache/OpenFit/search.index")
+HASH_CACHE_FILENAME = os.path.expanduser("~/.cache/OpenFit/hashes.sqlite3")
+TEMPO_CACHE_FILENAME = os.path.expanduser("~/.cache/OpenFit/tempo.sqlite3")
+LOUDNESS_CACHE_FILENAME = os.path.expanduser("~/.cache/OpenFit/loudness.sqlite3")
+PLAYBACK_STATS_FILENAME = os.path.expanduser("~/.local/share/OpenFit/playback.sqlite3")
+RESUME_FILENAME = os.path.expanduser("~/.local/share/OpenFit/resume.json")
+
+# Relative difference of a track tempo from the target tempo which still matches, see match_tempo_audios()
+TEMPO_TOLERANCE = 0.06
+
+# Loudness tracks are brought to by their gain, in LUFS, the ReplayGain 2.0 reference level
+TARGET_LOUDNESS = -18.0
 
 
 class ProgramData:
     def __init__(self):
         self.__config: Dict = {}
-        self.__audios: List[str] = []
+        self.__audios = PlayQueue()
+        self.__playlist_index = PlaylistIndex()
+        self.__metadata_cache = FileCache(METADATA_CACHE_FILENAME)
+        self.__search_index = SearchIndex()
+        self.__sort_keys: Dict[str, Dict[str, Tuple]] = {}
+        self.__hash_cache = FileCache(HASH_CACHE_FILENAME)
+        self.__duplicates = DuplicateFilter(self.__hash_cache, self.__playlist_index.file_stat)
+        self.__tempo_cache = FileCache(TEMPO_CACHE_FILENAME)
+        self.__tempos: Dict[str, Union[float, None]] = {}
+        self.__loudness_cache = FileCache(LOUDNESS_CACHE_FILENAME)
+        self.__gains: Dict[str, float] = {}
+        self.__playback_stats = PlaybackStats(PLAYBACK_STATS_FILENAME)
+        self.__resume_point: Union[Dict, None] = None
+        self.__resume_point_changed = False
+        self.__exercise_ids: List[int] = []
+        self.__exercise_id_counter = itertools.count(1)
 
     def get_openai_token(self):
         return self.__config["assistant"]["token"]
@@ -34,14 +75,60 @@ class ProgramData:
     def get_assistant_model(self) -> AnyStr:
         return self.__config["assistant"]["model"]
 
-    def remove_audio(self, index: int) -> None:
+    def remove_audio(self, index: int, count: int = 1) -> None:
         """
-        Remove an audio file from the playlist at the specified index.
+        Remove an audio file from the playlist at the specified index, or several adjacent ones at once.
 
         :param index: The index of the audio file to remove. (int)
+        :param count: The number of audio files to remove. (int)
+        """
+
+        self.__audios.remove(index, count)
+
+    def insert_audios(self, index: int, paths: List[AnyStr]) -> None:
+        """
+        Insert adjacent audio files into the playlist at the specified index at once.
+
+        :param index: The index to insert the first audio file at. (int)
+        :param paths: Paths of the audio files. (List[AnyStr])
+        """
+
+        self.__audios.insert(index, paths)
+
+    def replace_audio(self, index: int, path: AnyStr) -> None:
+        """
+        Replace the audio file at the specified index, e.g. after it was renamed.
+
+        :param index: The index of the audio file to replace. (int)
+        :param path: The new path of the audio file. (AnyStr)
+        """
+
+        self.__audios.replace(index, path)
+
+    def index_of_audios(self, paths: Iterable[AnyStr]) -> Dict[str, int]:
+        """
+        Search for the indexes of audio files in the playlist.
+
+        :param paths: Paths of the audio files. (Iterable[AnyStr])
+        :return: A dictionary of the indexes by path, audio files which are not in the playlist are left out.
+                 (Dict[str, int])
+        """
+
+        return self.__audios.positions(paths)
+
+    def count_missing_audios(self, index: int) -> int:
+        """
+        Count the audio files from the specified index on which no longer exist, e.g. before playing the index.
+
+        :param index: The index of the first audio file to check. (int)
+        :return: The number of adjacent missing audio files. (int)
         """
 
-        self.__audios.pop(index)
+        end = index
+        while end < len(self.__audios) and not os.path.exists(self.__audios[end]):
+            end += 1
+
+        return end - index
 
     def get_audios(self) -> List[str]:
         """
@@ -50,35 +137,505 @@ class ProgramData:
         :return: A list containing the paths of audio files in the playlist. (List[str])
         """
 
-        return self.__audios
+        return self.__audios.paths()
 
-    def shuffle_playlist(self) -> None:
+    def audio_count(self) -> int:
         """
-        Shuffle the audio files in the playlist randomly.
+        Get the number of audio files in the playlist.
+
+        :return: The number of audio files. (int)
         """
 
-        random.seed(time.time())
-        random.shuffle(self.__audios)
+        return len(self.__audios)
 
-    def __reload_playlist(self) -> None:
+    def audio_at(self, index: int) -> str:
         """
-        Reload the playlist by updating the internal audio list.
+        Get the audio file at the specified index of the playlist.
 
-        This method clears the existing audio list and repopulates it based on the audio files found in the playlist directory.
+        :param index: The index of the audio file. (int)
+        :return: The path of the audio file. (str)
         """
-        self.__audios = []
 
-        # Check if the playlist directory exists
-        if os.path.exists(self.get_playlist_path()):
-            # Iterate through each audio file in the playlist directory
-            for audio in os.listdir(self.get_playlist_path()):
-                audio = os.path.join(self.get_playlist_path(), audio)
-                # Check if the file exists and has a .mp3 extension
-                if os.path.exists(audio) and audio.lower().endswith(".mp3"):
-                    self.__audios.append(audio)
+        return self.__audios[index]
+
+    def shuffle_playlist(self, seed: int) -> List[int]:
+        """
+        Shuffle the audio files in the playlist randomly, see PlayQueue.shuffle().
+
+        :param seed: The seed of the random order. (int)
+        :return: The previous indexes of the audio files in their new order. (List[int])
+        """
+
+        return self.__audios.shuffle(seed)
+
+    def get_shuffle_seed(self) -> Union[int, None]:
+        """
+        Get the seed of the shuffled playlist order.
+
+        :return: The seed, or None if the playlist is not shuffled. (Union[int, None])
+        """
+
+        return self.__config.get("playlist_shuffle_seed")
+
+    def set_shuffle_seed(self, seed: Union[int, None]) -> None:
+        """
+        Set the seed of the shuffled playlist order, so the same order is restored on the next start.
+
+        :param seed: The seed, or None if the playlist is not shuffled. (Union[int, None])
+        """
+
+        self.__config["playlist_shuffle_seed"] = seed
+
+        # Write the updated configuration to file
+        self.write_config(CONFIG_FILENAME)
+
+    def get_playlist_sort_order(self) -> str:
+        """
+        Get the sort order of the playlist, used while the playlist is not shuffled.
+
+        :return: One of the playlist_sort.SORT_ORDERS. (str)
+        """
+
+        order = self.__config.get("playlist_sort_order")
+        return order if order in SORT_ORDERS else "folder"
+
+    def set_playlist_sort_order(self, order: str) -> None:
+        """
+        Set the sort order of the playlist, so the same order is restored on the next start.
+
+        :param order: One of the playlist_sort.SORT_ORDERS. (str)
+        """
+
+        self.__config["playlist_sort_order"] = order
+
+        # Write the updated configuration to file
+        self.write_config(CONFIG_FILENAME)
 
-            # Sort the list of audio files alphabetically
-            self.__audios = sorted(self.__audios)
+    def get_resume_point(self) -> Tuple[Union[str, None], int]:
+        """
+        Get the track which was playing when the program was last used and the position in it.
+
+        :return: The path of the track, or None if no track was played, and the position in milliseconds.
+                 (Tuple[Union[str, None], int])
+        """
+
+        if self.__resume_point is None:
+            try:
+                with open(RESUME_FILENAME, encoding="utf-8") as resume_file:
+                    self.__resume_point = json.load(resume_file)
+            except (OSError, ValueError):
+                self.__resume_point = {}
+
+        return self.__resume_point.get("path"), self.__resume_point.get("position", 0)
+
+    def set_resume_point(self, path: AnyStr, position: int) -> None:
+        """
+        Set the current track and the position in it, see save_resume_point().
+
+        :param path: The path of the track. (AnyStr)
+        :param position: The position in milliseconds. (int)
+        """
+
+        resume_point = {"path": path, "position": position}
+        if resume_point != self.__resume_point:
+            self.__resume_point = resume_point
+            self.__resume_point_changed = True
+
+    def save_resume_point(self) -> None:
+        """
+        Write the resume point to file if it was changed since it was last saved.
+        """
+
+        if not self.__resume_point_changed:
+            return
+
+        self.__resume_point_changed = False
+        os.makedirs(os.path.dirname(RESUME_FILENAME), exist_ok=True)
+
+        # Write to a temporary file first, so an interrupted write does not lose the previous resume point
+        with open(f"{RESUME_FILENAME}.tmp", "w", encoding="utf-8") as resume_file:
+            json.dump(self.__resume_point, resume_file)
+        os.replace(f"{RESUME_FILENAME}.tmp", RESUME_FILENAME)
+
+    def iter_playlist(self) -> Generator[List[str], None, None]:
+        """
+        Scan the playlist directories and their subdirectories, yielding audio files directory by directory.
+
+        Only directories changed since the last scan are listed again. Audio files with the same contents
+        as an audio file found before, e.g. in another playlist directory, are skipped. The playlist index
+        is written to file and tracks which are no longer found are dropped from the search index once the scan
+        is complete. The search index is built before the scan, so it is not built by the first search.
+        The internal audio list is not changed, see clear_audios() and add_audios().
+
+        :return: A generator of lists with paths of the audio files found in each directory.
+                 (Generator[List[str], None, None])
+        """
+
+        found = set()
+        self.__duplicates.clear()
+        self.__search_index.build()
+
+        for paths in self.__playlist_index.iter_scan(self.get_playlist_paths(), self.get_audio_extensions()):
+            paths = self.__duplicates.filter(paths)
+            if paths:
+                found.update(paths)
+                yield paths
+
+        self.save_playlist_index()
+        self.__search_index.retain(found)
+
+    def update_playlist_directories(self, directories: List[AnyStr]) -> Tuple[List[str], List[str], List[Tuple[str, str]]]:
+        """
+        Rescan changed directories of the playlist folders and write the playlist index to file.
+
+        Added audio files with the same contents as a playlist track are not reported. Once a playlist track
+        is removed, an audio file with the same contents which was skipped before is reported as added instead.
+        The internal audio list is not changed, the caller applies the returned changes to the playlist.
+
+        :param directories: Paths of the changed directories. (List[AnyStr])
+        :return: Paths of the added files, paths of the removed files, and (old path, new path) tuples
+                 of the renamed files. (Tuple[List[str], List[str], List[Tuple[str, str]]])
+        """
+
+        added, removed, renamed = self.__playlist_index.update_directories(directories)
+        self.save_playlist_index()
+
+        for old_path, path in renamed:
+            self.__metadata_cache.rename(old_path, path)
+            self.__hash_cache.rename(old_path, path)
+            self.__tempo_cache.rename(old_path, path)
+            self.__loudness_cache.rename(old_path, path)
+            if old_path in self.__gains:
+                self.__gains[path] = self.__gains.pop(old_path)
+            self.__playback_stats.rename(old_path, path)
+            if old_path in self.__tempos:
+                self.__tempos[path] = self.__tempos.pop(old_path)
+            self.__duplicates.rename(old_path, path)
+            self.__search_index.rename(old_path, path)
+            self.__sort_keys.pop(old_path, None)
+        promoted = []
+        for path in removed:
+            # A skipped copy which takes the place of a removed track may be removed in the same change
+            if path in promoted:
+                promoted.remove(path)
+
+            copy = self.__duplicates.remove(path)
+            if copy is not None:
+                promoted.append(copy)
+
+            self.__search_index.remove(path)
+            self.__sort_keys.pop(path, None)
+            self.__tempos.pop(path, None)
+            self.__gains.pop(path, None)
+
+        return self.__duplicates.filter(added) + promoted, removed, renamed
+
+    def get_playlist_directories(self) -> List[str]:
+        """
+        Get the playlist directory and its subdirectories found by the last scan.
+
+        :return: Paths of the scanned directories. (List[str])
+        """
+
+        return self.__playlist_index.directories()
+
+    def clear_audios(self) -> None:
+        """
+        Remove all audio files from the playlist.
+        """
+
+        self.__audios.clear()
+
+    def add_audios(self, audios: List[str]) -> None:
+        """
+        Append audio files to the playlist.
+
+        :param audios: Paths of the audio files to append. (List[str])
+        """
+
+        self.__audios.extend(audios)
+
+    def sort_playlist(self, order: str) -> List[int]:
+        """
+        Sort the audio files in the playlist.
+
+        Sort keys are computed once per audio file from its cached metadata, so sorting reads no files.
+
+        :param order: One of the playlist_sort.SORT_ORDERS. (str)
+        :return: The previous indexes of the audio files in their new order. (List[int])
+        """
+
+        key = self.__sort_key_function(order)
+        keys = [key(path) for path in self.__audios]
+        permutation = sorted(range(len(self.__audios)), key=keys.__getitem__)
+        self.__audios.permute(permutation)
+
+        return permutation
+
+    def sort_insertion_indexes(self, paths: Iterable[AnyStr], order: str) -> List[Tuple[int, str]]:
+        """
+        Find the indexes to insert audio files at in a playlist sorted by sort_playlist().
+
+        :param paths: Paths of the audio files. (Iterable[AnyStr])
+        :param order: The sort order of the playlist, one of the playlist_sort.SORT_ORDERS. (str)
+        :return: (index, path) tuples of the audio files in sort order, the index is the one after the audio files
+                 of the playlist which do not come after the audio file. (List[Tuple[int, str]])
+        """
+
+        key = self.__sort_key_function(order)
+        keys = {path: key(path) for path in paths}
+
+        return [(bisect_right(self.__audios, keys[path], key=key), path) for path in sorted(keys, key=keys.__getitem__)]
+
+    def __sort_key_function(self, order: str) -> Callable[[str], Tuple]:
+        if "workout_plays" not in SORT_ORDERS[order]:
+            return lambda path: sort_key(self.__get_sort_keys(path), order)
+
+        # Play counts change while the program runs, so they are not part of the cached sort keys,
+        # they are read from the playback statistics once per sort
+        plays = self.__playback_stats.play_counts(workout=True)
+        return lambda path: sort_key(dict(self.__get_sort_keys(path), workout_plays=(-plays.get(path, 0),)), order)
+
+    def get_audio_metadata(self, path: AnyStr) -> Dict:
+        """
+        Get metadata of an audio file, reading it from the file only if it is not cached yet
+        or the file was changed since. The audio file is indexed for search_audios() and sort_playlist().
+
+        :param path: The path of the audio file. (AnyStr)
+        :return: The metadata of the audio file, see audioinfo.get_audio_metadata(). (Dict)
+        """
+
+        file_stat = self.__playlist_index.file_stat(path)
+        metadata = self.__metadata_cache.get(path, file_stat)
+        if metadata is None:
+            metadata = get_audio_metadata(path)
+            self.__metadata_cache.set(path, metadata, file_stat)
+
+        self.__index_audio(path, metadata)
+
+        return metadata
+
+    def get_audio_metadata_many(self, paths: Iterable[AnyStr],
+                                executor: Executor = None) -> Generator[Tuple[str, Dict], None, None]:
+        """
+        Get metadata of many audio files, cached metadata first, then the files which had to be read
+        as they are completed. The audio files are indexed for search_audios() and sort_playlist().
+
+        :param paths: Paths of the audio files. (Iterable[AnyStr])
+        :param executor: An executor to read the files on, see audioinfo.get_audio_metadata_many(). (Executor)
+        :return: A generator of (path, metadata) tuples. (Generator[Tuple[str, Dict], None, None])
+        """
+
+        missing = []
+
+        for path in paths:
+            metadata = self.__metadata_cache.get(path, self.__playlist_index.file_stat(path))
+            if metadata is None:
+                missing.append(path)
+            else:
+                self.__index_audio(path, metadata)
+                yield path, metadata
+
+        if not missing:
+            return
+
+        results = get_audio_metadata_many(missing, executor=executor)
+        try:
+            for path, metadata in results:
+                self.__metadata_cache.set(path, metadata, self.__playlist_index.file_stat(path))
+                self.__index_audio(path, metadata)
+                yield path, metadata
+        finally:
+            results.close()
+
+    def __index_audio(self, path: str, metadata: Dict) -> None:
+        self.__search_index.update(path, metadata)
+        file_stat = self.__playlist_index.file_stat(path)
+        self.__sort_keys[path] = compute_sort_keys(path, metadata, file_stat[1] if file_stat else None,
+                                                   self.__playlist_root_index(path))
+
+    def __playlist_root_index(self, path: str) -> int:
+        # Roots are scanned in order and a directory is scanned only under the first root it is found in,
+        # see PlaylistIndex.iter_scan()
+        roots = self.get_playlist_paths()
+        return next((index for index, root in enumerate(roots) if path.startswith(os.path.join(root, ""))), len(roots))
+
+    def __get_sort_keys(self, path: str) -> Dict[str, Tuple]:
+        keys = self.__sort_keys.get(path)
+        if keys is None:
+            self.get_audio_metadata(path)
+            keys = self.__sort_keys[path]
+
+        return keys
+
+    def search_audios(self, query: str) -> Union[set, None]:
+        """
+        Find audio files whose title, artist, album or file name contain all words of the query.
+
+        Only audio files whose metadata was read are found, see get_audio_metadata().
+
+        :param query: Words to search for. (str)
+        :return: Paths of the found audio files, or None if the query is empty. (Union[set, None])
+        """
+
+        return self.__search_index.search(query)
+
+    def has_audio_tempo(self, path: AnyStr) -> bool:
+        """
+        Check whether the tempo of an audio file was analyzed since it was last changed, also if no tempo was found.
+
+        :param path: The path of the audio file. (AnyStr)
+        :return: True if the tempo was analyzed, False otherwise. (bool)
+        """
+
+        if path in self.__tempos:
+            return True
+
+        analysis = self.__tempo_cache.get(path, self.__playlist_index.file_stat(path))
+        if analysis is None:
+            return False
+
+        self.__tempos[path] = analysis["bpm"]
+        return True
+
+    def set_audio_tempo(self, path: AnyStr, bpm: Union[float, None]) -> None:
+        """
+        Store the analyzed tempo of an audio file, see tempo.track_tempo().
+
+        :param path: The path of the audio file. (AnyStr)
+        :param bpm: The tempo in beats per minute, or None if no tempo was found. (Union[float, None])
+        """
+
+        self.__tempo_cache.set(path, {"bpm": bpm}, self.__playlist_index.file_stat(path))
+        self.__tempos[path] = bpm
+
+    def get_audio_tempo(self, path: AnyStr) -> Union[float, None]:
+        """
+        Get the analyzed tempo of an audio file.
+
+        :param path: The path of the audio file. (AnyStr)
+        :return: The tempo in beats per minute, or None if it was not analyzed or no tempo was found.
+                 (Union[float, None])
+        """
+
+        return self.__tempos.get(path) if self.has_audio_tempo(path) else None
+
+    def match_tempo_audios(self, bpm: float) -> set:
+        """
+        Find audio files whose tempo matches a target tempo within TEMPO_TOLERANCE.
+
+        Tempos are matched at half and double speed as well, e.g. a 160 BPM running track matches 80 BPM cycling.
+        Only analyzed tempos are compared, no audio file is read. Tempos may be analyzed in another thread meanwhile.
+
+        :param bpm: The target tempo in beats per minute. (float)
+        :return: Paths of the matching audio files. (set)
+        """
+
+        low, high = bpm * (1 - TEMPO_TOLERANCE), bpm * (1 + TEMPO_TOLERANCE)
+
+        return {
+            path for path, tempo in list(self.__tempos.items())
+            if tempo and any(low <= tempo * factor <= high for factor in (0.5, 1, 2))
+        }
+
+    def has_audio_loudness(self, path: AnyStr) -> bool:
+        """
+        Check whether the loudness of an audio file was analyzed since it was last changed.
+
+        :param path: The path of the audio file. (AnyStr)
+        :return: True if the loudness was analyzed, False otherwise. (bool)
+        """
+
+        if path in self.__gains:
+            return True
+
+        analysis = self.__loudness_cache.get(path, self.__playlist_index.file_stat(path))
+        if analysis is None:
+            return False
+
+        self.__gains[path] = analysis["gain"]
+        return True
+
+    def set_audio_loudness(self, path: AnyStr, loudness: Union[float, None]) -> None:
+        """
+        Store the analyzed loudness of an audio file and the gain which brings it to TARGET_LOUDNESS,
+        see loudness.integrated_loudness().
+
+        :param path: The path of the audio file. (AnyStr)
+        :param loudness: The integrated loudness in LUFS, or None if the file is silent. (Union[float, None])
+        """
+
+        gain = round(TARGET_LOUDNESS - loudness, 2) if loudness is not None else 0.0
+        self.__loudness_cache.set(path, {"loudness": loudness, "gain": gain},
+                                 self.__playlist_index.file_stat(path))
+        self.__gains[path] = gain
+
+    def get_audio_gain(self, path: AnyStr) -> float:
+        """
+        Get the gain which brings an audio file to TARGET_LOUDNESS.
+
+        :param path: The path of the audio file. (AnyStr)
+        :return: The gain in dB, 0 if the loudness was not analyzed. (float)
+        """
+
+        return self.__gains.get(path, 0.0) if self.has_audio_loudness(path) else 0.0
+
+    def record_playback(self, path: AnyStr, event: str, workout: bool = False) -> None:
+        """
+        Record that an audio file was played or skipped, see playback_stats.PlaybackStats.record().
+
+        :param path: The path of the audio file. (AnyStr)
+        :param event: playback_stats.PLAY_EVENT or playback_stats.SKIP_EVENT. (str)
+        :param workout: Whether the audio file was played during a workout. (bool)
+        """
+
+        self.__playback_stats.record(path, event, workout)
+
+    def get_playback_stats(self, path: AnyStr) -> Dict[str, Union[int, float, None]]:
+        """
+        Get the play count, skip count, workout play count and last played time of an audio file.
+
+        :param path: The path of the audio file. (AnyStr)
+        :return: A dictionary with "plays", "skips", "workout_plays" and "last_played" keys.
+                 (Dict[str, Union[int, float, None]])
+        """
+
+        return self.__playback_stats.track_stats(path)
+
+    def save_playback_stats(self) -> None:
+        """
+        Write playback events recorded since the last save to the playback statistics file.
+        """
+
+        self.__playback_stats.flush()
+
+    def save_audio_metadata(self) -> None:
+        """
+        Write metadata, file hashes, tempos and loudness read since the last save to the metadata cache,
+        the search index, the hash cache, the tempo cache and the loudness cache files.
+        """
+
+        self.__metadata_cache.flush()
+        self.__hash_cache.flush()
+        self.__tempo_cache.flush()
+        self.__loudness_cache.flush()
+        self.__search_index.save(SEARCH_INDEX_FILENAME)
+
+    def save_playlist_index(self) -> None:
+        """
+        Write the playlist index to file if it was changed.
+        """
+
+        self.__playlist_index.save(PLAYLIST_INDEX_FILENAME)
+
+    def get_audio_extensions(self) -> List[str]:
+        """
+        Get extensions of audio files which are added to the playlist.
+
+        :return: A list of audio file extensions, e.g. ["mp3", "flac"]. (List[str])
+        """
+
+        return self.__config.get("audio_extensions", AUDIO_EXTENSIONS)
 
     def load_config(self, filename: AnyStr) -> None:
         """
@@ -91,8 +648,12 @@ class ProgramData:
         with open(filename) as json_config:
             self.__config = json.load(json_config)
 
-        # Reload the playlist after loading the configuration
-        self.__reload_playlist()
+        # Exercise ids are runtime-only and stay stable while exercises are renamed or removed
+        self.__exercise_ids = [next(self.__exercise_id_counter) for _ in self.__config["exercises"]]
+
+        # Load the playlist and search indexes, the playlist itself is scanned on demand, see iter_playlist()
+        self.__playlist_index.load(PLAYLIST_INDEX_FILENAME)
+        self.__search_index.load(SEARCH_INDEX_FILENAME)
 
     def write_config(self, filename: AnyStr, config: Dict = None) -> None:
         """
@@ -126,6 +687,7 @@ class ProgramData:
         """
 
         self.__config["exercises"].pop(at)
+        self.__exercise_ids.pop(at)
         self.write_config(CONFIG_FILENAME)
 
     def exercise_at(self, index: int) -> Dict:
@@ -139,6 +701,34 @@ class ProgramData:
 
         return self.__config["exercises"][index].copy()
 
+    def exercise_id_at(self, index: int) -> int:
+        """
+        Retrieve the id of the exercise at the specified index.
+
+        Exercise ids are assigned when the configuration is loaded and do not change when the exercise is renamed
+        or when other exercises are added or removed.
+
+        :param index: The index of the exercise. (int)
+
+        :return: The id of the exercise. (int)
+        """
+
+        return self.__exercise_ids[index]
+
+    def index_of_exercise_id(self, exercise_id: int) -> Union[int, None]:
+        """
+        Search for an exercise index by the given exercise id.
+
+        :param exercise_id: The id of the exercise to search for. (int)
+
+        :return: An index of the found exercise or None if exercise not found.
+        """
+
+        try:
+            return self.__exercise_ids.index(exercise_id)
+        except ValueError:
+            return
+
     def index_of_exercise(self, name: str) -> Union[int, None]:
         """
         Search for an exercise index by the given name.
@@ -163,25 +753,29 @@ class ProgramData:
 
         return deepcopy(self.__config["exercises"])
 
-    def get_playlist_path(self) -> AnyStr:
+    def get_playlist_paths(self) -> List[str]:
         """
-        Get the path to the playlist source directory.
+        Get the paths to the playlist source directories.
 
-        :return: The path to the playlist source directory. (AnyStr)
+        The "playlist_source" config value is either a single directory or a list of directories.
+
+        :return: The paths to the playlist source directories. (List[str])
         """
 
-        return os.path.expanduser(self.__config["playlist_source"])
+        sources = self.__config["playlist_source"]
+        if isinstance(sources, str):
+            sources = [sources]
 
-    def set_playlist_path(self, path: AnyStr) -> None:
-        """
-        Set the path to the playlist source directory.
+        return [os.path.expanduser(source) for source in sources]
 
-        :param path: The new path to set. (AnyStr)
+    def set_playlist_paths(self, paths: List[AnyStr]) -> None:
         """
+        Set the paths to the playlist source directories.
 
-        self.__config["playlist_source"] = path
+        :param paths: The new paths to set. (List[AnyStr])
+        """
 
-        self.__reload_playlist()
+        self.__config["playlist_source"] = paths[0] if len(paths) == 1 else list(paths)
 
         # Write the updated configuration to file
         self.write_config(CONFIG_FILENAME)
@@ -199,6 +793,7 @@ class ProgramData:
         """
         if all(exercise.values()):
             if self.index_of_exercise(exercise["name"]) is None:
+                self.__exercise_ids.append(next(self.__exercise_id_counter))
                 return self.__config["exercises"].append(exercise)
             else:
                 raise ValueError(f"Task with name \"{exercise['name']}\" already exists!")
@@ -0,0 +1,91 @@
+import os
+from typing import List, AnyStr, Iterable, Set, Tuple
+
+AUDIO_EXTENSIONS = ["mp3", "flac", "ogg", "opus", "m4a", "wav"]
+
+
+def normalize_extensions(extensions: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Convert extensions like "mp3", ".MP3" or "*.mp3" to the form used by the scanner (".mp3").
+
+    :param extensions: Extensions to normalize. (Iterable[str])
+    :return: A tuple of lowercase extensions with a leading dot. (Tuple[str, ...])
+    """
+
+    return tuple("." + extension.lower().lstrip("*.") for extension in extensions if extension.lstrip("*."))
+
+
+def scan_directory(directory: AnyStr, extensions: Tuple[str, ...]) -> Tuple[List[os.DirEntry], List[os.DirEntry]]:
+    """
+    List audio files and subdirectories of a single directory.
+
+    File type checks use the cached DirEntry data instead of an extra stat per file.
+    Broken symlinks and entries removed during the scan are skipped.
+
+    :param directory: The directory to scan. (AnyStr)
+    :param extensions: Normalized audio file extensions, see normalize_extensions(). (Tuple[str, ...])
+    :return: Audio file entries and subdirectory entries. (Tuple[List[os.DirEntry], List[os.DirEntry]])
+    :raises OSError: If the directory cannot be read.
+    """
+
+    audios = []
+    subdirectories = []
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    subdirectories.append(entry)
+                elif entry.name.lower().endswith(extensions) and entry.is_file():
+                    audios.append(entry)
+            except OSError:
+                continue
+
+    return audios, subdirectories
+
+
+def scan_audio_files(path: AnyStr, extensions: Iterable[str] = AUDIO_EXTENSIONS) -> List[str]:
+    """
+    Recursively find audio files in a directory.
+
+    Symbolic links are followed, every directory is entered only once,
+    so symlink cycles and links to already scanned directories are skipped.
+
+    :param path: The directory to scan. (AnyStr)
+    :param extensions: Audio file extensions to look for, case-insensitive. (Iterable[str])
+    :return: A sorted list of paths of the found audio files. (List[str])
+    """
+
+    extensions = normalize_extensions(extensions)
+    audios = []
+
+    try:
+        root_stat = os.stat(path)
+    except OSError:
+        return audios
+
+    visited: Set[Tuple[int, int]] = {(root_stat.st_dev, root_stat.st_ino)}
+    directories = [path]
+
+    while directories:
+        try:
+            files, subdirectories = scan_directory(directories.pop(), extensions)
+        except OSError:
+            # Unreadable directories are skipped
+            continue
+
+        audios.extend(entry.path for entry in files)
+
+        for entry in subdirectories:
+            try:
+                # Directories are stat'ed once to recognize symlink cycles
+                entry_stat = entry.stat()
+            except OSError:
+                continue
+
+            key = (entry_stat.st_dev, entry_stat.st_ino)
+            if key not in visited:
+                visited.add(key)
+                directories.append(entry.path)
+
+    return sorted(audios)
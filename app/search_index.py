@@ -0,0 +1,246 @@
+import json
+import os
+import re
+import threading
+import unicodedata
+from typing import Dict, AnyStr, Iterable, Set, Union
+
+INDEX_HEADER = "OpenFit search index"
+INDEX_VERSION = 1
+
+# Metadata fields which are searched, together with the file name
+SEARCH_FIELDS = ["title", "artist", "album"]
+
+
+def normalize_text(text: str) -> str:
+    """
+    Convert text to the form used by the search index: case-folded words without accents, separated by spaces.
+
+    :param text: The text to normalize. (str)
+    :return: The normalized text. (str)
+    """
+
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+
+    return " ".join(re.findall(r"\w+", text))
+
+
+def trigrams(word: str) -> Set[str]:
+    """
+    Get all three character substrings of a word.
+
+    :param word: A normalized word. (str)
+    :return: A set of trigrams, empty for words shorter than three characters. (Set[str])
+    """
+
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+class SearchIndex:
+    """
+    Full-text index of track metadata.
+
+    Every track is indexed by its title, artist, album and file name. A query matches a track if every query word
+    is a part of a track word. Candidates are looked up by the trigrams of the longest query word, so a query
+    does not scan all tracks, and a query which extends the previous one (e.g. the next keystroke) only narrows
+    down the previous results.
+
+    The normalized texts of the tracks are saved to file, trigram postings are built in memory by build(),
+    e.g. from the thread which scans the playlist, until then the texts of all tracks are searched.
+    The index may be updated from a background thread while it is searched.
+    """
+
+    def __init__(self):
+        self.__documents: Dict[str, str] = {}
+        self.__postings: Union[Dict[str, Set[str]], None] = None
+        self.__last_query: Union[str, None] = None
+        self.__last_results: Set[str] = set()
+        self.__changed = False
+        self.__lock = threading.RLock()
+
+    def load(self, filename: AnyStr) -> bool:
+        """
+        Load the index from a file.
+
+        :param filename: The name of the index file. (AnyStr)
+        :return: True if the index was loaded, False otherwise. (bool)
+        """
+
+        try:
+            with open(filename, encoding="utf-8") as index_file:
+                header, _, body = index_file.read().partition("\n")
+            if header != f"{INDEX_HEADER} {INDEX_VERSION}":
+                return False
+
+            documents = json.loads(body)
+        except (OSError, ValueError):
+            return False
+
+        with self.__lock:
+            self.__documents = documents
+            self.__postings = None
+            self.__last_query = None
+            self.__changed = False
+
+        return True
+
+    def save(self, filename: AnyStr) -> None:
+        """
+        Write the index to a file if it was changed since it was loaded or saved.
+
+        :param filename: The name of the index file. (AnyStr)
+        """
+
+        with self.__lock:
+            if not self.__changed:
+                return
+
+            index = json.dumps(self.__documents, separators=(",", ":"), ensure_ascii=False)
+            self.__changed = False
+
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        # Write to a temporary file first, so an interrupted write does not corrupt the index
+        with open(f"{filename}.tmp", "w", encoding="utf-8") as index_file:
+            index_file.write(f"{INDEX_HEADER} {INDEX_VERSION}\n")
+            index_file.write(index)
+        os.replace(f"{filename}.tmp", filename)
+
+    def build(self) -> None:
+        """
+        Build the trigram postings of the loaded tracks if they are not built yet, tracks indexed later
+        are added to the postings as they are indexed.
+        """
+
+        with self.__lock:
+            if self.__postings is not None:
+                return
+
+            self.__postings = {}
+            for path, text in self.__documents.items():
+                self.__index(path, text)
+
+    def update(self, path: AnyStr, metadata: Dict) -> None:
+        """
+        Index a track, or reindex it if its metadata has changed.
+
+        :param path: The path of the track. (AnyStr)
+        :param metadata: The metadata of the track, see audioinfo.get_audio_metadata(). (Dict)
+        """
+
+        name = os.path.splitext(os.path.basename(path))[0]
+        text = normalize_text(" ".join([*(metadata.get(field) or "" for field in SEARCH_FIELDS), name]))
+
+        with self.__lock:
+            if self.__documents.get(path) == text:
+                return
+
+            self.remove(path)
+            self.__documents[path] = text
+            self.__index(path, text)
+            self.__last_query = None
+            self.__changed = True
+
+    def remove(self, path: AnyStr) -> None:
+        """
+        Remove a track from the index.
+
+        :param path: The path of the track. (AnyStr)
+        """
+
+        with self.__lock:
+            text = self.__documents.pop(path, None)
+            if text is None:
+                return
+
+            if self.__postings is not None:
+                for trigram in set().union(*map(trigrams, text.split())):
+                    self.__postings[trigram].discard(path)
+
+            self.__last_query = None
+            self.__changed = True
+
+    def rename(self, old_path: AnyStr, new_path: AnyStr) -> None:
+        """
+        Move a renamed track to its new path, the file name part of the indexed text is updated.
+
+        :param old_path: The previous path of the track. (AnyStr)
+        :param new_path: The new path of the track. (AnyStr)
+        """
+
+        with self.__lock:
+            text = self.__documents.get(old_path)
+            if text is None:
+                return
+
+            old_name = normalize_text(os.path.splitext(os.path.basename(old_path))[0])
+            new_name = normalize_text(os.path.splitext(os.path.basename(new_path))[0])
+            if old_name and text.endswith(old_name):
+                text = text[:-len(old_name)] + new_name
+
+            self.remove(old_path)
+            self.__documents[new_path] = text.strip()
+            self.__index(new_path, text.strip())
+
+    def retain(self, paths: Iterable[AnyStr]) -> None:
+        """
+        Remove all tracks except the given ones, e.g. after the playlist folder was scanned.
+
+        :param paths: Paths of the tracks to keep. (Iterable[AnyStr])
+        """
+
+        paths = set(paths)
+
+        with self.__lock:
+            for path in [path for path in self.__documents if path not in paths]:
+                self.remove(path)
+
+    def search(self, query: str) -> Union[Set[str], None]:
+        """
+        Find tracks matching the query.
+
+        :param query: Words to search for, in any order. (str)
+        :return: Paths of the matching tracks, or None if the query has no words and every track matches.
+                 (Union[Set[str], None])
+        """
+
+        query = normalize_text(query)
+        if not query:
+            return
+
+        with self.__lock:
+            words = query.split()
+
+            # A longer query matches only tracks the shorter one has matched
+            if self.__last_query is not None and query.startswith(self.__last_query):
+                candidates = self.__last_results
+            else:
+                candidates = self.__lookup(max(words, key=len))
+
+            results = {path for path in candidates if self.__matches(self.__documents[path], words)}
+
+            self.__last_query = query
+            self.__last_results = results
+
+            return set(results)
+
+    def __index(self, path: str, text: str) -> None:
+        if self.__postings is None:
+            return
+
+        for trigram in set().union(*map(trigrams, text.split())):
+            self.__postings.setdefault(trigram, set()).add(path)
+
+    def __lookup(self, word: str) -> Iterable[str]:
+        # Tracks which contain all trigrams of the word, every track for words shorter than three characters
+        # or before the postings are built
+        if len(word) < 3 or self.__postings is None:
+            return self.__documents.keys()
+
+        postings = sorted((self.__postings.get(trigram, set()) for trigram in trigrams(word)), key=len)
+        return set.intersection(*postings)
+
+    @staticmethod
+    def __matches(text: str, words: Iterable[str]) -> bool:
+        return all(word in text for word in words)
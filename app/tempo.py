@@ -0,0 +1,108 @@
+from typing import Union
+
+import numpy as np
+
+# Tempo is estimated from mono audio at a low sample rate, only from the first minutes of a track
+TEMPO_SAMPLE_RATE = 11025
+TEMPO_SECONDS = 90
+FRAME_SIZE = 1024
+HOP_SIZE = 256
+
+# Number of frames transformed at once, which bounds the memory used for the spectra
+FRAMES_PER_CHUNK = 512
+
+# Tempo range of the estimates and the tempo the estimates are biased to, in beats per minute
+MIN_BPM = 60
+MAX_BPM = 200
+PREFERRED_BPM = 120
+
+
+def onset_envelope(samples: np.ndarray) -> np.ndarray:
+    """
+    Compute the onset strength of audio frames as the spectral flux of their log-magnitude spectra.
+
+    :param samples: Mono samples at TEMPO_SAMPLE_RATE. (np.ndarray)
+    :return: The onset strength of every frame after the first one, FRAME_SIZE samples every HOP_SIZE samples.
+             (np.ndarray)
+    """
+
+    if len(samples) < FRAME_SIZE + HOP_SIZE:
+        return np.zeros(0)
+
+    frames = np.lib.stride_tricks.sliding_window_view(samples, FRAME_SIZE)[::HOP_SIZE]
+    window = np.hanning(FRAME_SIZE)
+
+    # Only rising energy marks an onset. Chunks of frames overlap by a frame, so the flux between them is kept
+    flux = []
+    for first in range(1, len(frames), FRAMES_PER_CHUNK):
+        chunk = frames[first - 1:first + FRAMES_PER_CHUNK]
+        spectra = np.log1p(100 * np.abs(np.fft.rfft(chunk * window, axis=1)))
+        flux.append(np.maximum(np.diff(spectra, axis=0), 0).sum(axis=1))
+    flux = np.concatenate(flux)
+
+    # The local average is removed, so steady loud parts do not count
+    envelope = np.maximum(flux - np.convolve(flux, np.ones(16) / 16, mode="same"), 0)
+
+    # Onsets are spread over neighbouring frames, so beats between two frames still line up in the autocorrelation
+    return np.convolve(envelope, np.array([1, 2, 3, 2, 1]) / 9, mode="same")
+
+
+def estimate_tempo(envelope: np.ndarray, frame_rate: float) -> Union[float, None]:
+    """
+    Estimate the tempo of an onset envelope from its autocorrelation.
+
+    Periods of the envelope are weighted towards PREFERRED_BPM, so a track is not reported at half or double
+    its tempo unless that is clearly stronger.
+
+    :param envelope: The onset envelope, see onset_envelope(). (np.ndarray)
+    :param frame_rate: The number of envelope frames per second. (float)
+    :return: The tempo in beats per minute, or None if the envelope is too short or flat. (Union[float, None])
+    """
+
+    min_lag = int(60 * frame_rate / MAX_BPM)
+    max_lag = int(np.ceil(60 * frame_rate / MIN_BPM))
+
+    if len(envelope) < 2 * max_lag or not envelope.any():
+        return
+
+    # Autocorrelation through the power spectrum, zero padded so it is not circular
+    envelope = envelope - envelope.mean()
+    spectrum = np.fft.rfft(envelope, 2 * len(envelope))
+    autocorrelation = np.fft.irfft(np.abs(spectrum) ** 2)[:max_lag + 2]
+
+    lags = np.arange(min_lag, max_lag + 1)
+    weights = np.exp(-0.5 * np.log2(60 * frame_rate / lags / PREFERRED_BPM) ** 2)
+    scores = autocorrelation[lags] * weights
+
+    best = int(np.argmax(scores))
+    if scores[best] <= 0:
+        return
+
+    # Refine the lag between the frames with a parabola through the neighbouring scores
+    lag = float(lags[best])
+    if 0 < best < len(scores) - 1:
+        previous, current, following = scores[best - 1:best + 2]
+        curvature = previous - 2 * current + following
+        if curvature < 0:
+            lag += 0.5 * (previous - following) / curvature
+
+    return round(60 * frame_rate / lag, 1)
+
+
+def track_tempo(samples: np.ndarray, sample_rate: int) -> Union[float, None]:
+    """
+    Estimate the tempo of a track from the beginning of its decoded audio.
+
+    :param samples: Samples with a column per channel, see audio_analysis.decode_audio_chunks(). (np.ndarray)
+    :param sample_rate: The sample rate of the samples, a multiple of TEMPO_SAMPLE_RATE. (int)
+    :return: The tempo in beats per minute, or None if it cannot be estimated. (Union[float, None])
+    """
+
+    mono = samples[:TEMPO_SECONDS * sample_rate].mean(axis=1)
+
+    # Adjacent samples are averaged down to the analysis sample rate, the onsets are kept
+    factor = sample_rate // TEMPO_SAMPLE_RATE
+    if factor > 1:
+        mono = mono[:len(mono) - len(mono) % factor].reshape(-1, factor).mean(axis=1)
+
+    return estimate_tempo(onset_envelope(mono), TEMPO_SAMPLE_RATE / HOP_SIZE)
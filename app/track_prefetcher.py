@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import AnyStr, Dict, Union
+
+from PyQt5.QtCore import QObject
+
+from program_data import ProgramData
+
+# Amount of a track read ahead of playback, enough for the player to start it without waiting for the disk
+PREFETCH_SIZE = 8 * 1024 * 1024
+PREFETCH_BLOCK_SIZE = 1024 * 1024
+
+
+def warm_file(path: AnyStr, size: int = PREFETCH_SIZE) -> bool:
+    """
+    Read the beginning of a file into the page cache, so opening and reading it later does not wait for the disk
+    or the network mount it is on.
+
+    :param path: The path of the file. (AnyStr)
+    :param size: The number of bytes to read. (int)
+    :return: True if the file could be read, False otherwise. (bool)
+    """
+
+    try:
+        with open(path, "rb", buffering=0) as file:
+            remaining = size
+            while remaining > 0:
+                block = file.read(min(PREFETCH_BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+    except OSError:
+        return False
+
+    return True
+
+
+class TrackPrefetcher(QObject):
+    """
+    Background preparation of the track which plays next.
+
+    While a track plays, the next one is read into the page cache and its metadata and gain are resolved
+    on a worker thread, so switching to it neither waits for the disk nor stats and parses the file
+    on the GUI thread.
+    Only the latest requested track is prepared, a request which has not started yet is dropped by the next one.
+    """
+
+    def __init__(self, program_data: ProgramData, parent=None):
+        super().__init__(parent)
+
+        self.__program_data = program_data
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TrackPrefetcher")
+        self.__path: Union[str, None] = None
+        self.__future: Union[Future, None] = None
+
+    def prefetch(self, path: AnyStr) -> None:
+        """
+        Prepare a track in background, replacing the previously requested one.
+
+        :param path: The path of the track. (AnyStr)
+        """
+
+        if path == self.__path:
+            return
+
+        if self.__future:
+            self.__future.cancel()
+
+        self.__path = path
+        self.__future = self.__executor.submit(self.__prepare, path)
+
+    def metadata(self, path: AnyStr) -> Union[Dict, None]:
+        """
+        Get the metadata of a prepared track without waiting.
+
+        :param path: The path of the track. (AnyStr)
+        :return: The metadata of the track, see ProgramData.get_audio_metadata(), or None if the track
+                 was not prepared, is not prepared yet, or could not be read. (Union[Dict, None])
+        """
+
+        if path != self.__path or not self.__future.done() or self.__future.cancelled() or self.__future.exception():
+            return
+
+        return self.__future.result()
+
+    def shutdown(self) -> None:
+        """
+        Drop the pending request and stop the worker thread once the running one is complete.
+        """
+
+        self.__path = None
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __prepare(self, path: str) -> Union[Dict, None]:
+        # Metadata is read after the file was warmed up, so it is read from the page cache
+        if not warm_file(path):
+            return
+
+        self.__program_data.get_audio_gain(path)
+        return self.__program_data.get_audio_metadata(path)
@@ -0,0 +1,83 @@
+"""
+Assistant latency benchmark for OpenFit.
+
+Asks the assistant the same question several times through the main window and measures the time to the first
+visible part of the answer, the latency users notice, and the time to the complete answer. The assistant model
+and the API token are taken from the configuration, every run sends a request to the API.
+
+Usage: python benchmarks/assistant.py [--repeat N] [--question TEXT] [--config PATH]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from PyQt5.QtCore import QEventLoop
+from PyQt5.QtWidgets import QApplication
+
+from main import WorkItOut
+from program_data import ProgramData, CONFIG_FILENAME
+
+
+def measure(window: WorkItOut, question: str) -> tuple:
+    """
+    Ask the assistant once and wait for the complete answer.
+
+    :param window: The main window with the ASSISTANT tab built.
+    :param question: The question to ask.
+    :return: The time to the first visible part of the answer and the time to the complete answer in seconds.
+    """
+
+    loop = QEventLoop()
+    window.assistant.finished.connect(loop.quit)
+
+    window.ui.userQuestionEdit.setText(question)
+    window.askAssistantButtonClicked()
+    loop.exec_()
+
+    window.assistant.finished.disconnect(loop.quit)
+
+    # The rest of the answer is shown once the queued signals of the worker are handled
+    QApplication.processEvents()
+
+    return window.assistant_first_token_latency, time.perf_counter() - window.assistant_asked_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measured questions")
+    parser.add_argument("--question", default="How many push ups should a beginner do?", help="Question to ask")
+    parser.add_argument("--config", default=CONFIG_FILENAME, help="Configuration file to load")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    program_data = ProgramData()
+    program_data.load_config(args.config)
+
+    window = WorkItOut(program_data)
+    window.tabActivated(window.ui.tabWidget.indexOf(window.ui.tab_5))
+
+    first_parts = []
+    answers = []
+    for _ in range(args.repeat):
+        first_part, answer = measure(window, args.question)
+        if first_part is None:
+            sys.exit("The assistant did not answer")
+
+        first_parts.append(first_part)
+        answers.append(answer)
+
+    for name, timings in (("first part", first_parts), ("answer", answers)):
+        timings.sort()
+        print(f"{name:>10}: median {timings[len(timings) // 2] * 1000:.0f} ms, best {timings[0] * 1000:.0f} ms")
+
+    window.close()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Metadata reading benchmark for OpenFit.
+
+Reads metadata of every MP3 file in a folder with the header-only reader and with mutagen, checks that both give
+the same title, artist, album and duration, and compares their throughput. Files the header-only reader leaves
+to mutagen are counted as fallbacks.
+
+The page cache is not dropped between runs, so run it on a freshly mounted or large folder to measure cold reads.
+
+Usage: python benchmarks/metadata.py FOLDER [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from audioinfo import get_audio_metadata
+from mp3header import read_mp3_metadata
+from scanner import scan_audio_files
+
+
+def measure(paths: list, header_only: bool) -> float:
+    """
+    Read metadata of all files once.
+
+    :param paths: Paths of the audio files.
+    :param header_only: Whether to use the header-only reader.
+    :return: Elapsed time in seconds.
+    """
+
+    start = time.perf_counter()
+    for path in paths:
+        get_audio_metadata(path, header_only=header_only)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("folder", help="Folder with MP3 files")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measured runs per reader")
+    args = parser.parse_args()
+
+    paths = scan_audio_files(args.folder, ["mp3"])
+    if not paths:
+        sys.exit(f"No MP3 files found in {args.folder}")
+
+    fallbacks = 0
+    mismatches = 0
+
+    for path in paths:
+        metadata = read_mp3_metadata(path)
+        if metadata is None:
+            fallbacks += 1
+            continue
+
+        expected = get_audio_metadata(path, header_only=False)
+        if (not expected or
+                any(metadata[key] != expected[key] for key in ("title", "artist", "album")) or
+                abs(metadata["duration_seconds"] - expected["duration_seconds"]) > 1e-6):
+            mismatches += 1
+            print(f"mismatch: {path}\n  header-only: {metadata}\n      mutagen: {expected}")
+
+    print(f"{len(paths)} files, {fallbacks} read with mutagen, {mismatches} mismatches")
+
+    results = {}
+    for reader, header_only in (("mutagen", False), ("header-only", True)):
+        timings = sorted(measure(paths, header_only) for _ in range(args.repeat))
+        results[reader] = timings[len(timings) // 2]
+        print(f"{reader:>11}: median {results[reader] * 1000:.1f} ms, "
+              f"{len(paths) / results[reader]:.0f} files/s")
+
+    print(f"speedup: {results['mutagen'] / results['header-only']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
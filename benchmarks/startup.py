@@ -0,0 +1,76 @@
+"""
+Startup benchmark for the OpenFit main window.
+
+Measures the time needed to construct and show the main window when only the landing tab is built,
+and compares it with the time needed when every tab is built and loaded up front.
+
+Usage: python benchmarks/startup.py [--repeat N] [--config PATH]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from PyQt5.QtWidgets import QApplication
+
+from main import WorkItOut
+from program_data import ProgramData, CONFIG_FILENAME
+
+
+def measure(program_data: ProgramData, build_all_tabs: bool) -> float:
+    """
+    Construct and show the main window once.
+
+    :param program_data: Loaded program data to create the window with.
+    :param build_all_tabs: Whether to build and load every tab right after the window is created.
+    :return: Elapsed time in seconds.
+    """
+
+    start = time.perf_counter()
+
+    window = WorkItOut(program_data)
+    if build_all_tabs:
+        for index in range(window.ui.tabWidget.count()):
+            window.tabActivated(index)
+    window.show()
+    QApplication.processEvents()
+
+    elapsed = time.perf_counter() - start
+
+    window.close()
+    window.deleteLater()
+    QApplication.processEvents()
+
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Number of measured runs per mode")
+    parser.add_argument("--config", default=CONFIG_FILENAME, help="Configuration file to load")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    program_data = ProgramData()
+    program_data.load_config(args.config)
+
+    # Warm up imports, resources and the style before measuring
+    measure(program_data, build_all_tabs=True)
+
+    results = {}
+    for mode, build_all_tabs in (("lazy", False), ("eager", True)):
+        timings = sorted(measure(program_data, build_all_tabs) for _ in range(args.repeat))
+        results[mode] = timings[len(timings) // 2]
+        print(f"{mode:>5}: median {results[mode] * 1000:.1f} ms, best {timings[0] * 1000:.1f} ms")
+
+    print(f"speedup: {results['eager'] / results['lazy']:.2f}x")
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()